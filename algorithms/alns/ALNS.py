@@ -1,8 +1,10 @@
-from typing import Dict, Tuple
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Dict, List, Optional, Tuple
+import copy
 
 import numpy as np
 
-from algorithms.alns.enum.alns_enum import OperatorType
+from algorithms.alns.enum.alns_enum import OperatorType, Outcome
 from algorithms.solution_state import SolutionState, Index
 from algorithms.alns.acept_criterion.accept_strategy import AcceptStrategy
 from algorithms.alns.stop.stop_condition import StopCondition
@@ -14,6 +16,15 @@ from algorithms.alns.statistics import Statistics
 from algorithms.alns.reset import Resettable
 
 from algorithms.alns.operators.repair_operators.random_repair import RandomRepair
+from algorithms.heuristics.domination import set_solution
+from algorithms.utils.bitset import BitSet
+
+# receives the packed nodes of the best solution and returns those of another one, or None
+Exchange = Callable[[BitSet], Optional[BitSet]]
+# improves a new best solution in place, called as an Event.ON_BEST listener
+Intensification = Callable[[SolutionState, str], None]
+# operator name of the Event.ON_BEST triggered when a migrant becomes the best solution
+MIGRATION = "migration"
 
 
 class ALNS(Resettable):
@@ -23,17 +34,27 @@ class ALNS(Resettable):
         stop: StopCondition,
         accept: AcceptStrategy,
         select: SelectStrategy,
-        events: EventHandler = EventHandler(),
+        events: Optional[EventHandler] = None,
         rng: np.random.Generator = np.random.default_rng(),
         track_stats: bool = False,
+        batch_size: int = 1,
+        workers: Optional[int] = None,
     ):
+        if batch_size < 1:
+            raise ValueError("Batch size must be at least 1")
+        if workers is not None and workers < 1:
+            raise ValueError("Workers must be at least 1")
+
         self._rng = rng
         self._stop = stop
         self._accept = accept
         self._select = select
-        self._events = events
+        # a handler per instance, listeners must not leak between runs
+        self._events = events if events is not None else EventHandler()
         self._stats = None
         self._track_stats = track_stats
+        self._batch_size = batch_size
+        self._workers = workers
 
         self._destroy_operators: Dict[str, OperatorStrategy] = {}
         self._repair_operators: Dict[str, OperatorStrategy] = {}
@@ -46,6 +67,10 @@ class ALNS(Resettable):
         self._destroy_op_list: Tuple[OperatorStrategy]
         self._repair_op_list: Tuple[OperatorStrategy]
 
+        self._migration_interval = 0
+        self._exchange: Exchange = None
+        self._intensification: Intensification = None
+
     @property
     def events(self) -> EventHandler:
         return self._events
@@ -70,6 +95,14 @@ class ALNS(Resettable):
     def rng(self) -> np.random.Generator:
         return self._rng
 
+    @property
+    def batch_size(self) -> int:
+        return self._batch_size
+
+    @property
+    def workers(self) -> Optional[int]:
+        return self._workers
+
     @property
     def operators(self) -> Dict[OperatorType, Dict[str, OperatorStrategy]]:
         return self._operators
@@ -91,6 +124,47 @@ class ALNS(Resettable):
     def __add_operator(self, type: OperatorType, operator: OperatorStrategy):
         self._operators[type][operator.name] = operator
 
+    def set_migration(self, interval: int, exchange: Exchange) -> None:
+        """
+        Every interval iterations the nodes of the best solution are handed to exchange as a
+        BitSet,
+        a returned solution smaller than the best becomes the best and current solution,
+        reported on Event.ON_BEST with the operator name "migration"
+        """
+        if interval <= 0:
+            raise ValueError("Migration interval must be positive")
+        self._migration_interval = interval
+        self._exchange = exchange
+
+    def _migrate(
+        self, best_S: SolutionState, curr_S: SolutionState, work_S: SolutionState
+    ) -> Tuple[SolutionState, SolutionState, SolutionState]:
+        migrant = self._exchange(best_S.S.to_bitset())
+        if migrant is None or len(migrant) >= len(best_S.S):
+            return best_S, curr_S, work_S
+
+        migrant_S = set_solution(work_S, migrant.to_array())
+        # as after setup, DEGREE is rebuilt by the operators that use it
+        if Index.DEGREE in migrant_S.info_indexes:
+            migrant_S.G_info.column(Index.DEGREE).fill(0)
+
+        self._events.trigger(Event.ON_BEST, migrant_S, MIGRATION)
+        return migrant_S.copy(), migrant_S, curr_S
+
+    def set_intensification(self, intensification: Intensification) -> None:
+        """
+        intensification is registered on Event.ON_BEST at setup, ahead of the statistics, and
+        improves the new best solution in place. The best copy is refreshed from it afterwards
+        """
+        self._intensification = intensification
+
+    def _intensify(
+        self, best_S: SolutionState, new_S: SolutionState, outcome: Outcome
+    ) -> SolutionState:
+        if self._intensification is None or outcome != Outcome.BEST:
+            return best_S
+        return best_S.copy_from(new_S)
+
     def _init_operators_list(self):
         self._destroy_op_list = tuple(self._destroy_operators.items())
         self._repair_op_list = tuple(self._repair_operators.items())
@@ -104,13 +178,15 @@ class ALNS(Resettable):
 
         initial_S.init_G_info()
 
+        if self._intensification is not None:
+            self._events.register(Event.ON_BEST, self._intensification)
+
         initial_repair_operator = RandomRepair(self._rng)
         initial_repair_operator.operate(initial_S)
 
         # quick bug fix
         if Index.DEGREE in initial_S.info_indexes:
-            for node in initial_S.G.nodes():
-                initial_S.G_info[node][Index.DEGREE] = 0
+            initial_S.G_info.column(Index.DEGREE).fill(0)
 
         if self._track_stats:
             self._stats = Statistics(self)
@@ -124,8 +200,13 @@ class ALNS(Resettable):
         self.validate()
         self.setup(initial_S)
 
+        if self._batch_size > 1:
+            return self._execute_batched(initial_S)
+
         curr_S = initial_S.copy()
         best_S = initial_S.copy()
+        # destroyed and repaired on every iteration, recycled instead of copying curr_S
+        work_S = initial_S.copy()
 
         while not self._stop.stop():
             destroy_idx, repair_idx = self._select.select()
@@ -137,14 +218,18 @@ class ALNS(Resettable):
                 Event.ON_SELECT, (d_name, d_operator), (r_name, r_operator)
             )
 
-            destroyed_S = d_operator.operate(curr_S.copy())
+            destroyed_S = d_operator.operate(work_S.copy_from(curr_S))
             new_S = r_operator.operate(destroyed_S)
 
+            prev_S = curr_S
             best_S, curr_S, outcome = self._accept.evaluate_solution(
                 best_S, curr_S, new_S
             )
+            # the state left out of the current solution is reused on the next iteration
+            work_S = prev_S if curr_S is new_S else new_S
 
             self._events.on_outcome(outcome, new_S, r_name)
+            best_S = self._intensify(best_S, new_S, outcome)
 
             self._select.update(destroy_idx, repair_idx, outcome)
             self._events.trigger(
@@ -152,9 +237,97 @@ class ALNS(Resettable):
             )
             self._accept.update_values()
 
+            if self._exchange and self._stop.iteration % self._migration_interval == 0:
+                best_S, curr_S, work_S = self._migrate(best_S, curr_S, work_S)
+
         self._events.trigger(Event.ON_END)
         return best_S
 
+    def _execute_batched(self, initial_S: SolutionState) -> SolutionState:
+        """
+        Every iteration draws batch_size operator pairs and builds their neighbors from curr_S
+        in a thread pool, each slot with its own copies of the operators and its own rng spawned
+        from the ALNS rng, so the result does not depend on the thread timing.
+        Only the smallest neighbor goes through the acceptance criterion, every pair is scored
+        on the select strategy, the others as classified by AcceptStrategy.classify_solution.
+        An iteration of the stop condition is a whole batch
+        """
+        slots = [self._slot_operators(rng) for rng in self._rng.spawn(self._batch_size)]
+
+        curr_S = initial_S.copy()
+        best_S = initial_S.copy()
+        work_states = [initial_S.copy() for _ in range(self._batch_size)]
+
+        with ThreadPoolExecutor(max_workers=self._workers or self._batch_size) as executor:
+            while not self._stop.stop():
+                pairs = [self._select.select() for _ in range(self._batch_size)]
+                for destroy_idx, repair_idx in pairs:
+                    self._events.trigger(
+                        Event.ON_SELECT,
+                        self._destroy_op_list[destroy_idx],
+                        self._repair_op_list[repair_idx],
+                    )
+
+                neighbors: List[SolutionState] = list(
+                    executor.map(
+                        self._build_neighbor, slots, work_states, [curr_S] * len(pairs), pairs
+                    )
+                )
+                chosen = min(range(len(neighbors)), key=lambda b: len(neighbors[b].S))
+                outcomes = [
+                    self._accept.classify_solution(best_S, curr_S, new_S)
+                    for new_S in neighbors
+                ]
+
+                new_S = neighbors[chosen]
+                prev_S = curr_S
+                best_S, curr_S, outcomes[chosen] = self._accept.evaluate_solution(
+                    best_S, curr_S, new_S
+                )
+                # the state left out of the current solution goes back to the chosen slot
+                work_states[chosen] = prev_S if curr_S is new_S else new_S
+
+                r_name = self._repair_op_list[pairs[chosen][1]][0]
+                self._events.on_outcome(outcomes[chosen], new_S, r_name)
+                best_S = self._intensify(best_S, new_S, outcomes[chosen])
+
+                for (destroy_idx, repair_idx), outcome in zip(pairs, outcomes):
+                    self._select.update(destroy_idx, repair_idx, outcome)
+                    self._events.trigger(
+                        Event.ON_SELECT_UPDATE, destroy_idx, repair_idx, outcome
+                    )
+                self._accept.update_values()
+
+                if self._exchange and self._stop.iteration % self._migration_interval == 0:
+                    best_S, curr_S, work_states[chosen] = self._migrate(
+                        best_S, curr_S, work_states[chosen]
+                    )
+
+        self._events.trigger(Event.ON_END)
+        return best_S
+
+    def _slot_operators(
+        self, rng: np.random.Generator
+    ) -> Tuple[List[OperatorStrategy], List[OperatorStrategy]]:
+        slot = ([], [])
+        for operators, op_list in zip(slot, (self._destroy_op_list, self._repair_op_list)):
+            for _, operator in op_list:
+                operator = copy.copy(operator)
+                operator.reset(rng)
+                operators.append(operator)
+        return slot
+
+    @staticmethod
+    def _build_neighbor(
+        slot: Tuple[List[OperatorStrategy], List[OperatorStrategy]],
+        work_S: SolutionState,
+        curr_S: SolutionState,
+        pair: Tuple[int, int],
+    ) -> SolutionState:
+        destroy_operators, repair_operators = slot
+        destroyed_S = destroy_operators[pair[0]].operate(work_S.copy_from(curr_S))
+        return repair_operators[pair[1]].operate(destroyed_S)
+
     def restart_components(self):
         """
         Resets all the components of ALNS once all the operators weights' hit 0
@@ -171,6 +344,8 @@ class ALNS(Resettable):
         self.select.reset(rng)
         self.accept.reset(rng)
         self.events.unregister_all()
+        if isinstance(self._intensification, Resettable):
+            self._intensification.reset(rng)
         self._stats = None  # making sure cyclical reference doesnt hold on to memory
 
         for operator in self.operators[OperatorType.DESTROY].values():
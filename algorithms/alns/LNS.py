@@ -90,8 +90,7 @@ class LNS:
         initial_repair_operator.operate(initial_S)
         # quick bug fix
         if Index.DEGREE in initial_S.info_indexes:
-            for node in initial_S.G.nodes():
-                initial_S.G_info[node][Index.DEGREE] = 0
+            initial_S.G_info.column(Index.DEGREE).fill(0)
 
         if self._track_stats:
             self._stats = Statistics(self)
@@ -107,17 +106,22 @@ class LNS:
 
         curr_S = initial_S.copy()
         best_S = initial_S.copy()
+        # destroyed and repaired on every iteration, recycled instead of copying curr_S
+        work_S = initial_S.copy()
 
         while not self._stop.stop():
             d_operator = self._destroy_operator
             r_operator = self._repair_operator
 
-            destroyed_S = d_operator.operate(curr_S.copy())
+            destroyed_S = d_operator.operate(work_S.copy_from(curr_S))
             new_S = r_operator.operate(destroyed_S)
 
+            prev_S = curr_S
             best_S, curr_S, outcome = self._accept.evaluate_solution(
                 best_S, curr_S, new_S
             )
+            # the state left out of the current solution is reused on the next iteration
+            work_S = prev_S if curr_S is new_S else new_S
             self._events.on_outcome(outcome, new_S, self.repair_operator.name)
 
         self._events.trigger(Event.ON_END)
@@ -18,21 +18,45 @@ class AcceptStrategy(Resettable):
         self, best_S: SolutionState, curr_S: SolutionState, new_S: SolutionState
     ) -> Tuple[SolutionState, SolutionState, Outcome]:
         """
-        Returns a Tuple with the Best Solution, Current Solution, Outcome
+        Returns a Tuple with the Best Solution, Current Solution, Outcome.
+        The decision only reads the objective and feasibility kept by the states, nothing is
+        copied before it. An accepted new_S becomes the current solution as is, so it must
+        not be modified afterwards, only a new best is copied
         """
-        if len(new_S.S) < len(best_S.S):  # If new_S is the best found so far
-            return (new_S.copy(), new_S.copy(), Outcome.BEST)
+        if not new_S.is_feasible():  # A repair that left nodes non dominated
+            return (best_S, curr_S, Outcome.REJECTED)
 
-        if len(new_S.S) < len(curr_S.S):  # If new_S is better than curr_S
-            return (best_S, new_S.copy(), Outcome.BETTER)
+        if new_S.objective < best_S.objective:  # If new_S is the best found so far
+            return (new_S.copy(), new_S, Outcome.BEST)
+
+        if new_S.objective < curr_S.objective:  # If new_S is better than curr_S
+            return (best_S, new_S, Outcome.BETTER)
 
         if self._accept(
-            len(curr_S.S), len(new_S.S)
+            curr_S.objective, new_S.objective
         ):  # If accepted by Metropolis or other criterion
-            return (best_S, new_S.copy(), Outcome.ACCEPTED)
+            return (best_S, new_S, Outcome.ACCEPTED)
 
         return (best_S, curr_S, Outcome.REJECTED)
 
+    def classify_solution(
+        self, best_S: SolutionState, curr_S: SolutionState, new_S: SolutionState
+    ) -> Outcome:
+        """
+        Outcome of a neighbor that is not evaluated, without the acceptance draw:
+        a worse or equal solution counts as rejected
+        """
+        if not new_S.is_feasible():
+            return Outcome.REJECTED
+
+        if new_S.objective < best_S.objective:
+            return Outcome.BEST
+
+        if new_S.objective < curr_S.objective:
+            return Outcome.BETTER
+
+        return Outcome.REJECTED
+
     @abstractmethod
     def reset(self, rng=None):
         """Resets the acceptance strategy (abstract)"""
@@ -0,0 +1,54 @@
+from algorithms.alns.acept_criterion.accept_strategy import AcceptStrategy
+from algorithms.alns.enum.alns_enum import Outcome
+from algorithms.solution_state import SolutionState
+from typing import Tuple
+
+
+class GreatDeluge(AcceptStrategy):
+    """
+    Great deluge: a solution is accepted when its objective is under the water level.
+    The level starts tolerance above the first current objective and drops by rain_speed
+    every iteration, down to the best objective found so far at most
+    """
+
+    def __init__(self, tolerance: float = 0.05, rain_speed: float = 0.1):
+        if tolerance < 0 or rain_speed < 0:
+            raise ValueError("Tolerance and rain speed must not be negative")
+
+        self._tolerance = tolerance
+        self._rain_speed = rain_speed
+        self._level = None
+        self._floor = None
+
+    @property
+    def tolerance(self):
+        return self._tolerance
+
+    @property
+    def rain_speed(self):
+        return self._rain_speed
+
+    @property
+    def level(self):
+        return self._level
+
+    def evaluate_solution(
+        self, best_S: SolutionState, curr_S: SolutionState, new_S: SolutionState
+    ) -> Tuple[SolutionState, SolutionState, Outcome]:
+        if self._level is None:
+            self._level = curr_S.objective * (1 + self._tolerance)
+
+        best_S, curr_S, outcome = super().evaluate_solution(best_S, curr_S, new_S)
+        self._floor = best_S.objective
+        return (best_S, curr_S, outcome)
+
+    def _accept(self, curr_S_value: int, new_S_value: int) -> bool:
+        return new_S_value <= self._level
+
+    def update_values(self) -> None:
+        if self._level is not None:
+            self._level = max(self._level - self._rain_speed, self._floor)
+
+    def reset(self, rng=None):
+        self._level = None
+        self._floor = None
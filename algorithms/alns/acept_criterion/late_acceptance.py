@@ -0,0 +1,50 @@
+from algorithms.alns.acept_criterion.accept_strategy import AcceptStrategy
+from algorithms.alns.enum.alns_enum import Outcome
+from algorithms.solution_state import SolutionState
+from typing import Tuple
+
+
+class LateAcceptance(AcceptStrategy):
+    """
+    Late acceptance hill climbing: a solution is accepted when it is no worse than the current
+    one or than the current solution history_length iterations ago. The current objectives are
+    kept in a ring buffer, filled with the first current objective
+    """
+
+    def __init__(self, history_length: int = 10):
+        if history_length < 1:
+            raise ValueError("History length must be at least 1")
+
+        self._history_length = history_length
+        self._history = [0] * history_length
+        self._cursor = 0
+        self._started = False
+
+    @property
+    def history_length(self):
+        return self._history_length
+
+    @property
+    def history(self):
+        return self._history
+
+    def evaluate_solution(
+        self, best_S: SolutionState, curr_S: SolutionState, new_S: SolutionState
+    ) -> Tuple[SolutionState, SolutionState, Outcome]:
+        if not self._started:
+            self._history = [curr_S.objective] * self._history_length
+            self._started = True
+
+        best_S, curr_S, outcome = super().evaluate_solution(best_S, curr_S, new_S)
+
+        self._history[self._cursor] = curr_S.objective
+        self._cursor = (self._cursor + 1) % self._history_length
+        return (best_S, curr_S, outcome)
+
+    def _accept(self, curr_S_value: int, new_S_value: int) -> bool:
+        return new_S_value <= curr_S_value or new_S_value <= self._history[self._cursor]
+
+    def reset(self, rng=None):
+        self._history = [0] * self._history_length
+        self._cursor = 0
+        self._started = False
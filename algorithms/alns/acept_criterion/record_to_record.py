@@ -0,0 +1,38 @@
+from algorithms.alns.acept_criterion.accept_strategy import AcceptStrategy
+from algorithms.alns.enum.alns_enum import Outcome
+from algorithms.solution_state import SolutionState
+from typing import Tuple
+
+
+class RecordToRecordTravel(AcceptStrategy):
+    """
+    Record-to-record travel: a solution is accepted when it is within a deviation of the record,
+    the best objective found so far, new <= best * (1 + deviation)
+    """
+
+    def __init__(self, deviation: float = 0.01):
+        if deviation < 0:
+            raise ValueError("Deviation must not be negative")
+
+        self._deviation = deviation
+        self._record = None
+
+    @property
+    def deviation(self):
+        return self._deviation
+
+    @property
+    def record(self):
+        return self._record
+
+    def evaluate_solution(
+        self, best_S: SolutionState, curr_S: SolutionState, new_S: SolutionState
+    ) -> Tuple[SolutionState, SolutionState, Outcome]:
+        self._record = best_S.objective
+        return super().evaluate_solution(best_S, curr_S, new_S)
+
+    def _accept(self, curr_S_value: int, new_S_value: int) -> bool:
+        return new_S_value <= self._record * (1 + self._deviation)
+
+    def reset(self, rng=None):
+        self._record = None
@@ -1,9 +1,22 @@
 from algorithms.alns.acept_criterion.accept_strategy import AcceptStrategy
+from algorithms.alns.stop.stop_condition import StopCondition, Interrupt
 from numpy.random import Generator
+from typing import Optional
 import numpy as np
+import math
+import time
 
 
 class SimulatedAnnealing(AcceptStrategy):
+    """
+    Metropolis acceptance with a geometric cooling schedule.
+    With warmup > 0 the schedule calibrates itself: the first warmup iterations run at the
+    initial temperature while the worsening deltas are observed, then the temperatures are set
+    so that the mean delta is accepted with target_acceptance at the start and the smallest one
+    with final_acceptance at the end, and the cooling rate so that the end is reached with the
+    budget of stop (iterations, or the time limit at the pace of the warm-up). Without a budget
+    to read the configured cooling rate is kept
+    """
 
     def __init__(
         self,
@@ -11,6 +24,10 @@ class SimulatedAnnealing(AcceptStrategy):
         final_temperature,
         cooling_rate,
         rng: Generator = np.random.default_rng(),
+        warmup: int = 0,
+        target_acceptance: float = 0.1,
+        final_acceptance: float = 0.001,
+        stop: Optional[StopCondition] = None,
     ):
         if any(t < 0 for t in [initial_temperature, final_temperature, cooling_rate]):
             raise ValueError("Temperaturas abaixo de 0")
@@ -21,11 +38,19 @@ class SimulatedAnnealing(AcceptStrategy):
         if cooling_rate > 1:
             raise ValueError("Grau de resfiramento não pode ser superior a 1")
 
+        if warmup < 0:
+            raise ValueError("Warm-up must not be negative")
+
+        if not (0 < final_acceptance < target_acceptance < 1):
+            raise ValueError("Expected 0 < final_acceptance < target_acceptance < 1")
+
         self._rng = rng
-        self._cooling_rate = cooling_rate
-        self._initial_temperature = initial_temperature
-        self._temperature = initial_temperature
-        self._final_temperature = final_temperature
+        self._warmup = warmup
+        self._target_acceptance = target_acceptance
+        self._final_acceptance = final_acceptance
+        self._stop = stop
+        self._configured = (initial_temperature, final_temperature, cooling_rate)
+        self.reset(rng)
 
     @property
     def rng(self):
@@ -47,15 +72,72 @@ class SimulatedAnnealing(AcceptStrategy):
     def current_temperature(self):
         return self._temperature
 
+    @property
+    def warmup(self):
+        return self._warmup
+
+    @property
+    def is_calibrated(self):
+        return self._calibrated
+
     def _accept(self, curr_S_value: int, new_S_value: int) -> bool:
-        p = np.exp(-(new_S_value - curr_S_value) / self._temperature)
+        delta = new_S_value - curr_S_value
+        if self._iteration < self._warmup and delta > 0:
+            self._delta_sum += delta
+            self._delta_count += 1
+            self._delta_min = min(self._delta_min, delta)
+
+        p = np.exp(-delta / self._temperature)
         return self._rng.uniform(0, 1) < p
 
     def update_values(self) -> None:
+        if self._iteration < self._warmup:
+            self._iteration += 1
+            if self._iteration == self._warmup:
+                self._calibrate()
+            return
+
         self._temperature = max(
             (self._temperature * self._cooling_rate), self._final_temperature
         )
 
+    def _calibrate(self) -> None:
+        """Schedule from the worsening deltas of the warm-up, kept as is without any"""
+        if self._delta_count == 0:
+            return
+
+        mean_delta = self._delta_sum / self._delta_count
+        self._initial_temperature = -mean_delta / math.log(self._target_acceptance)
+        self._final_temperature = -self._delta_min / math.log(self._final_acceptance)
+        self._temperature = self._initial_temperature
+        self._calibrated = True
+
+        remaining = self._remaining_iterations()
+        if remaining is not None and remaining > 0:
+            self._cooling_rate = (self._final_temperature / self._initial_temperature) ** (
+                1 / remaining
+            )
+
+    def _remaining_iterations(self) -> Optional[float]:
+        stop = self._stop
+        if stop is None:
+            return None
+        if stop.method == Interrupt.BY_ITERATION_LIMIT:
+            return stop.limit - self._warmup
+        if stop.method == Interrupt.BY_TIMEOUT and stop.starting_time is not None:
+            elapsed = time.perf_counter() - stop.starting_time
+            if elapsed > 0:
+                return (stop.limit - elapsed) * self._warmup / elapsed
+        return None
+
     def reset(self, rng=None):
         self._rng = rng
+        self._initial_temperature, self._final_temperature, self._cooling_rate = (
+            self._configured
+        )
         self._temperature = self._initial_temperature
+        self._iteration = 0
+        self._delta_sum = 0
+        self._delta_count = 0
+        self._delta_min = math.inf
+        self._calibrated = False
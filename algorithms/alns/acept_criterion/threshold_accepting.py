@@ -0,0 +1,54 @@
+from algorithms.alns.acept_criterion.accept_strategy import AcceptStrategy
+
+
+class ThresholdAccepting(AcceptStrategy):
+    """
+    Threshold accepting: a solution is accepted when it is at most threshold worse than the
+    current one. The threshold decays geometrically every iteration down to final_threshold,
+    the deterministic counterpart of the simulated annealing cooling
+    """
+
+    def __init__(
+        self,
+        initial_threshold: float = 2.0,
+        final_threshold: float = 0.0,
+        decay_rate: float = 0.999,
+    ):
+        if initial_threshold < 0 or final_threshold < 0:
+            raise ValueError("Thresholds must not be negative")
+
+        if initial_threshold < final_threshold:
+            raise ValueError("Initial threshold must be at least the final one")
+
+        if not (0 < decay_rate <= 1):
+            raise ValueError("Decay rate must be in (0, 1]")
+
+        self._initial_threshold = initial_threshold
+        self._final_threshold = final_threshold
+        self._decay_rate = decay_rate
+        self._threshold = initial_threshold
+
+    @property
+    def initial_threshold(self):
+        return self._initial_threshold
+
+    @property
+    def final_threshold(self):
+        return self._final_threshold
+
+    @property
+    def decay_rate(self):
+        return self._decay_rate
+
+    @property
+    def current_threshold(self):
+        return self._threshold
+
+    def _accept(self, curr_S_value: int, new_S_value: int) -> bool:
+        return new_S_value - curr_S_value <= self._threshold
+
+    def update_values(self) -> None:
+        self._threshold = max(self._threshold * self._decay_rate, self._final_threshold)
+
+    def reset(self, rng=None):
+        self._threshold = self._initial_threshold
@@ -0,0 +1,33 @@
+from algorithms.alns.reset import Resettable
+from algorithms.solution_state import SolutionState
+from algorithms.heuristics.swap_search import swap_search
+import numpy.random as random
+
+
+class SwapLocalSearch(Resettable):
+    """
+    Intensification phase for ALNS.set_intensification: every new best solution goes through
+    swap_search, (1,1) swaps and (2,1) replacements scored on incremental coverage tables
+    """
+
+    def __init__(
+        self,
+        rng: random.Generator = random.default_rng(),
+        max_passes: int = 3,
+        max_swaps: int = 50,
+        tabu_tenure: int = 10,
+    ):
+        if max_passes < 1:
+            raise ValueError("Must do at least one pass")
+        self._rng = rng
+        self._max_passes = max_passes
+        self._max_swaps = max_swaps
+        self._tabu_tenure = tabu_tenure
+
+    def reset(self, rng=None):
+        self._rng = rng
+
+    def __call__(self, solution: SolutionState, operator_name: str = None) -> None:
+        swap_search(
+            solution, self._rng, self._max_passes, self._max_swaps, self._tabu_tenure
+        )
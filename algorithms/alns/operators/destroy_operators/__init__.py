@@ -1,7 +1,19 @@
 from algorithms.alns.operators.destroy_operators.random_destroy import (
     RandomDestroy,
 )
+from algorithms.alns.operators.destroy_operators.ball_destroy import (
+    BallDestroy,
+)
+from algorithms.alns.operators.destroy_operators.worst_region_destroy import (
+    WorstRegionDestroy,
+)
+from algorithms.alns.operators.destroy_operators.redundant_coverage_destroy import (
+    RedundantCoverageDestroy,
+)
 
 __all__ = [
     "RandomDestroy",
+    "BallDestroy",
+    "WorstRegionDestroy",
+    "RedundantCoverageDestroy",
 ]
@@ -0,0 +1,65 @@
+from algorithms.alns.operators.operator_strategy import (
+    OperatorStrategy,
+    OperatorContext,
+)
+from algorithms.utils.backend import AUTO, resolve_backend
+from algorithms.solution_state import SolutionState
+from algorithms.heuristics.domination import remove_from_solution
+from algorithms.heuristics.neighborhood import BallSearch
+import numpy.random as random
+import math
+
+
+class BallDestroy(OperatorStrategy):
+    """
+    Removes the solution nodes closest to a random solution node, a BFS ball, so the repair
+    rebuilds a whole region instead of scattered nodes
+    """
+
+    name = "bfs_ball_destroy"
+
+    def __init__(
+        self,
+        destroy_factor: float,
+        rng: random.Generator = random.default_rng(),
+        backend: str = AUTO,
+    ):
+        super().__init__()
+        if not (0 < destroy_factor < 1):
+            raise ValueError("Destroy factor must be greater than 0 and lower than 1")
+        self._destroy_factor = destroy_factor
+        self._rng = rng
+        self._backend = resolve_backend(backend)
+        self._ball_search: BallSearch = None
+
+    @property
+    def destroy_factor(self) -> str:
+        return self._destroy_factor
+
+    @classmethod
+    def get_instance_from_context(cls, context: OperatorContext):
+        return cls(context.destroy_factor, context.rng, context.backend)
+
+    def reset(self, rng=None):
+        self._rng = rng
+        # the copies made for batched ALNS must not share the visited marks
+        self._ball_search = None
+
+    def _seed(self, current_solution: SolutionState) -> int:
+        return self._rng.choice(current_solution.S.to_array())
+
+    def _modify_solution(self, current_solution) -> SolutionState:
+        remove_size = math.floor(self._destroy_factor * len(current_solution.S))
+        if remove_size == 0:
+            return current_solution
+
+        if self._ball_search is None or self._ball_search.graph is not current_solution.graph:
+            self._ball_search = BallSearch(current_solution.graph)
+
+        to_remove = self._ball_search.solution_ball(
+            current_solution.S.mask, self._seed(current_solution), remove_size, self._rng
+        )
+        return remove_from_solution(current_solution, to_remove, self._backend)
+
+    def _update_state_info(self, current_solution):
+        pass
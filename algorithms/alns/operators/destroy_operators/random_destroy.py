@@ -2,7 +2,9 @@ from algorithms.alns.operators.operator_strategy import (
     OperatorStrategy,
     OperatorContext,
 )
-from algorithms.solution_state import SolutionState, Index
+from algorithms.utils.backend import AUTO, resolve_backend
+from algorithms.solution_state import SolutionState
+from algorithms.heuristics.domination import remove_from_solution
 import numpy.random as random
 import math
 
@@ -14,12 +16,14 @@ class RandomDestroy(OperatorStrategy):
         self,
         destroy_factor: float,
         rng: random.Generator = random.default_rng(),
+        backend: str = AUTO,
     ):
         super().__init__()
         if not (0 < destroy_factor < 1):
             raise ValueError("Destroy factor must be greater than 0 and lower than 1")
         self._destroy_factor = destroy_factor
         self._rng = rng
+        self._backend = resolve_backend(backend)
 
     @property
     def destroy_factor(self) -> str:
@@ -27,7 +31,7 @@ class RandomDestroy(OperatorStrategy):
 
     @classmethod
     def get_instance_from_context(cls, context: OperatorContext):
-        return cls(context.destroy_factor, context.rng)
+        return cls(context.destroy_factor, context.rng, context.backend)
 
     def reset(self, rng=None):
         self._rng = rng
@@ -35,34 +39,10 @@ class RandomDestroy(OperatorStrategy):
     def _modify_solution(self, current_solution) -> SolutionState:
         remove_size = math.floor(self._destroy_factor * len(current_solution.S))
         to_remove = self._rng.choice(
-            list(current_solution.S), size=remove_size, replace=False
+            current_solution.S.to_array(), size=remove_size, replace=False
         )
 
-        # remove nodes that are part of the current solution
-        for v in to_remove:
-            # when V is removed its checked if V has been dominated by other nodes, if K > 0 it's not dominated
-            current_solution.S.remove(v)
-
-            if current_solution.G_info[v][Index.K] > 0:
-                current_solution.non_dominated.add(v)
-            else:
-                current_solution.dominated.add(v)
-
-            # un-dominate V's neighboors
-            for u in current_solution.G[v]:
-
-                if current_solution.G_info[u][Index.K] < current_solution.K:
-                    current_solution.G_info[u][Index.K] += 1
-
-                # if U's K-value is greater than 0 and is not part of the solution is
-                if (
-                    current_solution.G_info[u][Index.K] > 0
-                    and u not in current_solution.S
-                ):
-                    current_solution.dominated.discard(u)
-                    current_solution.non_dominated.add(u)
-
-        return current_solution
+        return remove_from_solution(current_solution, to_remove, self._backend)
 
     def _update_state_info(self, current_solution):
         pass
@@ -0,0 +1,69 @@
+from algorithms.alns.operators.operator_strategy import (
+    OperatorStrategy,
+    OperatorContext,
+)
+from algorithms.utils.backend import AUTO, resolve_backend
+from algorithms.solution_state import SolutionState
+from algorithms.heuristics.domination import remove_from_solution, neighborhood_excess
+import numpy.random as random
+import numpy as np
+import math
+
+
+class RedundantCoverageDestroy(OperatorStrategy):
+    """
+    Removes the solution nodes with the most redundant coverage in their closed neighborhood
+    (see neighborhood_excess), ties broken at random. Those are the nodes the repair can most
+    likely replace by fewer ones. Only sample_factor times as many random solution nodes as
+    are removed get scored, so the cost follows the destroyed region, not the solution
+    """
+
+    name = "redundant_coverage_destroy"
+
+    def __init__(
+        self,
+        destroy_factor: float,
+        rng: random.Generator = random.default_rng(),
+        backend: str = AUTO,
+        sample_factor: float = 2.0,
+    ):
+        super().__init__()
+        if not (0 < destroy_factor < 1):
+            raise ValueError("Destroy factor must be greater than 0 and lower than 1")
+        if sample_factor < 1:
+            raise ValueError("Sample factor must be at least 1")
+        self._destroy_factor = destroy_factor
+        self._sample_factor = sample_factor
+        self._rng = rng
+        self._backend = resolve_backend(backend)
+
+    @property
+    def destroy_factor(self) -> str:
+        return self._destroy_factor
+
+    @property
+    def sample_factor(self) -> float:
+        return self._sample_factor
+
+    @classmethod
+    def get_instance_from_context(cls, context: OperatorContext):
+        return cls(context.destroy_factor, context.rng, context.backend)
+
+    def reset(self, rng=None):
+        self._rng = rng
+
+    def _modify_solution(self, current_solution) -> SolutionState:
+        remove_size = math.floor(self._destroy_factor * len(current_solution.S))
+        solution = current_solution.S.to_array()
+        sample_size = min(math.ceil(self._sample_factor * remove_size), len(solution))
+        # the sample comes in random order, the stable sort breaks the ties at random
+        sample = self._rng.choice(solution, size=sample_size, replace=False)
+        excess = neighborhood_excess(current_solution, sample)
+
+        order = np.argsort(-excess, kind="stable")
+        to_remove = sample[order[:remove_size]]
+
+        return remove_from_solution(current_solution, to_remove, self._backend)
+
+    def _update_state_info(self, current_solution):
+        pass
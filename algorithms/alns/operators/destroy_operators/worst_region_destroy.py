@@ -0,0 +1,43 @@
+from algorithms.alns.operators.operator_strategy import OperatorContext
+from algorithms.alns.operators.destroy_operators.ball_destroy import BallDestroy
+from algorithms.utils.backend import AUTO
+from algorithms.solution_state import SolutionState
+from algorithms.heuristics.domination import neighborhood_excess
+import numpy.random as random
+import numpy as np
+
+
+class WorstRegionDestroy(BallDestroy):
+    """
+    BFS ball destroy centered on the solution node with the most coverage slack within two
+    hops (see neighborhood_excess, on the cached two hop index) among sample_size random
+    solution nodes, the region where the solution spends the most dominators for nothing
+    """
+
+    name = "worst_region_destroy"
+
+    def __init__(
+        self,
+        destroy_factor: float,
+        rng: random.Generator = random.default_rng(),
+        backend: str = AUTO,
+        sample_size: int = 16,
+    ):
+        super().__init__(destroy_factor, rng, backend)
+        if sample_size < 1:
+            raise ValueError("Sample size must be at least 1")
+        self._sample_size = sample_size
+
+    @classmethod
+    def get_instance_from_context(cls, context: OperatorContext):
+        return cls(context.destroy_factor, context.rng, context.backend)
+
+    def _seed(self, current_solution: SolutionState) -> int:
+        solution = current_solution.S.to_array()
+        sample = self._rng.choice(
+            solution, size=min(self._sample_size, len(solution)), replace=False
+        )
+        slack = neighborhood_excess(
+            current_solution, sample, current_solution.graph.two_hop()
+        )
+        return sample[np.argmax(slack)]
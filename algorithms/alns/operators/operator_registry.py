@@ -6,9 +6,15 @@ from algorithms.alns.operators.repair_operators import (
     GreedyHybridDominatedOperator,
     GreedyHybridDegreeOperator,
     RandomRepair,
+    RedundancyPruning,
 )
 
-from algorithms.alns.operators.destroy_operators import RandomDestroy
+from algorithms.alns.operators.destroy_operators import (
+    RandomDestroy,
+    BallDestroy,
+    WorstRegionDestroy,
+    RedundantCoverageDestroy,
+)
 
 
 OPERATOR_REGISTRY: Dict[str, OperatorStrategy] = {
@@ -17,5 +23,9 @@ OPERATOR_REGISTRY: Dict[str, OperatorStrategy] = {
     GreedyLeastDominatedOperator.name: GreedyLeastDominatedOperator,
     GreedyHybridDegreeOperator.name: GreedyDegreeOperator,
     GreedyHybridDominatedOperator.name: GreedyDegreeOperator,
+    RedundancyPruning.name: RedundancyPruning,
     RandomDestroy.name: RandomDestroy,
+    BallDestroy.name: BallDestroy,
+    WorstRegionDestroy.name: WorstRegionDestroy,
+    RedundantCoverageDestroy.name: RedundantCoverageDestroy,
 }
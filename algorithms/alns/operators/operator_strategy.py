@@ -2,6 +2,7 @@ from typing import List
 from abc import abstractmethod
 from algorithms.solution_state import SolutionState, Index
 from algorithms.alns.reset import Resettable
+from algorithms.utils.backend import AUTO
 import numpy.random as random
 
 
@@ -11,10 +12,13 @@ class OperatorContext:
         rng: random.Generator = random.default_rng(),
         greedy_alpha: float = 0,
         destroy_factor: float = 0.5,
+        backend: str = AUTO,
     ):
         self.rng = rng
         self.greedy_alpha = greedy_alpha
         self.destroy_factor = destroy_factor
+        # python, numba or auto (numba when installed), see algorithms.utils.backend
+        self.backend = backend
 
 
 class OperatorStrategy(Resettable):
@@ -14,6 +14,9 @@ from algorithms.alns.operators.repair_operators.greedy_hybrid_degree import (
 from algorithms.alns.operators.repair_operators.random_repair import (
     RandomRepair,
 )
+from algorithms.alns.operators.repair_operators.redundancy_pruning import (
+    RedundancyPruning,
+)
 
 __all__ = [
     "GreedyDegreeOperator",
@@ -21,4 +24,5 @@ __all__ = [
     "GreedyHybridDominatedOperator",
     "GreedyHybridDegreeOperator",
     "RandomRepair",
+    "RedundancyPruning",
 ]
@@ -2,8 +2,10 @@ from algorithms.alns.operators.operator_strategy import (
     OperatorStrategy,
     OperatorContext,
 )
+from algorithms.utils.backend import AUTO, resolve_backend
 from algorithms.solution_state import SolutionState, Index
 from algorithms.heuristics.greedy_hybrid_v2 import pseudo_greedy_repair
+from algorithms.heuristics.domination import count_non_dominated_neighbors
 import numpy.random as random
 
 
@@ -14,31 +16,33 @@ class GreedyHybridDegreeOperator(OperatorStrategy):
         self,
         greedy_alpha: float,
         rng: random.Generator = random.default_rng(),
+        backend: str = AUTO,
     ):
         super().__init__()
         if not (0 <= greedy_alpha <= 1):
             raise ValueError("Must be a float equal or between 0 and 1")
         self._rng = rng
+        self._backend = resolve_backend(backend)
         self._alpha = greedy_alpha
         self._info_indexes += [Index.DEGREE, Index.WEIGHT]
 
     @classmethod
     def get_instance_from_context(cls, context: OperatorContext):
-        return cls(context.greedy_alpha, context.rng)
+        return cls(context.greedy_alpha, context.rng, context.backend)
 
     def reset(self, rng=None):
         self._rng = rng
 
     def _modify_solution(self, curr_S: SolutionState) -> SolutionState:
-        return pseudo_greedy_repair(curr_S, self._alpha, self._rng)
+        return pseudo_greedy_repair(
+            curr_S, self._alpha, self._rng, backend=self._backend
+        )
 
     def _update_state_info(self, curr_S: SolutionState) -> SolutionState:
         if curr_S.is_solution_empty():
             curr_S.reset_G_info()
             return curr_S
 
-        for v in curr_S.non_dominated:
-            for u in curr_S.G[v]:
-                curr_S.G_info[u][Index.DEGREE] += 1
+        curr_S.G_info.column(Index.DEGREE)[:] += count_non_dominated_neighbors(curr_S)
 
         return curr_S
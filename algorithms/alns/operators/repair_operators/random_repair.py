@@ -2,6 +2,7 @@ from algorithms.alns.operators.operator_strategy import (
     OperatorStrategy,
     OperatorContext,
 )
+from algorithms.utils.backend import AUTO, resolve_backend
 from algorithms.solution_state import SolutionState
 from algorithms.heuristics.random_domination import repair
 import numpy.random as random
@@ -13,19 +14,21 @@ class RandomRepair(OperatorStrategy):
     def __init__(
         self,
         rng: random.Generator = random.default_rng(),
+        backend: str = AUTO,
     ):
         super().__init__()
         self._rng = rng
+        self._backend = resolve_backend(backend)
 
     @classmethod
     def get_instance_from_context(cls, context: OperatorContext):
-        return cls(context.rng)
+        return cls(context.rng, context.backend)
 
     def reset(self, rng=None):
         self._rng = rng
 
     def _modify_solution(self, current_solution) -> SolutionState:
-        return repair(current_solution, self._rng)
+        return repair(current_solution, self._rng, self._backend)
 
     def _update_state_info(self, curr_S):
         pass
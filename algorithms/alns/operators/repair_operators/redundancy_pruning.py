@@ -0,0 +1,65 @@
+from algorithms.alns.operators.operator_strategy import (
+    OperatorStrategy,
+    OperatorContext,
+)
+from algorithms.alns.operators.repair_operators.random_repair import RandomRepair
+from algorithms.utils.backend import AUTO, resolve_backend
+from algorithms.solution_state import SolutionState
+from algorithms.heuristics.redundancy import prune_redundant
+from typing import Optional
+import numpy.random as random
+import copy
+
+
+class RedundancyPruning(OperatorStrategy):
+    """
+    Completes the solution with another repair operator (random repair by default) and then
+    drops the solution nodes that are not needed anymore, see prune_redundant.
+    Wrapping a repair operator turns the pruning into a post-step of it, the operator is then
+    named after the wrapped one so both can be in the same ALNS.
+    greedy prunes the nodes covering the fewest nodes first, otherwise in a random order
+    """
+
+    name = "redundancy_pruning_repair"
+
+    def __init__(
+        self,
+        rng: random.Generator = random.default_rng(),
+        backend: str = AUTO,
+        repair: Optional[OperatorStrategy] = None,
+        greedy: bool = False,
+    ):
+        super().__init__()
+        self._rng = rng
+        self._backend = resolve_backend(backend)
+        self._greedy = greedy
+        if repair is None:
+            self._repair = RandomRepair(rng, self._backend)
+        else:
+            self._repair = repair
+            self.name = f"{repair.name}_pruned"
+        self._info_indexes = self._repair.info_indexes
+
+    @classmethod
+    def get_instance_from_context(cls, context: OperatorContext):
+        return cls(context.rng, context.backend)
+
+    def reset(self, rng=None):
+        self._rng = rng
+        self._repair.reset(rng)
+
+    def __copy__(self):
+        # batched ALNS resets every copy with its own rng, the wrapped operator is copied too
+        clone = self.__class__.__new__(self.__class__)
+        clone.__dict__.update(self.__dict__)
+        clone._repair = copy.copy(self._repair)
+        return clone
+
+    def _modify_solution(self, curr_S: SolutionState) -> SolutionState:
+        curr_S = self._repair._modify_solution(curr_S)
+        return prune_redundant(
+            curr_S, None if self._greedy else self._rng, self._backend
+        )
+
+    def _update_state_info(self, curr_S: SolutionState) -> SolutionState:
+        return self._repair._update_state_info(curr_S)
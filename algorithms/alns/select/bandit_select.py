@@ -0,0 +1,75 @@
+from abc import abstractmethod
+from typing import List, Tuple
+from numpy.random import Generator
+import numpy as np
+
+from algorithms.alns.select.select_strategy import SelectStrategy
+from algorithms.alns.enum.alns_enum import Outcome
+
+DESTROY = 0
+REPAIR = 1
+
+
+class BanditSelect(SelectStrategy):
+    """
+    Base of the bandit select strategies. Destroy and repair operators are two independent
+    bandits, both updated on every iteration with the reward of the outcome, scaled to [0, 1]
+    by the largest reward. The operator weights hold the current reward estimate of each arm,
+    and every update only touches the statistics of the arm that was played
+    """
+
+    def __init__(
+        self,
+        num_destroy_op: int,
+        num_repair_op: int,
+        outcome_rewards: List[int],
+        rng: Generator = np.random.default_rng(),
+    ):
+        super().__init__(num_destroy_op, num_repair_op, rng)
+        rewards = np.asarray(outcome_rewards, dtype=np.float64)
+        if len(rewards) != len(Outcome) or rewards.min() < 0 or rewards.max() <= 0:
+            raise ValueError(
+                "Must have a non negative reward per outcome, at least one positive"
+            )
+        self._outcome_rewards = outcome_rewards
+        self._rewards = rewards / rewards.max()
+        self._num_arms = (num_destroy_op, num_repair_op)
+        self._init_arms()
+
+    @property
+    def outcome_rewards(self):
+        return self._outcome_rewards
+
+    def _estimates(self, group: int) -> np.ndarray:
+        return self._destroy_op_weights if group == DESTROY else self._repair_op_weights
+
+    def select(self) -> Tuple[int, int]:
+        return (self._choose(DESTROY), self._choose(REPAIR))
+
+    def update(self, destroy_idx: int, repair_idx: int, outcome: Outcome) -> None:
+        reward = self._rewards[outcome.id]
+        self._reward(DESTROY, destroy_idx, reward)
+        self._reward(REPAIR, repair_idx, reward)
+
+    @abstractmethod
+    def _init_arms(self) -> None:
+        """Creates the arm statistics of both bandits (abstract)"""
+        pass
+
+    @abstractmethod
+    def _choose(self, group: int) -> int:
+        return NotImplemented
+
+    @abstractmethod
+    def _reward(self, group: int, arm: int, reward: float) -> None:
+        return NotImplemented
+
+    def reset(self, rng=None):
+        """
+        Resets the component to its initial state for a fresh new execution
+        """
+        self._rng = rng
+        self._uniform_buffer = None
+        self._destroy_op_weights = np.ones(self._num_destroy_op)
+        self._repair_op_weights = np.ones(self._num_repair_op)
+        self._init_arms()
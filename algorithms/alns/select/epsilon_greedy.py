@@ -0,0 +1,65 @@
+from typing import List
+from numpy.random import Generator
+import numpy as np
+
+from algorithms.alns.select.bandit_select import BanditSelect
+
+
+class EpsilonGreedySelect(BanditSelect):
+    """
+    Plays a random arm with probability epsilon, or one not played yet, otherwise the arm with
+    the best mean reward over its last window plays. The last rewards of every arm are kept in
+    a ring buffer with their running sum, so an update is a single write
+    """
+
+    def __init__(
+        self,
+        num_destroy_op: int,
+        num_repair_op: int,
+        outcome_rewards: List[int],
+        epsilon: float = 0.1,
+        window: int = 50,
+        rng: Generator = np.random.default_rng(),
+    ):
+        if not (0 <= epsilon <= 1):
+            raise ValueError("Epsilon must be between 0 and 1")
+        if window < 1:
+            raise ValueError("Window must be at least 1")
+        self._epsilon = epsilon
+        self._window = window
+        super().__init__(num_destroy_op, num_repair_op, outcome_rewards, rng)
+
+    @property
+    def epsilon(self) -> float:
+        return self._epsilon
+
+    @property
+    def window(self) -> int:
+        return self._window
+
+    def _init_arms(self) -> None:
+        self._history = [np.zeros((n_arms, self._window)) for n_arms in self._num_arms]
+        self._sums = [np.zeros(n_arms) for n_arms in self._num_arms]
+        self._plays = [np.zeros(n_arms, dtype=np.int64) for n_arms in self._num_arms]
+        self._destroy_op_weights.fill(0)
+        self._repair_op_weights.fill(0)
+
+    def _choose(self, group: int) -> int:
+        untried = np.flatnonzero(self._plays[group] == 0)
+        if len(untried) > 0:
+            return int(untried[self._uniforms.integer(len(untried))])
+
+        if self._uniforms.random() < self._epsilon:
+            return self._uniforms.integer(self._num_arms[group])
+        return int(np.argmax(self._estimates(group)))
+
+    def _reward(self, group: int, arm: int, reward: float) -> None:
+        plays = self._plays[group]
+        slot = plays[arm] % self._window
+        history, sums = self._history[group], self._sums[group]
+
+        sums[arm] += reward - history[arm, slot]
+        history[arm, slot] = reward
+        plays[arm] += 1
+
+        self._estimates(group)[arm] = sums[arm] / min(plays[arm], self._window)
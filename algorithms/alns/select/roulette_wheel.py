@@ -2,6 +2,7 @@ from algorithms.alns.select.select_strategy import SelectStrategy
 from algorithms.alns.enum.alns_enum import Outcome
 from typing import List, Tuple
 from numpy.random import Generator
+from algorithms.utils.sampler import AliasTable
 import numpy as np
 
 
@@ -30,6 +31,10 @@ class RouletteWheelSelect(SelectStrategy):
         self._repair_attempts = np.zeros(num_repair_op)
         self._rewards = outcome_rewards
 
+        # alias tables of the destroy and repair weights, rebuilt when the weights change
+        self._destroy_table = None
+        self._repair_table = None
+
     @property
     def segment_lenght(self):
         return self._segment_lenght
@@ -61,16 +66,26 @@ class RouletteWheelSelect(SelectStrategy):
     def is_update_time(self):
         return self._iteration == self._segment_lenght
 
-    def _roulette_wheel_selection(self, operators_weigths: List[float]) -> int:
-        operators_probabilies = operators_weigths / np.sum(operators_weigths)
-        return self._rng.choice(len(operators_weigths), p=operators_probabilies)
+    def _roulette_wheel_selection(self, table: AliasTable) -> int:
+        return table.sample(self._uniforms.random())
+
+    @staticmethod
+    def _alias_table(table: AliasTable, operators_weigths: np.ndarray) -> AliasTable:
+        if table is None or not table.matches(operators_weigths):
+            table = AliasTable(operators_weigths)
+        return table
 
     def select(self) -> Tuple[int, int]:
         if self.is_update_time():
             self._reset_operators()
 
-        d_idx = self._roulette_wheel_selection(self._destroy_op_weights)
-        r_idx = self._roulette_wheel_selection(self._repair_op_weights)
+        self._destroy_table = self._alias_table(
+            self._destroy_table, self._destroy_op_weights
+        )
+        self._repair_table = self._alias_table(self._repair_table, self._repair_op_weights)
+
+        d_idx = self._roulette_wheel_selection(self._destroy_table)
+        r_idx = self._roulette_wheel_selection(self._repair_table)
 
         self._repair_attempts[r_idx] += 1
         self._destroy_attempts[d_idx] += 1
@@ -118,6 +133,9 @@ class RouletteWheelSelect(SelectStrategy):
         Resets the component to its initial state for a fresh new execution
         """
         self._rng = rng
+        self._uniform_buffer = None
+        self._destroy_table = None
+        self._repair_table = None
         self._destroy_op_weights = np.ones(self._num_destroy_op)
         self._repair_op_weights = np.ones(self._num_repair_op)
         self._destroy_attempts.fill(0)
@@ -4,6 +4,7 @@ import numpy as np
 from numpy.random import Generator
 from algorithms.alns.enum.alns_enum import Outcome
 from algorithms.alns.reset import Resettable
+from algorithms.utils.sampler import UniformBuffer
 
 
 class SelectStrategy(Resettable):
@@ -14,6 +15,7 @@ class SelectStrategy(Resettable):
         self._destroy_op_weights = np.ones(num_destroy_op)
         self._repair_op_weights = np.ones(num_repair_op)
         self._rng = rng
+        self._uniform_buffer = None
 
     @property
     def num_destroy_op(self) -> int:
@@ -35,6 +37,15 @@ class SelectStrategy(Resettable):
     def rng(self) -> Generator:
         return self._rng
 
+    @property
+    def _uniforms(self) -> UniformBuffer:
+        """Buffered uniforms of the current rng, refilled when the rng is replaced"""
+        if isinstance(self._rng, UniformBuffer):
+            return self._rng
+        if self._uniform_buffer is None or self._uniform_buffer.rng is not self._rng:
+            self._uniform_buffer = UniformBuffer(self._rng)
+        return self._uniform_buffer
+
     def is_update_time(self) -> bool:
         return False
 
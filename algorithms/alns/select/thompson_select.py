@@ -0,0 +1,51 @@
+from typing import List
+from numpy.random import Generator
+import numpy as np
+
+from algorithms.alns.select.bandit_select import BanditSelect
+
+
+class ThompsonSelect(BanditSelect):
+    """
+    Discounted Thompson sampling: every arm keeps a Beta(1 + successes, 1 + failures)
+    posterior, a reward r adding r successes and 1 - r failures. On every update the
+    evidence of the arms of the bandit is multiplied by discount, so old outcomes fade and
+    the selection follows operators whose performance changes along the search
+    """
+
+    def __init__(
+        self,
+        num_destroy_op: int,
+        num_repair_op: int,
+        outcome_rewards: List[int],
+        discount: float = 0.99,
+        rng: Generator = np.random.default_rng(),
+    ):
+        if not (0 < discount <= 1):
+            raise ValueError("Discount must be greater than 0 and at most 1")
+        self._discount = discount
+        super().__init__(num_destroy_op, num_repair_op, outcome_rewards, rng)
+
+    @property
+    def discount(self) -> float:
+        return self._discount
+
+    def _init_arms(self) -> None:
+        self._successes = [np.zeros(n_arms) for n_arms in self._num_arms]
+        self._failures = [np.zeros(n_arms) for n_arms in self._num_arms]
+        self._destroy_op_weights.fill(0.5)
+        self._repair_op_weights.fill(0.5)
+
+    def _choose(self, group: int) -> int:
+        samples = self._rng.beta(1 + self._successes[group], 1 + self._failures[group])
+        return int(np.argmax(samples))
+
+    def _reward(self, group: int, arm: int, reward: float) -> None:
+        successes, failures = self._successes[group], self._failures[group]
+        successes *= self._discount
+        failures *= self._discount
+        successes[arm] += reward
+        failures[arm] += 1 - reward
+
+        # posterior mean
+        self._estimates(group)[:] = (1 + successes) / (2 + successes + failures)
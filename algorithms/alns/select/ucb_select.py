@@ -0,0 +1,50 @@
+from typing import List
+from numpy.random import Generator
+import numpy as np
+
+from algorithms.alns.select.bandit_select import BanditSelect
+
+
+class UCB1Select(BanditSelect):
+    """
+    UCB1: every arm is played once, then the arm with the highest mean reward plus
+    exploration * sqrt(ln(plays) / arm plays) is chosen
+    """
+
+    def __init__(
+        self,
+        num_destroy_op: int,
+        num_repair_op: int,
+        outcome_rewards: List[int],
+        exploration: float = np.sqrt(2),
+        rng: Generator = np.random.default_rng(),
+    ):
+        if exploration < 0:
+            raise ValueError("Exploration must be non negative")
+        self._exploration = exploration
+        super().__init__(num_destroy_op, num_repair_op, outcome_rewards, rng)
+
+    @property
+    def exploration(self) -> float:
+        return self._exploration
+
+    def _init_arms(self) -> None:
+        self._plays = [np.zeros(n_arms) for n_arms in self._num_arms]
+        self._total_plays = [0, 0]
+        self._destroy_op_weights.fill(0)
+        self._repair_op_weights.fill(0)
+
+    def _choose(self, group: int) -> int:
+        plays = self._plays[group]
+        untried = np.flatnonzero(plays == 0)
+        if len(untried) > 0:
+            return int(untried[0])
+
+        bonus = np.sqrt(np.log(self._total_plays[group]) / plays)
+        return int(np.argmax(self._estimates(group) + self._exploration * bonus))
+
+    def _reward(self, group: int, arm: int, reward: float) -> None:
+        self._plays[group][arm] += 1
+        self._total_plays[group] += 1
+        means = self._estimates(group)
+        means[arm] += (reward - means[arm]) / self._plays[group][arm]
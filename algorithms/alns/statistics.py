@@ -7,8 +7,8 @@ import time
 import pprint
 
 if TYPE_CHECKING:
-    from algorithms.alns.alns import ALNS
-    from algorithms.alns.lns import LNS
+    from algorithms.alns.ALNS import ALNS
+    from algorithms.alns.LNS import LNS
 
 
 class Statistics:
@@ -81,7 +81,7 @@ class Statistics:
         diff_time = time.perf_counter() - self.__start_time
         self.best_solution_tracking.append(
             (
-                len(new_best_solution.S),
+                new_best_solution.original_objective,
                 self.__alns.stop.iteration,
                 diff_time,
                 operator_name,
@@ -42,6 +42,10 @@ class StopCondition(Resettable):
         }
         self._stop_function = self._methods.get(self._method, lambda: False)
 
+    @property
+    def method(self):
+        return self._method
+
     @property
     def iteration(self):
         return self._curr_iteration
@@ -0,0 +1,178 @@
+from algorithms.solution_state import SolutionState, Index
+from algorithms.utils.backend import PYTHON, NUMBA
+from algorithms.utils.csr_graph import CSRGraph
+from typing import List
+import numpy as np
+
+
+def add_to_solution(
+    current_S: SolutionState, v: int, update_degree: bool = False
+) -> np.ndarray:
+    """
+    Adds V to the solution and dominates its neighbors, returns the nodes that became dominated.
+    With update_degree the DEGREE of V's neighbors is lowered, as the edge between them and V is
+    no longer relevant, and so is the DEGREE of the neighbors of every newly dominated node
+    """
+    graph = current_S.graph
+    K_info = current_S.G_info.column(Index.K)
+
+    current_S.S.add(v)
+
+    # dominate the neighbors of V
+    neighbors = graph.neighbors(v)
+    K_info[neighbors] -= 1
+
+    # nodes that just reached K == 0 and are not in the solution are now dominated
+    newly_dominated = neighbors[
+        (K_info[neighbors] == 0) & ~current_S.S.mask[neighbors]
+    ]
+
+    if update_degree:
+        touched = neighbors
+        if len(newly_dominated) > 0:
+            touched = np.concatenate((neighbors, graph.neighbors_of(newly_dominated)))
+        _decrement_degree(current_S.G_info.column(Index.DEGREE), touched)
+
+    current_S.dominated.add_many(newly_dominated)
+    current_S.non_dominated.discard_many(newly_dominated)
+    current_S.non_dominated.discard(v)
+
+    return newly_dominated
+
+
+def remove_from_solution(
+    current_S: SolutionState, to_remove: np.ndarray, backend: str = PYTHON
+) -> SolutionState:
+    """
+    Removes an array of distinct solution nodes in a batch, what the destroy operators share.
+    Their neighbors lose one dominator per removed neighbor and every affected node outside
+    the solution moves to the dominated or non dominated set by its K
+    """
+    if backend == NUMBA:
+        from algorithms.heuristics import kernels
+
+        return kernels.random_destroy(current_S, to_remove)
+
+    K_info = current_S.G_info.column(Index.K)
+    in_S = current_S.S.mask
+
+    current_S.S.discard_many(to_remove)
+
+    # un-dominate the neighbors once per removed node, K never goes above the node demand
+    neighbors, counts = np.unique(
+        current_S.graph.neighbors_of(to_remove), return_counts=True
+    )
+    K_info[neighbors] = np.minimum(K_info[neighbors] + counts, current_S.demand[neighbors])
+
+    # removed nodes and their neighbors outside the solution are not dominated while K > 0
+    affected = np.union1d(to_remove, neighbors)
+    affected = affected[~in_S[affected]]
+    not_dominated = affected[K_info[affected] > 0]
+    current_S.dominated.discard_many(not_dominated)
+    current_S.non_dominated.add_many(not_dominated)
+
+    # a removed node that is still dominated by other solution nodes stays dominated
+    current_S.dominated.add_many(to_remove[K_info[to_remove] <= 0])
+
+    return current_S
+
+
+def neighborhood_excess(
+    current_S: SolutionState, nodes: np.ndarray, adjacency: CSRGraph = None
+) -> np.ndarray:
+    """
+    Excess coverage (-K, dominators above the demand) summed over the closed neighborhood of
+    each node, how much of the domination around it is redundant. adjacency replaces the graph
+    for wider neighborhoods, as the two hop index (CSRGraph.two_hop)
+    """
+    adjacency = current_S.graph if adjacency is None else adjacency
+    excess = np.maximum(-current_S.G_info.column(Index.K), 0)
+    owner = np.repeat(np.arange(len(nodes)), adjacency.degrees[nodes])
+    return excess[nodes] + np.bincount(
+        owner, weights=excess[adjacency.neighbors_of(nodes)], minlength=len(nodes)
+    ).astype(np.int64)
+
+
+def _decrement_degree(degree: np.ndarray, nodes: np.ndarray) -> None:
+    """
+    Lowers DEGREE by one per occurrence of a node, without going below 0.
+    Same as applying 'if degree[w] > 0: degree[w] -= 1' once per occurrence
+    """
+    nodes, counts = np.unique(nodes, return_counts=True)
+    degree[nodes] = np.maximum(degree[nodes] - counts, 0)
+
+
+def count_non_dominated_neighbors(current_S: SolutionState) -> np.ndarray:
+    """How many non dominated neighbors each node has"""
+    return np.bincount(
+        current_S.graph.neighbors_of(current_S.non_dominated.to_array()),
+        minlength=current_S.n_nodes,
+    ).astype(np.int32)
+
+
+def set_solution(current_S: SolutionState, nodes: np.ndarray) -> SolutionState:
+    """
+    Replaces the solution by nodes, the K info and the dominated sets are rebuilt from the
+    initial info. The other info columns are left as in the initial info
+    """
+    current_S.reset_G_info()
+    K_info = current_S.G_info.column(Index.K)
+
+    current_S.S.clear()
+    current_S.S.add_many(nodes)
+    K_info -= np.bincount(
+        current_S.graph.neighbors_of(nodes), minlength=current_S.n_nodes
+    ).astype(K_info.dtype)
+
+    outside = ~current_S.S.mask
+    np.logical_and(outside, K_info <= 0, out=current_S.dominated.mask)
+    np.logical_and(outside, K_info > 0, out=current_S.non_dominated.mask)
+    current_S.dominated.sync_size()
+    current_S.non_dominated.sync_size()
+
+    return current_S
+
+
+def state_violations(current_S: SolutionState) -> List[str]:
+    """
+    Invariants of a state, rebuilt from the graph with a few vectorized passes, returns what is
+    violated. The sets must match their masks and partition the nodes, and once the info is
+    initialized K must be the node demand minus its solution neighbors, with the
+    nodes outside the solution dominated exactly when K <= 0
+    """
+    violations = []
+    node_sets = {
+        "S": current_S.S,
+        "dominated": current_S.dominated,
+        "non_dominated": current_S.non_dominated,
+    }
+    for name, node_set in node_sets.items():
+        if len(node_set) != np.count_nonzero(node_set.mask):
+            violations.append(f"{name} size {len(node_set)} does not match its mask")
+
+    in_S = current_S.S.mask
+    dominated = current_S.dominated.mask
+    non_dominated = current_S.non_dominated.mask
+    if np.any(in_S & dominated) or np.any(in_S & non_dominated):
+        violations.append("solution nodes in the dominated or non dominated set")
+    if np.any(dominated & non_dominated):
+        violations.append("nodes both dominated and non dominated")
+
+    if current_S.G_info is None:
+        return violations
+
+    K_info = current_S.G_info.column(Index.K)
+    S_neighbors = np.bincount(
+        current_S.graph.neighbors_of(current_S.S.to_array()), minlength=current_S.n_nodes
+    )
+    wrong_K = np.flatnonzero(K_info != current_S.demand - S_neighbors)
+    if len(wrong_K) > 0:
+        violations.append(f"K info differs from the solution on nodes {wrong_K[:10].tolist()}")
+
+    outside = ~in_S
+    if not np.array_equal(dominated, outside & (K_info <= 0)):
+        violations.append("dominated set differs from the nodes outside S with K <= 0")
+    if not np.array_equal(non_dominated, outside & (K_info > 0)):
+        violations.append("non dominated set differs from the nodes outside S with K > 0")
+
+    return violations
@@ -1,77 +1,108 @@
 from algorithms.solution_state import SolutionState, Index
+from algorithms.heuristics.domination import add_to_solution
+from algorithms.utils.bucket_queue import BucketQueue, BUCKET_QUEUE_MIN_FRONTIER
+from algorithms.utils.backend import PYTHON, NUMBA
+from typing import Optional
+from algorithms.utils.sampler import pick
 import numpy.random as random
+import numpy as np
 
 
 def greedy_repair(current_S: SolutionState) -> SolutionState:
-    G = current_S.G
+    degree = current_S.G_info.column(Index.DEGREE)
 
     # main loop
     while len(current_S.non_dominated) > 0:
-        v = next(iter(current_S.non_dominated))
-
         # select the vertex with maximum degree
-        for u in current_S.non_dominated:
-            if current_S.G_info[u][Index.DEGREE] > current_S.G_info[v][Index.DEGREE]:
-                v = u
+        candidates = current_S.non_dominated.to_array()
+        v = int(candidates[np.argmax(degree[candidates])])
 
         # add the vertex to the solution
-        current_S.S.add(v)
-
-        for u in G[v]:
-
-            # dominate the neighbors of V
-            current_S.G_info[u][Index.K] -= 1
-
-            # update the node degree as the edge between U and V is no longer relevant
-            if current_S.G_info[u][Index.DEGREE] > 0:
-                current_S.G_info[u][Index.DEGREE] -= 1
-
-            # discard u, update the node degree between u and its neightboors, as u is no longer relevant
-            if current_S.G_info[u][Index.K] == 0 and u not in current_S.S:
-                current_S.dominated.add(u)
-                current_S.non_dominated.discard(u)
-                for w in G[u]:
-                    # update the node degree as the edge between U and W is no longer relevant
-                    if current_S.G_info[w][Index.DEGREE] > 0:
-                        current_S.G_info[w][Index.DEGREE] -= 1
-
-        current_S.non_dominated.discard(v)
+        add_to_solution(current_S, v, update_degree=True)
 
     return current_S
 
 
 def pseudo_greedy_repair(
-    current_S: SolutionState, alpha: float, rng: random.Generator = random.default_rng()
-):
-    G = current_S.G
+    current_S: SolutionState,
+    alpha: float,
+    rng: random.Generator = random.default_rng(),
+    use_bucket_queue: Optional[bool] = None,
+    backend: str = PYTHON,
+) -> SolutionState:
+    """
+    Adds random nodes from the RCL (degree >= max - alpha * (max - min)) until every node is dominated.
+    The candidates are either scanned on every step, which numpy does fast on small frontiers,
+    or kept in a bucket queue that only moves the nodes touched by an insertion.
+    By default the bucket queue is used once the frontier reaches BUCKET_QUEUE_MIN_FRONTIER nodes,
+    the numba backend scans the candidates in a compiled loop unless the bucket queue is asked for
+    """
+    if backend == NUMBA and not use_bucket_queue:
+        from algorithms.heuristics import kernels
+
+        return kernels.pseudo_greedy_repair(
+            current_S, alpha, rng, kernels.DEGREE_RCL
+        )
+
+    if use_bucket_queue is None:
+        use_bucket_queue = len(current_S.non_dominated) >= BUCKET_QUEUE_MIN_FRONTIER
+
+    if use_bucket_queue:
+        return _bucket_pseudo_greedy_repair(current_S, alpha, rng)
+    return _scan_pseudo_greedy_repair(current_S, alpha, rng)
+
+
+def _scan_pseudo_greedy_repair(
+    current_S: SolutionState, alpha: float, rng: random.Generator
+) -> SolutionState:
+    degree = current_S.G_info.column(Index.DEGREE)
 
+    # main loop
     while len(current_S.non_dominated) > 0:
-        candidate_nodes = {
-            u: current_S.G_info[u][Index.DEGREE] for u in current_S.non_dominated
-        }
-        max_degree = max(candidate_nodes.values())
-        min_degree = min(candidate_nodes.values())
+        candidate_nodes = current_S.non_dominated.to_array()
+        candidate_degrees = degree[candidate_nodes]
+        max_degree = candidate_degrees.max()
+        min_degree = candidate_degrees.min()
 
         threshold = max_degree - alpha * (max_degree - min_degree)
-        RCL = [u for u, degree in candidate_nodes.items() if degree >= threshold]
+        RCL = candidate_nodes[candidate_degrees >= threshold]
+        v = int(pick(rng, RCL))
 
-        v = rng.choice(RCL)
+        add_to_solution(current_S, v, update_degree=True)
 
-        current_S.S.add(v)
+    return current_S
+
+
+def _bucket_pseudo_greedy_repair(
+    current_S: SolutionState, alpha: float, rng: random.Generator
+) -> SolutionState:
+    graph = current_S.graph
+    degree = current_S.G_info.column(Index.DEGREE)
+    non_dominated = current_S.non_dominated.mask
 
-        for u in G[v]:
-            current_S.G_info[u][Index.K] -= 1
+    # candidates bucketed by degree, only the nodes touched by an insertion are moved
+    candidate_nodes = current_S.non_dominated.to_array()
+    candidates = BucketQueue.from_nodes(
+        current_S.n_nodes, candidate_nodes, degree[candidate_nodes]
+    )
+
+    while len(candidates) > 0:
+        max_degree = candidates.max_key()
+        min_degree = candidates.min_key()
+
+        threshold = max_degree - alpha * (max_degree - min_degree)
+        v = candidates.choice_at_least(threshold, rng)
 
-            if current_S.G_info[u][Index.DEGREE] > 0:
-                current_S.G_info[u][Index.DEGREE] -= 1
+        newly_dominated = add_to_solution(current_S, v, update_degree=True)
 
-            if current_S.G_info[u][Index.K] == 0 and u not in current_S.S:
-                current_S.dominated.add(u)
-                current_S.non_dominated.discard(u)
-                for w in G[u]:
-                    if current_S.G_info[w][Index.DEGREE] > 0:
-                        current_S.G_info[w][Index.DEGREE] -= 1
+        candidates.remove(v)
+        for u in newly_dominated.tolist():
+            candidates.remove(u)
 
-        current_S.non_dominated.discard(v)
+        touched = graph.neighbors(v)
+        if len(newly_dominated) > 0:
+            touched = np.concatenate((touched, graph.neighbors_of(newly_dominated)))
+        touched = np.unique(touched[non_dominated[touched]])
+        candidates.update_many(touched, degree[touched])
 
     return current_S
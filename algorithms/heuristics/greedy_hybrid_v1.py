@@ -1,5 +1,12 @@
 from algorithms.solution_state import SolutionState, Index
+from algorithms.heuristics.domination import add_to_solution
+from algorithms.heuristics.weighted_rcl import bucket_pseudo_greedy_repair
+from algorithms.utils.bucket_queue import BUCKET_QUEUE_MIN_FRONTIER
+from algorithms.utils.backend import PYTHON, NUMBA
+from typing import Optional
+from algorithms.utils.sampler import pick
 import numpy.random as random
+import numpy as np
 
 
 def calc_weight(dom_value: int, degree: int, n_nodes: int) -> float:
@@ -7,91 +14,73 @@ def calc_weight(dom_value: int, degree: int, n_nodes: int) -> float:
     return factor
 
 
+def calc_weights(dom_values: np.ndarray, degrees: np.ndarray, n_nodes: int) -> np.ndarray:
+    """Vectorized calc_weight over the candidate nodes"""
+    dom_values = dom_values.astype(np.float64)
+    return (dom_values * dom_values) / (n_nodes - degrees)
+
+
 def greedy_repair(current_S: SolutionState) -> SolutionState:
-    G = current_S.G
+    K_info = current_S.G_info.column(Index.K)
+    degree = current_S.G_info.column(Index.DEGREE)
+    weight = current_S.G_info.column(Index.WEIGHT)
 
     while len(current_S.non_dominated) > 0:
-        v = next(iter(current_S.non_dominated))
-
-        if len(current_S.non_dominated) > 0:
-            for u in current_S.non_dominated:
-                current_S.G_info[u][Index.WEIGHT] = calc_weight(
-                    int(current_S.G_info[u][Index.K]),
-                    int(current_S.G_info[u][Index.DEGREE]),
-                    len(current_S.non_dominated),
-                )
-                if (
-                    current_S.G_info[u][Index.WEIGHT]
-                    > current_S.G_info[v][Index.WEIGHT]
-                ):
-                    v = u
-
-        current_S.S.add(v)
-
-        for u in G[v]:
-            # dominate the neighbors of V
-            current_S.G_info[u][Index.K] -= 1
-
-            # update the node degree as the edge between U and V is no longer relevant
-            if current_S.G_info[u][Index.DEGREE] > 0:
-                current_S.G_info[u][Index.DEGREE] -= 1
-
-            # discard u, update the node degree between u and its neightboors, as u is no longer relevant
-            if current_S.G_info[u][Index.K] == 0 and u not in current_S.S:
-                current_S.dominated.add(u)
-                current_S.non_dominated.discard(u)
-                for w in G[u]:
-                    # update the node degree as the edge between U and W is no longer relevant
-                    if current_S.G_info[w][Index.DEGREE] > 0:
-                        current_S.G_info[w][Index.DEGREE] -= 1
-
-        current_S.non_dominated.discard(v)
+        candidates = current_S.non_dominated.to_array()
+        weight[candidates] = candidate_weights = calc_weights(
+            K_info[candidates], degree[candidates], len(candidates)
+        )
+        v = int(candidates[np.argmax(candidate_weights)])
+
+        add_to_solution(current_S, v, update_degree=True)
 
     return current_S
 
 
 def pseudo_greedy_repair(
-    current_S: SolutionState, alpha: float, rng: random.Generator = random.default_rng()
+    current_S: SolutionState,
+    alpha: float,
+    rng: random.Generator = random.default_rng(),
+    use_bucket_queue: Optional[bool] = None,
+    backend: str = PYTHON,
 ) -> SolutionState:
-    G = current_S.G
+    """
+    Small frontiers are rescanned with numpy on every step, from BUCKET_QUEUE_MIN_FRONTIER nodes
+    on (or with use_bucket_queue) the candidates are kept incrementally, see weighted_rcl.
+    The numba backend rescans them in a compiled loop unless the bucket queue is asked for
+    """
+    if backend == NUMBA and not use_bucket_queue:
+        from algorithms.heuristics import kernels
+
+        return kernels.pseudo_greedy_repair(
+            current_S, alpha, rng, kernels.HYBRID_DOMINATED_RCL
+        )
+
+    if use_bucket_queue is None:
+        use_bucket_queue = len(current_S.non_dominated) >= BUCKET_QUEUE_MIN_FRONTIER
+    if use_bucket_queue:
+        return bucket_pseudo_greedy_repair(current_S, alpha, rng, calc_weight)
+
+    K_info = current_S.G_info.column(Index.K)
+    degree = current_S.G_info.column(Index.DEGREE)
+    weight = current_S.G_info.column(Index.WEIGHT)
 
     while len(current_S.non_dominated) > 0:
 
-        candidate_nodes = {}
-        for u in current_S.non_dominated:
-            candidate_nodes[u] = current_S.G_info[u][Index.WEIGHT] = calc_weight(
-                int(current_S.G_info[u][Index.K]),
-                int(current_S.G_info[u][Index.DEGREE]),
-                len(current_S.non_dominated),
-            )
+        candidate_nodes = current_S.non_dominated.to_array()
+        candidate_weights = calc_weights(
+            K_info[candidate_nodes], degree[candidate_nodes], len(candidate_nodes)
+        )
+        weight[candidate_nodes] = candidate_weights
 
-        max_weight = max(candidate_nodes.values())
-        min_weight = min(candidate_nodes.values())
+        max_weight = candidate_weights.max()
+        min_weight = candidate_weights.min()
 
         threshold = max_weight - alpha * (max_weight - min_weight)
-        RCL = [u for u, w in candidate_nodes.items() if w >= threshold]
-
-        v = rng.choice(RCL)
-
-        current_S.S.add(v)
-
-        for u in G[v]:
-            # dominate the neighbors of V
-            current_S.G_info[u][Index.K] -= 1
-
-            # update the node degree as the edge between U and V is no longer relevant
-            if current_S.G_info[u][Index.DEGREE] > 0:
-                current_S.G_info[u][Index.DEGREE] -= 1
+        RCL = candidate_nodes[candidate_weights >= threshold]
 
-            # discard u, update the node degree between u and its neightboors, as u is no longer relevant
-            if current_S.G_info[u][Index.K] == 0 and u not in current_S.S:
-                current_S.dominated.add(u)
-                current_S.non_dominated.discard(u)
-                for w in G[u]:
-                    # update the node degree as the edge between U and W is no longer relevant
-                    if current_S.G_info[w][Index.DEGREE] > 0:
-                        current_S.G_info[w][Index.DEGREE] -= 1
+        v = int(pick(rng, RCL))
 
-        current_S.non_dominated.discard(v)
+        add_to_solution(current_S, v, update_degree=True)
 
     return current_S
@@ -1,62 +1,52 @@
 from algorithms.solution_state import SolutionState, Index
+from algorithms.heuristics.domination import add_to_solution
+from algorithms.utils.backend import PYTHON, NUMBA
+from algorithms.utils.sampler import pick
 import numpy.random as random
+import numpy as np
 
 
 def greedy_repair(curr_S: SolutionState) -> SolutionState:
-    G = curr_S.G
+    K_info = curr_S.G_info.column(Index.K)
 
     # main loop
     while len(curr_S.non_dominated) > 0:
-        v = next(iter(curr_S.non_dominated))
-
         # select the least dominated node
-        for u in curr_S.non_dominated:
-            if curr_S.G_info[u][Index.K] > curr_S.G_info[v][Index.K]:
-                v = u
+        candidates = curr_S.non_dominated.to_array()
+        v = int(candidates[np.argmax(K_info[candidates])])
 
         # add the vertex to the solution
-        curr_S.S.add(v)
-
-        for u in G[v]:
-            # dominate the neighboors of V
-            curr_S.G_info[u][Index.K] -= 1
-
-            # if u is dominated, discard it
-            if curr_S.G_info[u][Index.K] == 0 and u not in curr_S.S:
-                curr_S.dominated.add(u)
-                curr_S.non_dominated.discard(u)
-
-        curr_S.non_dominated.discard(v)
+        add_to_solution(curr_S, v)
 
     return curr_S
 
 
 def pseudo_greedy_repair(
-    curr_S: SolutionState, alpha: float, rng: random.Generator = random.default_rng()
+    curr_S: SolutionState,
+    alpha: float,
+    rng: random.Generator = random.default_rng(),
+    backend: str = PYTHON,
 ) -> SolutionState:
-    G = curr_S.G
+    if backend == NUMBA:
+        from algorithms.heuristics import kernels
+
+        return kernels.pseudo_greedy_repair(
+            curr_S, alpha, rng, kernels.LEAST_DOMINATED_RCL
+        )
+
+    K_info = curr_S.G_info.column(Index.K)
 
     # main loop
     while len(curr_S.non_dominated) > 0:
-        candidate_nodes = {u: curr_S.G_info[u][Index.K] for u in curr_S.non_dominated}
-        max_K = max(candidate_nodes.values())
+        candidate_nodes = curr_S.non_dominated.to_array()
+        candidate_K = K_info[candidate_nodes]
+        max_K = candidate_K.max()
         min_K = 1
 
         threshold = max_K - alpha * (max_K - min_K)
-        RCL = [u for u, k in candidate_nodes.items() if k >= threshold]
-        v = rng.choice(RCL)
-
-        curr_S.S.add(v)
-
-        for u in G[v]:
-            # dominate the neighboors of V
-            curr_S.G_info[u][Index.K] -= 1
-
-            # if u is dominated, discard it
-            if curr_S.G_info[u][Index.K] == 0 and u not in curr_S.S:
-                curr_S.dominated.add(u)
-                curr_S.non_dominated.discard(u)
+        RCL = candidate_nodes[candidate_K >= threshold]
+        v = int(pick(rng, RCL))
 
-        curr_S.non_dominated.discard(v)
+        add_to_solution(curr_S, v)
 
     return curr_S
@@ -0,0 +1,291 @@
+"""
+numba compiled versions of the repair, destroy and pruning loops, selected with the numba backend
+(see algorithms.utils.backend). Only imported when that backend runs, as numba is optional.
+
+The kernels work on the raw arrays of a SolutionState and reproduce the python path exactly:
+same candidates in the same (node) order, same thresholds and the same draw from the rng,
+numba shares the state of a numpy Generator and rng.integers(0, n) is what rng.choice uses.
+A buffered RngStream (see algorithms.utils.sampler) hands its next uniforms to the kernel
+instead, which draws int(u * n) as the stream does and reports how many it used.
+The NodeSet masks are written directly, the caller syncs their sizes afterwards
+"""
+from algorithms.solution_state import SolutionState, Index
+from algorithms.utils.sampler import UniformBuffer
+from numba import njit
+import numpy.random as random
+import numpy as np
+
+# RCL criteria of pseudo_greedy_repair
+DEGREE_RCL = 0
+HYBRID_DOMINATED_RCL = 1
+HYBRID_DEGREE_RCL = 2
+LEAST_DOMINATED_RCL = 3
+
+# nogil, so the batched ALNS iterations build their neighbors in parallel threads
+_jit = njit(cache=True, nogil=True, error_model="numpy")
+
+
+@_jit
+def _add_to_solution(
+    indptr, indices, K_info, degree, in_S, non_dominated, dominated, v, update_degree
+):
+    """domination.add_to_solution on the arrays"""
+    in_S[v] = True
+    non_dominated[v] = False
+
+    for i in range(indptr[v], indptr[v + 1]):
+        u = indices[i]
+        K_info[u] -= 1
+        if update_degree and degree[u] > 0:
+            degree[u] -= 1
+
+        if K_info[u] == 0 and not in_S[u]:
+            dominated[u] = True
+            non_dominated[u] = False
+
+            if update_degree:
+                for j in range(indptr[u], indptr[u + 1]):
+                    w = indices[j]
+                    if degree[w] > 0:
+                        degree[w] -= 1
+
+
+@_jit
+def _candidate_scores(criterion, K_info, degree, candidates, n_candidates, scores):
+    for i in range(n_candidates):
+        u = candidates[i]
+        if criterion == DEGREE_RCL:
+            scores[i] = degree[u]
+        elif criterion == LEAST_DOMINATED_RCL:
+            scores[i] = K_info[u]
+        elif criterion == HYBRID_DOMINATED_RCL:
+            dom_value = np.float64(K_info[u])
+            scores[i] = (dom_value * dom_value) / (n_candidates - degree[u])
+        else:
+            denominator = n_candidates - K_info[u]
+            if denominator == 0:
+                denominator = 1
+            node_degree = np.float64(degree[u])
+            scores[i] = (node_degree * node_degree) / denominator
+
+
+@_jit
+def _pseudo_greedy_repair(
+    indptr,
+    indices,
+    K_info,
+    degree,
+    weight,
+    in_S,
+    non_dominated,
+    dominated,
+    criterion,
+    alpha,
+    rng,
+    uniforms,
+):
+    """Returns the number of uniforms used, uniforms is empty when drawing from rng"""
+    update_degree = criterion != LEAST_DOMINATED_RCL
+    write_weight = criterion == HYBRID_DOMINATED_RCL or criterion == HYBRID_DEGREE_RCL
+
+    candidates = np.flatnonzero(non_dominated)
+    scores = np.empty(len(candidates), dtype=np.float64)
+    n_candidates = len(candidates)
+    draws = 0
+
+    while n_candidates > 0:
+        _candidate_scores(criterion, K_info, degree, candidates, n_candidates, scores)
+
+        max_score = scores[0]
+        min_score = scores[0]
+        for i in range(1, n_candidates):
+            max_score = max(max_score, scores[i])
+            min_score = min(min_score, scores[i])
+        if criterion == LEAST_DOMINATED_RCL:
+            min_score = 1.0
+
+        if write_weight:
+            for i in range(n_candidates):
+                weight[candidates[i]] = scores[i]
+
+        threshold = max_score - alpha * (max_score - min_score)
+        RCL_size = 0
+        for i in range(n_candidates):
+            if scores[i] >= threshold:
+                RCL_size += 1
+
+        # the r-th RCL node in node order, as rng.choice(RCL) picks it
+        if len(uniforms) > 0:
+            r = np.int64(uniforms[draws] * RCL_size)
+            draws += 1
+        else:
+            r = rng.integers(0, RCL_size)
+        v = -1
+        for i in range(n_candidates):
+            if scores[i] >= threshold:
+                if r == 0:
+                    v = candidates[i]
+                    break
+                r -= 1
+
+        _add_to_solution(
+            indptr,
+            indices,
+            K_info,
+            degree,
+            in_S,
+            non_dominated,
+            dominated,
+            v,
+            update_degree,
+        )
+
+        # drop the nodes that left the frontier, keeping the node order
+        kept = 0
+        for i in range(n_candidates):
+            u = candidates[i]
+            if non_dominated[u]:
+                candidates[kept] = u
+                kept += 1
+        n_candidates = kept
+
+    return draws
+
+
+@_jit
+def _random_repair(indptr, indices, K_info, in_S, non_dominated, dominated, order):
+    for v in order:
+        if non_dominated[v]:
+            _add_to_solution(
+                indptr, indices, K_info, K_info, in_S, non_dominated, dominated, v, False
+            )
+
+
+@_jit
+def _random_destroy(
+    indptr, indices, K_info, in_S, non_dominated, dominated, to_remove, demand
+):
+    for v in to_remove:
+        in_S[v] = False
+
+    # un-dominate the neighbors once per removed node, K never goes above the node demand
+    for v in to_remove:
+        for i in range(indptr[v], indptr[v + 1]):
+            u = indices[i]
+            K_info[u] = min(K_info[u] + 1, demand[u])
+
+    # removed nodes and their neighbors outside the solution are not dominated while K > 0
+    for v in to_remove:
+        if K_info[v] > 0:
+            dominated[v] = False
+            non_dominated[v] = True
+        for i in range(indptr[v], indptr[v + 1]):
+            u = indices[i]
+            if not in_S[u] and K_info[u] > 0:
+                dominated[u] = False
+                non_dominated[u] = True
+
+    # a removed node that is still dominated by other solution nodes stays dominated
+    for v in to_remove:
+        if K_info[v] <= 0:
+            dominated[v] = True
+
+
+@_jit
+def _prune_redundant(indptr, indices, K_info, in_S, dominated, order):
+    for v in order:
+        if K_info[v] > 0:
+            continue
+
+        removable = True
+        for i in range(indptr[v], indptr[v + 1]):
+            u = indices[i]
+            if not in_S[u] and K_info[u] > -1:
+                removable = False
+                break
+        if not removable:
+            continue
+
+        in_S[v] = False
+        dominated[v] = True
+        for i in range(indptr[v], indptr[v + 1]):
+            K_info[indices[i]] += 1
+
+
+def _sync_sizes(current_S: SolutionState) -> None:
+    current_S.S.sync_size()
+    current_S.non_dominated.sync_size()
+    current_S.dominated.sync_size()
+
+
+def pseudo_greedy_repair(
+    current_S: SolutionState, alpha: float, rng: random.Generator, criterion: int
+) -> SolutionState:
+    G_info = current_S.G_info
+    # every pick adds a frontier node, so a repair draws at most len(non_dominated) times
+    stream = rng if isinstance(rng, UniformBuffer) else None
+    if stream is not None:
+        rng, uniforms = stream.rng, stream.peek(len(current_S.non_dominated))
+    else:
+        uniforms = np.empty(0, dtype=np.float64)
+
+    draws = _pseudo_greedy_repair(
+        current_S.graph.indptr,
+        current_S.graph.indices,
+        G_info.column(Index.K),
+        G_info.column(Index.DEGREE),
+        G_info.column(Index.WEIGHT),
+        current_S.S.mask,
+        current_S.non_dominated.mask,
+        current_S.dominated.mask,
+        criterion,
+        alpha,
+        rng,
+        uniforms,
+    )
+    if stream is not None:
+        stream.advance(draws)
+    _sync_sizes(current_S)
+    return current_S
+
+
+def random_repair(current_S: SolutionState, order: np.ndarray) -> SolutionState:
+    _random_repair(
+        current_S.graph.indptr,
+        current_S.graph.indices,
+        current_S.G_info.column(Index.K),
+        current_S.S.mask,
+        current_S.non_dominated.mask,
+        current_S.dominated.mask,
+        order,
+    )
+    _sync_sizes(current_S)
+    return current_S
+
+
+def random_destroy(current_S: SolutionState, to_remove: np.ndarray) -> SolutionState:
+    _random_destroy(
+        current_S.graph.indptr,
+        current_S.graph.indices,
+        current_S.G_info.column(Index.K),
+        current_S.S.mask,
+        current_S.non_dominated.mask,
+        current_S.dominated.mask,
+        to_remove,
+        current_S.demand,
+    )
+    _sync_sizes(current_S)
+    return current_S
+
+
+def prune_redundant(current_S: SolutionState, order: np.ndarray) -> SolutionState:
+    _prune_redundant(
+        current_S.graph.indptr,
+        current_S.graph.indices,
+        current_S.G_info.column(Index.K),
+        current_S.S.mask,
+        current_S.dominated.mask,
+        order,
+    )
+    _sync_sizes(current_S)
+    return current_S
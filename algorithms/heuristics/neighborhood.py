@@ -0,0 +1,60 @@
+from algorithms.utils.csr_graph import CSRGraph
+import numpy.random as random
+import numpy as np
+
+
+class BallSearch:
+    """
+    Breadth first search over the CSR adjacency of a graph. The visited marks are stamped with
+    the search number, so a search costs the size of the ball it explores and not of the graph.
+    Not thread safe, every operator copy needs its own
+    """
+
+    def __init__(self, graph: CSRGraph):
+        self._graph = graph
+        self._visited = np.zeros(graph.n_nodes, dtype=np.int64)
+        self._position = np.zeros(graph.n_nodes, dtype=np.int64)
+        self._stamp = 0
+
+    @property
+    def graph(self) -> CSRGraph:
+        return self._graph
+
+    def solution_ball(
+        self, in_S: np.ndarray, seed: int, size: int, rng: random.Generator
+    ) -> np.ndarray:
+        """
+        The size solution nodes closest to seed, a random part of the last BFS level when it
+        does not fit. The search jumps to a random solution node not reached yet when the
+        component of seed has fewer than size solution nodes
+        """
+        self._stamp += 1
+        stamp, visited = self._stamp, self._visited
+
+        ball = []
+        missing = size
+        frontier = np.array([seed])
+        visited[seed] = stamp
+        while missing > 0:
+            if len(frontier) == 0:
+                unreached = np.flatnonzero(in_S & (visited != stamp))
+                frontier = np.array([rng.choice(unreached)])
+                visited[frontier] = stamp
+
+            level = frontier[in_S[frontier]]
+            if len(level) > missing:
+                level = rng.choice(level, size=missing, replace=False)
+            ball.append(level)
+            missing -= len(level)
+
+            neighbors = self._graph.neighbors_of(frontier)
+            frontier = self._first_visits(neighbors[visited[neighbors] != stamp])
+            visited[frontier] = stamp
+
+        return np.concatenate(ball) if ball else np.array([], dtype=np.int64)
+
+    def _first_visits(self, nodes: np.ndarray) -> np.ndarray:
+        """Drops the repeated nodes without sorting, the last write of a node position wins"""
+        positions = np.arange(len(nodes))
+        self._position[nodes] = positions
+        return nodes[self._position[nodes] == positions]
@@ -1,29 +1,30 @@
-from algorithms.solution_state import SolutionState, Index
+from algorithms.solution_state import SolutionState
+from algorithms.heuristics.domination import add_to_solution
+from algorithms.utils.backend import PYTHON, NUMBA
 import numpy.random as random
 
 
 def repair(
-    current_S: SolutionState, rng: random.Generator = random.default_rng()
+    current_S: SolutionState,
+    rng: random.Generator = random.default_rng(),
+    backend: str = PYTHON,
 ) -> SolutionState:
-    G = current_S.G
-
-    # main loop
-    while len(current_S.non_dominated) > 0:
-        v = rng.choice(list(current_S.non_dominated))
-
-        # add the vertex to the solution
-        current_S.S.add(v)
-
-        for u in G[v]:
-
-            # dominate the neighbors of V
-            current_S.G_info[u][Index.K] -= 1
-
-            # discard u
-            if current_S.G_info[u][Index.K] == 0 and u not in current_S.S:
-                current_S.dominated.add(u)
-                current_S.non_dominated.discard(u)
-
-        current_S.non_dominated.discard(v)
+    """
+    Adds random non dominated nodes until every node is dominated.
+    The frontier is shuffled once and walked in that order skipping the nodes dominated meanwhile,
+    the next node still non dominated is a uniform pick among the remaining ones
+    """
+    order = rng.permutation(current_S.non_dominated.to_array())
+    if backend == NUMBA:
+        from algorithms.heuristics import kernels
+
+        return kernels.random_repair(current_S, order)
+
+    non_dominated = current_S.non_dominated.mask
+
+    for v in order.tolist():
+        if non_dominated[v]:
+            # add the vertex to the solution
+            add_to_solution(current_S, v)
 
     return current_S
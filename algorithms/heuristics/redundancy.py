@@ -0,0 +1,55 @@
+from algorithms.solution_state import SolutionState, Index
+from algorithms.utils.backend import PYTHON, NUMBA
+from typing import Optional
+import numpy.random as random
+import numpy as np
+
+
+def removal_order(
+    current_S: SolutionState, rng: Optional[random.Generator] = None
+) -> np.ndarray:
+    """
+    Solution nodes in a random order with rng, otherwise the ones covering the fewest nodes
+    first, as they are the cheapest to lose
+    """
+    nodes = current_S.S.to_array()
+    if rng is not None:
+        return rng.permutation(nodes)
+    return nodes[np.argsort(current_S.graph.degrees[nodes], kind="stable")]
+
+
+def prune_redundant(
+    current_S: SolutionState,
+    rng: Optional[random.Generator] = None,
+    backend: str = PYTHON,
+) -> SolutionState:
+    """
+    Removes the solution nodes that are not needed to keep every node K-dominated.
+    -K_info is the excess coverage of a node, how many solution neighbors it has above its
+    demand, so V can leave the solution when its own excess is >= 0 (it becomes dominated) and
+    every neighbor outside the solution has an excess >= 1, which is O(deg) per node.
+    The nodes are tried once, in removal_order, a removal only lowers the excess of others
+    """
+    order = removal_order(current_S, rng)
+    if backend == NUMBA:
+        from algorithms.heuristics import kernels
+
+        return kernels.prune_redundant(current_S, order)
+
+    graph = current_S.graph
+    K_info = current_S.G_info.column(Index.K)
+    in_S = current_S.S.mask
+
+    for v in order.tolist():
+        if K_info[v] > 0:
+            continue
+
+        neighbors = graph.neighbors(v)
+        if np.any(K_info[neighbors[~in_S[neighbors]]] > -1):
+            continue
+
+        current_S.S.discard(v)
+        current_S.dominated.add(v)
+        K_info[neighbors] += 1
+
+    return current_S
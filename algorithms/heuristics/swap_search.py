@@ -0,0 +1,166 @@
+from algorithms.solution_state import SolutionState, Index
+from typing import Optional
+import numpy.random as random
+import numpy as np
+
+
+class CoverageTables:
+    """
+    Incremental tables over the K counters of a feasible solution, for the swap moves.
+    K_info is the state column itself, -K_info being the excess coverage of a node.
+    loss[v] of a solution node is how many nodes would lose their K-domination without V:
+    V itself when K_info[v] > 0, plus its neighbors outside the solution with K_info == 0.
+    V can leave the solution when loss[v] == 0. Adding or removing a node updates the tables
+    in O(deg) of the node and of the neighbors whose K_info crosses 0
+    """
+
+    def __init__(self, current_S: SolutionState):
+        self._S = current_S
+        self._graph = current_S.graph
+        self.K_info = current_S.G_info.column(Index.K)
+        self.in_S = current_S.S.mask
+
+        graph = self._graph
+        tight = ~self.in_S & (self.K_info == 0)
+        src = np.repeat(np.arange(graph.n_nodes), graph.degrees)
+        self.loss = np.bincount(
+            src[tight[graph.indices]], minlength=graph.n_nodes
+        ) + (self.K_info > 0)
+        self.loss[~self.in_S] = 0
+
+    def removable(self) -> np.ndarray:
+        return np.flatnonzero(self.in_S & (self.loss == 0))
+
+    def freed_by(self, u: int) -> np.ndarray:
+        """
+        Solution nodes that become removable once U is added, without changing the tables:
+        the loss of a solution node drops by one per constraint of it that U covers
+        """
+        graph, K_info, in_S = self._graph, self.K_info, self.in_S
+        neighbors = graph.neighbors(u)
+
+        # U stops being a constraint and its tight neighbors get one dominator to spare
+        tight = neighbors[~in_S[neighbors] & (K_info[neighbors] == 0)]
+        if K_info[u] == 0:
+            tight = np.append(tight, u)
+        relieved = graph.neighbors_of(tight)
+        relieved = relieved[in_S[relieved]]
+
+        # solution neighbors that only missed a single dominator themselves
+        satisfied = neighbors[in_S[neighbors] & (K_info[neighbors] == 1)]
+
+        candidates, drops = np.unique(
+            np.concatenate((relieved, satisfied)), return_counts=True
+        )
+        return candidates[self.loss[candidates] == drops]
+
+    def add(self, u: int) -> None:
+        graph, K_info, in_S, loss = self._graph, self.K_info, self.in_S, self.loss
+        neighbors = graph.neighbors(u)
+
+        if K_info[u] == 0:
+            self._shift_solution_neighbors(np.array([u]), -1)
+        self._S.S.add(u)
+        self._S.dominated.discard(u)
+
+        K_info[neighbors] -= 1
+        outside = ~in_S[neighbors]
+        self._shift_solution_neighbors(neighbors[outside & (K_info[neighbors] == -1)], -1)
+        inside = neighbors[~outside & (K_info[neighbors] == 0)]
+        loss[inside] -= 1
+
+        loss[u] = int(K_info[u] > 0) + np.count_nonzero(
+            ~in_S[neighbors] & (K_info[neighbors] == 0)
+        )
+
+    def remove(self, v: int) -> None:
+        graph, K_info, in_S, loss = self._graph, self.K_info, self.in_S, self.loss
+        neighbors = graph.neighbors(v)
+
+        self._S.S.discard(v)
+        self._S.dominated.add(v)
+        loss[v] = 0
+        if K_info[v] == 0:
+            self._shift_solution_neighbors(np.array([v]), 1)
+
+        K_info[neighbors] += 1
+        outside = ~in_S[neighbors]
+        self._shift_solution_neighbors(neighbors[outside & (K_info[neighbors] == 0)], 1)
+        inside = neighbors[~outside & (K_info[neighbors] == 1)]
+        loss[inside] += 1
+
+    def _shift_solution_neighbors(self, nodes: np.ndarray, delta: int) -> None:
+        """Changes the loss of the solution neighbors of nodes once per shared edge"""
+        if len(nodes) == 0:
+            return
+        neighbors = self._graph.neighbors_of(nodes)
+        np.add.at(self.loss, neighbors[self.in_S[neighbors]], delta)
+
+
+def swap_search(
+    current_S: SolutionState,
+    rng: Optional[random.Generator] = None,
+    max_passes: int = 3,
+    max_swaps: int = 50,
+    tabu_tenure: int = 10,
+) -> SolutionState:
+    """
+    Local search over a feasible solution, in place:
+    - free removals, solution nodes with loss 0
+    - (2,1) moves, adding a node U that frees at least two solution nodes which are then
+      removed while they stay removable, lowering the objective
+    - (1,1) swaps, adding U when it frees a single node, a plateau move that can open new
+      (2,1) moves. At most max_swaps of them, the swapped nodes stay tabu for tabu_tenure
+      moves, which only (2,1) moves can override
+    A pass tries every node outside the solution once, in a random order with rng, the search
+    stops after max_passes or a pass without improvement
+    """
+    tables = CoverageTables(current_S)
+    tabu_until = np.zeros(current_S.n_nodes, dtype=np.int64)
+    rng = rng if rng is not None else random.default_rng()
+    moves = 0
+    swaps = 0
+
+    _remove_free(tables)
+    for _ in range(max_passes):
+        improved = False
+        for u in rng.permutation(np.flatnonzero(~tables.in_S)).tolist():
+            if tables.in_S[u]:
+                continue
+
+            freed = tables.freed_by(u)
+            # a move freeing two nodes is taken even when tabu
+            if len(freed) < 2:
+                if tabu_until[u] > moves or swaps >= max_swaps:
+                    continue
+                freed = freed[tabu_until[freed] <= moves]
+                if len(freed) == 0:
+                    continue
+
+            tables.add(u)
+            removed = []
+            for v in rng.permutation(freed).tolist():
+                if tables.loss[v] == 0:
+                    tables.remove(v)
+                    removed.append(v)
+
+            moves += 1
+            if len(removed) >= 2:
+                improved = True
+            else:
+                swaps += 1
+            tabu_until[u] = moves + tabu_tenure
+            tabu_until[removed] = moves + tabu_tenure
+
+        if not improved:
+            break
+
+    # a swap can leave a freed node behind when another one was picked
+    _remove_free(tables)
+    return current_S
+
+
+def _remove_free(tables: CoverageTables) -> None:
+    for v in tables.removable().tolist():
+        if tables.loss[v] == 0:
+            tables.remove(v)
@@ -0,0 +1,104 @@
+from algorithms.solution_state import SolutionState, Index
+from algorithms.heuristics.domination import add_to_solution
+from algorithms.utils.bucket_queue import GroupedBucketQueue
+from typing import Callable, List, Tuple
+import numpy.random as random
+import numpy as np
+
+WeightFunction = Callable[[int, int, int], float]
+
+
+def bucket_pseudo_greedy_repair(
+    current_S: SolutionState,
+    alpha: float,
+    rng: random.Generator,
+    calc_weight: WeightFunction,
+) -> SolutionState:
+    """
+    Pseudo greedy repair on calc_weight(K, DEGREE, len(non_dominated)) without recomputing
+    the weight of every candidate on each step.
+    The candidates are grouped by K and bucketed by DEGREE, inside a group the weight only
+    depends on DEGREE and the frontier size, and is monotone on DEGREE. So the frontier size
+    is applied when querying: each group is evaluated at its extreme degrees to get the
+    threshold, and the RCL is walked bucket by bucket from the best end of each group.
+    Only the nodes touched by an insertion are moved, the WEIGHT of a node is written when it
+    is chosen
+    """
+    graph = current_S.graph
+    K_info = current_S.G_info.column(Index.K)
+    degree = current_S.G_info.column(Index.DEGREE)
+    weight = current_S.G_info.column(Index.WEIGHT)
+    non_dominated = current_S.non_dominated.mask
+
+    candidate_nodes = current_S.non_dominated.to_array()
+    candidates = GroupedBucketQueue.from_nodes(
+        current_S.n_nodes,
+        candidate_nodes,
+        K_info[candidate_nodes],
+        degree[candidate_nodes],
+    )
+
+    while len(candidates) > 0:
+        v, weight[v] = _choose_from_rcl(candidates, alpha, rng, calc_weight)
+
+        newly_dominated = add_to_solution(current_S, v, update_degree=True)
+
+        candidates.remove(v)
+        for u in newly_dominated.tolist():
+            candidates.remove(u)
+
+        touched = graph.neighbors(v)
+        if len(newly_dominated) > 0:
+            touched = np.concatenate((touched, graph.neighbors_of(newly_dominated)))
+        touched = np.unique(touched[non_dominated[touched]])
+        candidates.update_many(touched, K_info[touched], degree[touched])
+
+    return current_S
+
+
+def _choose_from_rcl(
+    candidates: GroupedBucketQueue,
+    alpha: float,
+    rng: random.Generator,
+    calc_weight: WeightFunction,
+) -> Tuple[int, float]:
+    n_nodes = len(candidates)
+
+    # the best and worst degree of a group give its weight range
+    groups = []
+    for dom_value, queue in candidates.groups():
+        top, bottom = queue.max_key(), queue.min_key()
+        top_weight = calc_weight(dom_value, top, n_nodes)
+        bottom_weight = calc_weight(dom_value, bottom, n_nodes)
+        groups.append((dom_value, queue, top, bottom, top_weight, bottom_weight))
+
+    max_weight = max(max(group[4], group[5]) for group in groups)
+    min_weight = min(min(group[4], group[5]) for group in groups)
+    threshold = max_weight - alpha * (max_weight - min_weight)
+
+    RCL: List[Tuple[List[int], float]] = []
+    RCL_size = 0
+    for dom_value, queue, top, bottom, top_weight, bottom_weight in groups:
+        for key in _keys_from_best(top, bottom, top_weight >= bottom_weight):
+            bucket = queue.bucket(key)
+            if not bucket:
+                continue
+            bucket_weight = calc_weight(dom_value, key, n_nodes)
+            if bucket_weight < threshold:
+                break
+            RCL.append((bucket, bucket_weight))
+            RCL_size += len(bucket)
+
+    r = int(rng.integers(RCL_size))
+    for bucket, bucket_weight in RCL:
+        if r < len(bucket):
+            return bucket[r], bucket_weight
+        r -= len(bucket)
+
+    raise IndexError("Empty RCL")
+
+
+def _keys_from_best(top: int, bottom: int, increasing: bool) -> range:
+    if increasing:
+        return range(top, bottom - 1, -1)
+    return range(bottom, top + 1)
@@ -1,10 +1,11 @@
-from typing import List, Dict, Callable
+from typing import List, Dict, Callable, Optional
 
-from algorithms.alns.lns import LNS
+from algorithms.alns.LNS import LNS
 from algorithms.alns.stop.stop_condition import StopCondition, Interrupt
 from algorithms.alns.acept_criterion.simulated_annealing import SimulatedAnnealing
 from algorithms.alns.operators.operator_registry import OPERATOR_REGISTRY
 from algorithms.alns.operators.operator_strategy import OperatorContext
+from algorithms.utils.backend import AUTO
 
 import numpy as np
 
@@ -36,12 +37,13 @@ def get_config(destroy_operator: str, repair_operator: str) -> Dict:
     return config
 
 
-def setup_lns(config) -> LNS:
-    rng = np.random.default_rng()
+def setup_lns(config, rng: Optional[np.random.Generator] = None) -> LNS:
+    rng = np.random.default_rng() if rng is None else rng
     context = OperatorContext(
         rng=rng,
         greedy_alpha=config["greedy_alpha"],
         destroy_factor=config["destroy_factor"],
+        backend=config.get("backend", AUTO),
     )
     # destroy operators
     d_op = OPERATOR_REGISTRY[config["destroy_operator"]].get_instance_from_context(
@@ -2,10 +2,16 @@ import os
 import argparse
 import objgraph
 import algorithms.utils.metrics_logger as metrics_logger
-from algorithms.runner.lns.lns_commom import setup_lns, get_config
-from algorithms.alns.lns import LNS
-from algorithms.solution_state import SolutionState
-import numpy.random as random
+from algorithms.runner.LNS.lns_commom import setup_lns, get_config
+from algorithms.runner.parallel_runner import (
+    create_jobs,
+    run_jobs,
+    best_run,
+    list_instances,
+)
+from algorithms.alns.LNS import LNS
+from typing import List, Optional
+import numpy as np
 
 
 from algorithms.alns.operators.repair_operators import (
@@ -19,48 +25,51 @@ from algorithms.alns.operators.repair_operators import (
 from algorithms.alns.operators.destroy_operators.random_destroy import RandomDestroy
 
 
-def run_lns_metrics(config, k, folder, runs):
-    algorithm_name = LNS.__name__
-    metrics_folder = metrics_logger.create_folder(
-        algorithm_name,
-        folder,
-        "all",
-        k,
-        config["destroy_operator"],
-        config["repair_operator"],
-    )
-    metrics_logger.add_config_file(config, folder=metrics_folder)
-
-    for filename in os.listdir(folder):
-        instance = os.path.join(folder, filename)
-        initial_S = SolutionState(instance, k)
-        lns = setup_lns(config)
+def run_lns_metrics(config, k, folder, runs, workers=None, seed=None):
+    run_lns_sweep(config, [k], folder, runs, workers, seed)
 
-        instance_results = []
-        best_run_value = float("inf")
-        best_run_progression_metric = {}
 
-        for _ in range(runs):
-            copy_S = initial_S.copy()
-            solution = lns.execute(copy_S)
-            run_results = {
-                "objective_value": len(solution.S),
-                "runtime": lns.stats.get_runtime_duration(),
-                "time_to_best": lns.stats.get_last_time_to_best()[2],
-                "iteration_to_best": lns.stats.get_last_time_to_best()[1],
-            }
-            instance_results.append(run_results)
-            if run_results["objective_value"] < best_run_value:
-                best_run_value = run_results["objective_value"]
-                best_run_progression_metric = lns.stats.get_metrics()
+def run_lns_sweep(
+    config,
+    K_values: List[int],
+    folder: str,
+    runs: int,
+    workers: Optional[int] = None,
+    seed: Optional[int] = None,
+):
+    """
+    Runs every (K, instance, run) of the folder over a process pool and logs each K
+    like the serial runner did, the seed used is saved with the config
+    """
+    algorithm_name = LNS.__name__
+    seed = np.random.SeedSequence(seed).entropy
+    instances = list_instances(folder)
 
-            lns.reset(random.default_rng())
+    jobs = create_jobs(setup_lns, config, instances, K_values, runs, seed)
+    results = run_jobs(jobs, workers)
 
-        metrics_logger.add_progression_log(
-            metrics_folder, filename, best_run_progression_metric, algorithm_name
+    for k in K_values:
+        metrics_folder = metrics_logger.create_folder(
+            algorithm_name,
+            folder,
+            "all",
+            k,
+            config["destroy_operator"],
+            config["repair_operator"],
         )
-        row_data = metrics_logger.eval_instance_results(filename, instance_results)
-        metrics_logger.add_metrics(metrics_folder, row_data)
+        metrics_logger.add_config_file({**config, "seed": seed}, folder=metrics_folder)
+
+        for instance in instances:
+            filename = os.path.basename(instance)
+            run_results = results[(instance, k)]
+
+            metrics_logger.add_progression_log(
+                metrics_folder, filename, best_run(run_results).metrics, algorithm_name
+            )
+            row_data = metrics_logger.eval_instance_results(
+                filename, [run_result.results for run_result in run_results]
+            )
+            metrics_logger.add_metrics(metrics_folder, row_data)
 
 
 import pprint
@@ -81,6 +90,5 @@ if __name__ == "__main__":
             print(
                 f"\n\nOPERATORS:  DESTROY:{destroy_operator_name} REPAIR:{repair_operator_name}\n\n"
             )
-            for K in K_values:
-                print(f"\n\nINITIALIZING FOR K ={K}\n\n")
-                run_lns_metrics(config, K, instances_path, 3)
+            print(f"\n\nINITIALIZING FOR K ={K_values}\n\n")
+            run_lns_sweep(config, K_values, instances_path, 3)
@@ -1,9 +1,21 @@
-from typing import List, Dict, Callable
+from typing import List, Dict, Callable, Optional
 
-from algorithms.alns.alns import ALNS
+from algorithms.alns.ALNS import ALNS
 from algorithms.alns.stop.stop_condition import StopCondition, Interrupt
 from algorithms.alns.select.roulette_wheel import RouletteWheelSelect
+from algorithms.alns.select.select_strategy import SelectStrategy
+from algorithms.alns.select.ucb_select import UCB1Select
+from algorithms.alns.select.thompson_select import ThompsonSelect
+from algorithms.alns.select.epsilon_greedy import EpsilonGreedySelect
+from algorithms.alns.acept_criterion.accept_strategy import AcceptStrategy
 from algorithms.alns.acept_criterion.simulated_annealing import SimulatedAnnealing
+from algorithms.alns.acept_criterion.late_acceptance import LateAcceptance
+from algorithms.alns.acept_criterion.record_to_record import RecordToRecordTravel
+from algorithms.alns.acept_criterion.threshold_accepting import ThresholdAccepting
+from algorithms.alns.acept_criterion.great_deluge import GreatDeluge
+from algorithms.alns.local_search.swap_local_search import SwapLocalSearch
+from algorithms.utils.backend import AUTO, PYTHON
+from algorithms.utils.sampler import RngStream
 
 import numpy as np
 
@@ -13,9 +25,15 @@ from algorithms.alns.operators.repair_operators import (
     GreedyHybridDominatedOperator,
     GreedyHybridDegreeOperator,
     RandomRepair,
+    RedundancyPruning,
 )
 
-from algorithms.alns.operators.destroy_operators.random_destroy import RandomDestroy
+from algorithms.alns.operators.destroy_operators import (
+    RandomDestroy,
+    BallDestroy,
+    WorstRegionDestroy,
+    RedundantCoverageDestroy,
+)
 
 
 schema = [
@@ -34,6 +52,26 @@ schema = [
     ("reward_new_accepted", int, 0),
     ("reward_accepted", int, 32),
     ("reward_rejected", int, 0),
+    ("history_length", int, 10),
+    ("record_deviation", float, 0.01),
+    ("initial_threshold", float, 2.0),
+    ("final_threshold", float, 0.0),
+    ("threshold_decay", float, 0.999),
+    ("deluge_tolerance", float, 0.05),
+    ("rain_speed", float, 0.1),
+    ("warmup_iterations", int, 100),
+    ("target_acceptance", float, 0.1),
+    ("final_acceptance", float, 0.001),
+]
+
+
+SELECT_STRATEGIES = ["roulette_wheel", "ucb1", "thompson", "epsilon_greedy"]
+ACCEPT_STRATEGIES = [
+    "simulated_annealing",
+    "late_acceptance",
+    "record_to_record",
+    "threshold_accepting",
+    "great_deluge",
 ]
 
 
@@ -47,6 +85,18 @@ def get_config_from_args(args):
             config[key] = getattr(args, key)
 
     config["outcome_rewards"] = reward_list
+    config["preprocess"] = getattr(args, "preprocess", False)
+    config["redundancy_pruning"] = getattr(args, "redundancy_pruning", False)
+    config["swap_search"] = getattr(args, "swap_search", False)
+    config["neighborhood_destroy"] = getattr(args, "neighborhood_destroy", False)
+    config["select"] = getattr(args, "select", "roulette_wheel")
+    config["accept"] = getattr(args, "accept", "simulated_annealing")
+    config["auto_temperature"] = getattr(args, "auto_temperature", False)
+    # short command line evaluations skip the numba import and JIT cache load of AUTO
+    config["backend"] = getattr(args, "backend", PYTHON)
+    config["rng_stream"] = getattr(args, "rng_stream", True)
+    config["batch_size"] = getattr(args, "batch_size", 1)
+    config["workers"] = getattr(args, "workers", None)
     config["repair_operators"] = [
         RandomRepair.name,
         GreedyDegreeOperator.name,
@@ -71,6 +121,16 @@ def get_config() -> Dict:
         "segment_length": 303,
         "reaction_factor": 0.8744,
         "outcome_rewards": [72, 0, 12, 0, 32, 0],
+        "history_length": 10,
+        "record_deviation": 0.01,
+        "initial_threshold": 2.0,
+        "final_threshold": 0.0,
+        "threshold_decay": 0.999,
+        "deluge_tolerance": 0.05,
+        "rain_speed": 0.1,
+        "warmup_iterations": 100,
+        "target_acceptance": 0.1,
+        "final_acceptance": 0.001,
     }
 
     config["repair_operators"] = [
@@ -85,19 +145,95 @@ def get_config() -> Dict:
     return config
 
 
-def setup_alns(config) -> ALNS:
-    rng = np.random.default_rng()
+def get_select_strategy(
+    config: Dict, num_destroy_op: int, num_repair_op: int, rng: np.random.Generator
+) -> SelectStrategy:
+    """config["select"] is one of SELECT_STRATEGIES, the segmented roulette wheel by default"""
+    select = config.get("select", "roulette_wheel")
+    rewards = config["outcome_rewards"]
+    if select == "roulette_wheel":
+        return RouletteWheelSelect(
+            num_destroy_op=num_destroy_op,
+            num_repair_op=num_repair_op,
+            segment_lenght=config["segment_length"],
+            reaction_factor=config["reaction_factor"],
+            outcome_rewards=rewards,
+            rng=rng,
+        )
+    if select == "ucb1":
+        return UCB1Select(num_destroy_op, num_repair_op, rewards, rng=rng)
+    if select == "thompson":
+        return ThompsonSelect(num_destroy_op, num_repair_op, rewards, rng=rng)
+    if select == "epsilon_greedy":
+        return EpsilonGreedySelect(num_destroy_op, num_repair_op, rewards, rng=rng)
+    raise ValueError(f"Unknown select strategy {select}, expected one of {SELECT_STRATEGIES}")
+
+
+def get_accept_strategy(
+    config: Dict, rng: np.random.Generator, stop: Optional[StopCondition] = None
+) -> AcceptStrategy:
+    """
+    config["accept"] is one of ACCEPT_STRATEGIES, simulated annealing by default.
+    With config["auto_temperature"] the annealing schedule is calibrated on a warm-up and
+    spread over the budget of stop
+    """
+    accept = config.get("accept", "simulated_annealing")
+    if accept == "simulated_annealing":
+        auto = config.get("auto_temperature", False)
+        return SimulatedAnnealing(
+            initial_temperature=config["initial_temperature"],
+            final_temperature=config["final_temperature"],
+            cooling_rate=config["cooling_rate"],
+            rng=rng,
+            warmup=config["warmup_iterations"] if auto else 0,
+            target_acceptance=config["target_acceptance"],
+            final_acceptance=config["final_acceptance"],
+            stop=stop,
+        )
+    if accept == "late_acceptance":
+        return LateAcceptance(config["history_length"])
+    if accept == "record_to_record":
+        return RecordToRecordTravel(config["record_deviation"])
+    if accept == "threshold_accepting":
+        return ThresholdAccepting(
+            config["initial_threshold"],
+            config["final_threshold"],
+            config["threshold_decay"],
+        )
+    if accept == "great_deluge":
+        return GreatDeluge(config["deluge_tolerance"], config["rain_speed"])
+    raise ValueError(f"Unknown accept strategy {accept}, expected one of {ACCEPT_STRATEGIES}")
+
+
+def setup_alns(config, rng: Optional[np.random.Generator] = None) -> ALNS:
+    rng = np.random.default_rng() if rng is None else rng
+    if config.get("rng_stream", True):
+        # the components share one buffered stream instead of many small Generator calls
+        rng = RngStream(rng)
+    backend = config.get("backend", AUTO)
     # repair operators
-    random_repair_op = RandomRepair(rng)
-    degree_repair_op = GreedyDegreeOperator(config["greedy_alpha"], rng)
-    least_dom_repair_op = GreedyLeastDominatedOperator(config["greedy_alpha"], rng)
-    hybrid_repair_op_v1 = GreedyHybridDominatedOperator(config["greedy_alpha"], rng)
-    hybrid_repair_op_v2 = GreedyHybridDegreeOperator(config["greedy_alpha"], rng)
+    random_repair_op = RandomRepair(rng, backend)
+    degree_repair_op = GreedyDegreeOperator(config["greedy_alpha"], rng, backend)
+    least_dom_repair_op = GreedyLeastDominatedOperator(
+        config["greedy_alpha"], rng, backend
+    )
+    hybrid_repair_op_v1 = GreedyHybridDominatedOperator(
+        config["greedy_alpha"], rng, backend
+    )
+    hybrid_repair_op_v2 = GreedyHybridDegreeOperator(
+        config["greedy_alpha"], rng, backend
+    )
 
     # destroy operators
-    destroy_op = RandomDestroy(config["destroy_factor"], rng)
+    destroy_op = RandomDestroy(config["destroy_factor"], rng, backend)
 
     d_op_list = [destroy_op]
+    if config.get("neighborhood_destroy", False):
+        d_op_list += [
+            BallDestroy(config["destroy_factor"], rng, backend),
+            WorstRegionDestroy(config["destroy_factor"], rng, backend),
+            RedundantCoverageDestroy(config["destroy_factor"], rng, backend),
+        ]
     r_op_list = [
         random_repair_op,
         degree_repair_op,
@@ -105,6 +241,11 @@ def setup_alns(config) -> ALNS:
         hybrid_repair_op_v1,
         hybrid_repair_op_v2,
     ]
+    if config.get("redundancy_pruning", False):
+        # every repair is followed by the removal of the redundant solution nodes
+        r_op_list = [
+            RedundancyPruning(rng, backend, repair=r_operator) for r_operator in r_op_list
+        ]
 
     # stop condition
     stop_by_iterations = StopCondition(
@@ -112,30 +253,20 @@ def setup_alns(config) -> ALNS:
     )
 
     # acceptance criterion
-    simulated_annealing = SimulatedAnnealing(
-        initial_temperature=config["initial_temperature"],
-        final_temperature=config["final_temperature"],
-        cooling_rate=config["cooling_rate"],
-        rng=rng,
-    )
+    accept = get_accept_strategy(config, rng, stop_by_iterations)
 
     # select strategy
-    seg_roulette_wheel = RouletteWheelSelect(
-        num_destroy_op=len(d_op_list),
-        num_repair_op=len(r_op_list),
-        segment_lenght=config["segment_length"],
-        reaction_factor=config["reaction_factor"],
-        outcome_rewards=config["outcome_rewards"],
-        rng=rng,
-    )
+    select = get_select_strategy(config, len(d_op_list), len(r_op_list), rng)
 
     # initializing ALNS
     alns = ALNS(
         stop=stop_by_iterations,
-        accept=simulated_annealing,
-        select=seg_roulette_wheel,
+        accept=accept,
+        select=select,
         rng=rng,
         track_stats=True,
+        batch_size=config.get("batch_size", 1),
+        workers=config.get("workers"),
     )
 
     # adding the operators
@@ -145,4 +276,7 @@ def setup_alns(config) -> ALNS:
     for r_operator in r_op_list:
         alns.add_repair_operator(r_operator)
 
+    if config.get("swap_search", False):
+        alns.set_intensification(SwapLocalSearch(rng))
+
     return alns
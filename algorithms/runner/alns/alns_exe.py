@@ -1,27 +1,91 @@
 #!/usr/bin/env python3
-from algorithms.runner.alns.alns_commom import schema, setup_alns, get_config_from_args
+from algorithms.runner.alns.alns_commom import (
+    schema,
+    setup_alns,
+    get_config_from_args,
+    SELECT_STRATEGIES,
+    ACCEPT_STRATEGIES,
+)
+from algorithms.utils.backend import BACKENDS, PYTHON
 from algorithms.solution_state import SolutionState
 import argparse
 
 
-def run_alns() -> None:
+def get_parser() -> argparse.ArgumentParser:
     parser = argparse.ArgumentParser()
     parser.add_argument("-f", type=str, required=True, help="Instance file path")
     parser.add_argument("-k", type=int, default=2, help="Value of k")
+    parser.add_argument(
+        "--preprocess", action="store_true", help="Search on the reduced instance"
+    )
+    parser.add_argument(
+        "--redundancy_pruning",
+        action="store_true",
+        help="Remove the redundant solution nodes after every repair",
+    )
+    parser.add_argument(
+        "--swap_search",
+        action="store_true",
+        help="Improve every new best solution with swap moves",
+    )
+    parser.add_argument(
+        "--neighborhood_destroy",
+        action="store_true",
+        help="Add the BFS ball, worst region and redundant coverage destroy operators",
+    )
+    parser.add_argument(
+        "--no_rng_stream",
+        dest="rng_stream",
+        action="store_false",
+        help="Draw from the numpy Generator directly instead of the buffered stream",
+    )
+    parser.add_argument(
+        "--select", choices=SELECT_STRATEGIES, default="roulette_wheel"
+    )
+    parser.add_argument(
+        "--auto_temperature",
+        action="store_true",
+        help="Calibrate the annealing temperatures on a warm-up and the stop budget",
+    )
+    parser.add_argument(
+        "--backend",
+        choices=BACKENDS,
+        default=PYTHON,
+        help="Repair/destroy loops, auto picks numba when installed at a startup cost",
+    )
+    parser.add_argument(
+        "--accept", choices=ACCEPT_STRATEGIES, default="simulated_annealing"
+    )
+    parser.add_argument(
+        "--batch_size",
+        type=int,
+        default=1,
+        help="Operator pairs evaluated per iteration, above 1 they run in a thread pool",
+    )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=None,
+        help="Threads of the batch pool, batch_size by default",
+    )
     for key, caster, default in schema:
         parser.add_argument(f"--{key}", type=caster, default=default)
-    args = parser.parse_args()
+    return parser
+
+
+def run_alns() -> None:
+    args = get_parser().parse_args()
 
     instance = args.f
     k = args.k
 
     config = get_config_from_args(args)
 
-    initial_S = SolutionState(instance, k)
+    initial_S = SolutionState(instance, k, config["preprocess"])
     alns = setup_alns(config)
 
     solution = alns.execute(initial_S)
-    objective_val = len(solution.S)
+    objective_val = solution.original_objective
     alns.clear()
     content = f"instance: {instance} - {k} | result: {objective_val}"
     print(content)
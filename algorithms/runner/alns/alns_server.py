@@ -0,0 +1,277 @@
+#!/usr/bin/env python3
+"""
+Long lived ALNS solver for the irace target-runner.
+Instead of starting python, importing everything and parsing the graph for every evaluation,
+the target-runner sends the evaluation here and a pool of warm worker processes, which keep the
+instances they already loaded, runs it.
+
+Start it from the repository root before irace:
+    python -m algorithms.runner.alns.alns_server --workers 8
+
+Requests are pickled, so only clients holding the authkey are served, see get_authkey.
+Requests are dicts sent through multiprocessing.connection:
+    {"instance": path, "k": int, "params": ["--greedy_alpha", "0.1", ...], "seed": int}
+and are answered with {"objective_value": int} or {"error": message}
+"""
+from multiprocessing import AuthenticationError
+from multiprocessing.connection import (
+    Client,
+    Listener,
+    answer_challenge,
+    deliver_challenge,
+)
+from concurrent.futures import Future, ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import Callable, List, Optional, Tuple
+import argparse
+import os
+import secrets
+import threading
+import traceback
+
+DEFAULT_ADDRESS: Tuple[str, int] = ("localhost", 6340)
+# seconds a connected client has to send its request
+RECEIVE_TIMEOUT = 30
+AUTHKEY_ENV = "MKDSP_ALNS_AUTHKEY"
+AUTHKEY_FILE = os.path.join("~", ".mkdsp_alns_authkey")
+
+
+def get_authkey(create: bool = False) -> bytes:
+    """
+    Secret shared by the server and its clients: MKDSP_ALNS_AUTHKEY when set, otherwise a
+    random key kept in a file only its owner can access, created by the server.
+    Anyone holding the key can run code in the server, since the requests are unpickled
+    """
+    key = os.environ.get(AUTHKEY_ENV)
+    if key:
+        return key.encode()
+
+    path = os.path.expanduser(AUTHKEY_FILE)
+    if create:
+        try:
+            fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o600)
+            with os.fdopen(fd, "w") as file:
+                file.write(secrets.token_hex(32))
+        except FileExistsError:
+            pass
+
+    if os.name == "posix" and os.stat(path).st_mode & 0o077:
+        raise PermissionError(f"{path} must only be accessible by its owner (chmod 600)")
+    with open(path, "r") as file:
+        return file.read().strip().encode()
+
+
+def solve(instance: str, k: int, params: List[str], seed: Optional[int]) -> int:
+    """Runs ALNS with the target-runner parameters, in a pool worker"""
+    import numpy as np
+    from algorithms.runner.alns.alns_exe import get_parser
+    from algorithms.runner.alns.alns_commom import setup_alns, get_config_from_args
+    from algorithms.runner.parallel_runner import ExperimentJob, run_job
+
+    try:
+        args = get_parser().parse_args(["-f", instance, "-k", str(k)] + params)
+    except SystemExit:
+        raise ValueError(f"Invalid parameters: {params}")
+    config = get_config_from_args(args)
+
+    job = ExperimentJob(setup_alns, config, instance, k, 0, np.random.SeedSequence(seed))
+    return run_job(job).results["objective_value"]
+
+
+class WorkerPool:
+    """
+    ProcessPoolExecutor rebuilt when it breaks. A worker that dies (killed, out of memory)
+    breaks the whole pool, its running evaluations fail and every later submit would too
+    """
+
+    def __init__(self, workers: Optional[int] = None):
+        self._workers = workers
+        self._lock = threading.Lock()
+        self._executor = ProcessPoolExecutor(max_workers=workers)
+
+    def submit(self, fn: Callable, *args) -> Future:
+        with self._lock:
+            executor = self._executor
+        try:
+            return executor.submit(fn, *args)
+        except BrokenProcessPool:
+            return self._rebuild(executor).submit(fn, *args)
+
+    def _rebuild(self, broken: ProcessPoolExecutor) -> ProcessPoolExecutor:
+        with self._lock:
+            # only the first of the threads that saw the broken pool replaces it
+            if self._executor is broken:
+                broken.shutdown(wait=False, cancel_futures=True)
+                self._executor = ProcessPoolExecutor(max_workers=self._workers)
+            return self._executor
+
+    def shutdown(self) -> None:
+        with self._lock:
+            self._executor.shutdown()
+
+
+def _answer(connection, future) -> None:
+    try:
+        response = {"objective_value": future.result()}
+    except Exception:
+        _answer_error(connection)
+        return
+
+    try:
+        connection.send(response)
+    except OSError:
+        pass
+    finally:
+        connection.close()
+
+
+def _parse_request(request) -> Tuple[str, int, List[str], Optional[int]]:
+    """Arguments of solve from a request, ValueError when it is malformed"""
+    if not isinstance(request, dict):
+        raise ValueError(f"Expected a dict request, got {type(request).__name__}")
+    try:
+        instance = str(request["instance"])
+        k = int(request["k"])
+        params = [str(param) for param in request.get("params", [])]
+        seed = request.get("seed")
+        seed = None if seed is None else int(seed)
+    except (KeyError, TypeError, ValueError) as error:
+        raise ValueError(f"Invalid request {request!r}: {error!r}")
+    return instance, k, params, seed
+
+
+def _handle(connection, pool: WorkerPool, authkey: bytes, stop: threading.Event, wake) -> None:
+    """
+    One client connection, in its own thread: a client that stalls in the handshake or never
+    sends its request only holds this thread, and a bad request is answered with an error
+    """
+    try:
+        deliver_challenge(connection, authkey)
+        answer_challenge(connection, authkey)
+        if not connection.poll(RECEIVE_TIMEOUT):
+            raise TimeoutError("No request received")
+        request = connection.recv()
+    except (EOFError, OSError, AuthenticationError):
+        connection.close()
+        return
+
+    try:
+        if isinstance(request, dict) and request.get("command") == "shutdown":
+            stop.set()
+            connection.send({"status": "stopping"})
+            connection.close()
+            wake()
+            return
+
+        future = pool.submit(solve, *_parse_request(request))
+    except Exception:
+        _answer_error(connection)
+        return
+
+    future.add_done_callback(lambda future: _answer(connection, future))
+
+
+def _answer_error(connection) -> None:
+    try:
+        connection.send({"error": traceback.format_exc()})
+    except OSError:
+        pass
+    finally:
+        connection.close()
+
+
+def serve(address=DEFAULT_ADDRESS, workers: Optional[int] = None) -> None:
+    stop = threading.Event()
+    authkey = get_authkey(create=True)
+
+    pool = WorkerPool(workers)
+
+    # the handshake is done by the connection threads, the accept loop never waits on a client
+    try:
+        with Listener(address) as listener:
+            print(f"ALNS server listening on {listener.address}", flush=True)
+
+            def wake():
+                # unblocks accept() so the loop sees the stop
+                Client(listener.address).close()
+
+            while not stop.is_set():
+                try:
+                    connection = listener.accept()
+                except OSError:
+                    continue
+
+                if stop.is_set():
+                    connection.close()
+                    break
+
+                threading.Thread(
+                    target=_handle,
+                    args=(connection, pool, authkey, stop, wake),
+                    daemon=True,
+                ).start()
+    finally:
+        pool.shutdown()
+
+
+def _connect(address):
+    """
+    Client connection with the handshake of Client(address, authkey), done after connecting
+    so that no server is a ConnectionRefusedError whatever the state of the authkey
+    """
+    connection = Client(address)
+    try:
+        authkey = get_authkey()
+        answer_challenge(connection, authkey)
+        deliver_challenge(connection, authkey)
+    except BaseException:
+        connection.close()
+        raise
+    return connection
+
+
+def request_solution(
+    instance: str,
+    k: int,
+    params: List[str],
+    seed: Optional[int] = None,
+    address=DEFAULT_ADDRESS,
+) -> int:
+    """
+    Client side, raises ConnectionRefusedError when no server is running, the errors of
+    get_authkey (FileNotFoundError, PermissionError) and AuthenticationError when one is
+    """
+    with _connect(address) as connection:
+        connection.send(
+            {
+                "instance": os.path.abspath(instance),
+                "k": k,
+                "params": params,
+                "seed": seed,
+            }
+        )
+        response = connection.recv()
+
+    if "error" in response:
+        raise RuntimeError(response["error"])
+    return response["objective_value"]
+
+
+def shutdown(address=DEFAULT_ADDRESS) -> None:
+    with _connect(address) as connection:
+        connection.send({"command": "shutdown"})
+        connection.recv()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--host", type=str, default=DEFAULT_ADDRESS[0])
+    parser.add_argument("--port", type=int, default=DEFAULT_ADDRESS[1])
+    parser.add_argument("--workers", type=int, default=None)
+    parser.add_argument("--shutdown", action="store_true")
+    args = parser.parse_args()
+
+    if args.shutdown:
+        shutdown((args.host, args.port))
+    else:
+        serve((args.host, args.port), args.workers)
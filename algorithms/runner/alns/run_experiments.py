@@ -1,54 +1,60 @@
 import os
 import algorithms.utils.metrics_logger as metrics_logger
 from algorithms.runner.alns.alns_commom import setup_alns, get_config
-from algorithms.alns.alns import ALNS
-from algorithms.solution_state import SolutionState
-import numpy.random as random
+from algorithms.runner.parallel_runner import (
+    create_jobs,
+    run_jobs,
+    best_run,
+    list_instances,
+)
+from algorithms.alns.ALNS import ALNS
+from typing import List, Optional
+import numpy as np
+
+
+def run_alns_metrics(config, k, folder, runs, workers=None, seed=None):
+    run_alns_sweep(config, [k], folder, runs, workers, seed)
+
+
+def run_alns_sweep(
+    config,
+    K_values: List[int],
+    folder: str,
+    runs: int,
+    workers: Optional[int] = None,
+    seed: Optional[int] = None,
+):
+    """
+    Runs every (K, instance, run) of the folder over a process pool and logs each K
+    like the serial runner did, the seed used is saved with the config
+    """
+    algorithm_name = ALNS.__name__
+    seed = np.random.SeedSequence(seed).entropy
+    instances = list_instances(folder)
 
+    jobs = create_jobs(setup_alns, config, instances, K_values, runs, seed)
+    results = run_jobs(jobs, workers)
 
-def run_alns_metrics(config, k, folder, runs):
-    algorithm_name = ALNS.__name__
-    metrics_folder = metrics_logger.create_folder(algorithm_name, folder, "all", k)
-    metrics_logger.add_config_file(config, folder=metrics_folder)
-
-    results = {}
-
-    for filename in os.listdir(folder):
-        instance = os.path.join(folder, filename)
-        initial_S = SolutionState(instance, k)
-        alns = setup_alns(config)
-
-        instance_results = []
-        best_run_value = float("inf")
-        best_run_progression_metric = {}
-
-        for _ in range(runs):
-            copy_S = initial_S.copy()
-            solution = alns.execute(copy_S)
-            run_results = {
-                "objective_value": len(solution.S),
-                "runtime": alns.stats.get_runtime_duration(),
-                "time_to_best": alns.stats.get_last_time_to_best()[2],
-                "iteration_to_best": alns.stats.get_last_time_to_best()[1],
-            }
-            instance_results.append(run_results)
-            if run_results["objective_value"] < best_run_value:
-                best_run_value = run_results["objective_value"]
-                best_run_progression_metric = alns.stats.get_metrics()
-
-            alns.reset(random.default_rng())
-
-        metrics_logger.add_progression_log(
-            metrics_folder, filename, best_run_progression_metric, algorithm_name
-        )
-        row_data = metrics_logger.eval_instance_results(filename, instance_results)
-        metrics_logger.add_metrics(metrics_folder, row_data)
+    for k in K_values:
+        metrics_folder = metrics_logger.create_folder(algorithm_name, folder, "all", k)
+        metrics_logger.add_config_file({**config, "seed": seed}, folder=metrics_folder)
+
+        for instance in instances:
+            filename = os.path.basename(instance)
+            run_results = results[(instance, k)]
+
+            metrics_logger.add_progression_log(
+                metrics_folder, filename, best_run(run_results).metrics, algorithm_name
+            )
+            row_data = metrics_logger.eval_instance_results(
+                filename, [run_result.results for run_result in run_results]
+            )
+            metrics_logger.add_metrics(metrics_folder, row_data)
 
 
 if __name__ == "__main__":
     config = get_config()
     instances_path = os.path.join("instances", "cities_small_instances")
     K_values = [1, 2, 4]
-    for K in K_values:
-        print(f"\n\nINITIALIZING FOR K ={K}\n\n")
-        run_alns_metrics(config, K, instances_path, 5)
+    print(f"\n\nINITIALIZING FOR K ={K_values}\n\n")
+    run_alns_sweep(config, K_values, instances_path, 5)
@@ -0,0 +1,78 @@
+#!/usr/bin/env python3
+"""
+Import time of a solver entry point as reported by python -X importtime.
+Run from the repository root:
+    python -m algorithms.runner.import_benchmark
+    python -m algorithms.runner.import_benchmark -m algorithms.runner.alns.alns_exe -r 10
+"""
+from typing import Dict, List, Tuple
+import argparse
+import os
+import subprocess
+import sys
+
+ENTRY_POINT = "algorithms.runner.alns.alns_exe"
+
+# reporting and plotting dependencies, the solve path must not import them
+HEAVY_MODULES = ("pandas", "openpyxl", "pyvis", "matplotlib", "osmnx", "networkx")
+
+
+def measure_import(module: str) -> Tuple[int, Dict[str, int]]:
+    """
+    Imports the module in a fresh interpreter, returns the cumulative import time of the module
+    and the cumulative time of every module imported along with it, in microseconds
+    """
+    env = dict(os.environ)
+    env["PYTHONPATH"] = os.pathsep.join(
+        filter(None, [os.getcwd(), env.get("PYTHONPATH")])
+    )
+    process = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        capture_output=True,
+        text=True,
+        env=env,
+        check=True,
+    )
+
+    # lines look like "import time:  <self us> | <cumulative us> | <indented module name>"
+    cumulative = {}
+    for line in process.stderr.splitlines():
+        if not line.startswith("import time:"):
+            continue
+        _, cumulative_us, name = line[len("import time:") :].split("|")
+        if cumulative_us.strip().isdigit():
+            cumulative[name.strip()] = int(cumulative_us)
+
+    return cumulative[module], cumulative
+
+
+def benchmark(module: str, repeat: int, top: int) -> None:
+    runs: List[Tuple[int, Dict[str, int]]] = [
+        measure_import(module) for _ in range(repeat)
+    ]
+    totals = sorted(total for total, _ in runs)
+    _, fastest = min(runs, key=lambda run: run[0])
+
+    print(
+        f"{module}: min {totals[0] / 1000:.1f}ms | "
+        f"median {totals[len(totals) // 2] / 1000:.1f}ms over {repeat} runs"
+    )
+
+    print("\nslowest imports (cumulative):")
+    slowest = sorted(fastest.items(), key=lambda item: -item[1])
+    for name, cumulative_us in slowest[1 : top + 1]:
+        print(f"{cumulative_us / 1000:10.1f}ms  {name}")
+
+    heavy = [name for name in fastest if name.split(".")[0] in HEAVY_MODULES]
+    if heavy:
+        print(f"\nheavy modules imported: {sorted({name.split('.')[0] for name in heavy})}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("-m", "--module", type=str, default=ENTRY_POINT)
+    parser.add_argument("-r", "--repeat", type=int, default=5)
+    parser.add_argument("-t", "--top", type=int, default=10)
+    args = parser.parse_args()
+
+    benchmark(args.module, args.repeat, args.top)
@@ -0,0 +1,175 @@
+#!/usr/bin/env python3
+"""
+Island model: N ALNS runs of the same instance, one per process, each with its own select
+and accept state. Every migration_interval iterations an island sends the nodes of its best
+solution to the next island of a ring and takes the smallest solution it received, if it beats
+its own best. Only the nodes travel, packed in a BitSet (n_nodes / 8 bytes against 8 bytes
+per node for an index array), every island rebuilds the dominance state locally.
+
+Run from the repository root:
+    python -m algorithms.runner.island_runner -f instances/cities_small_instances/york.txt -k 2 --islands 4
+"""
+from multiprocessing import get_context
+from queue import Empty
+from typing import Dict, List, Optional
+import os
+
+import numpy as np
+
+from algorithms.runner.parallel_runner import SetupFunction
+from algorithms.utils.bitset import BitSet
+
+
+class IslandResult:
+    def __init__(self, island: int, solution: np.ndarray, results: Dict):
+        self.island = island
+        self.solution = solution
+        self.results = results
+
+
+class RingExchange:
+    """Sends to the next island without waiting, keeps the smallest solution received"""
+
+    def __init__(self, inbox, outbox):
+        self._inbox = inbox
+        self._outbox = outbox
+
+    def __call__(self, best: BitSet) -> Optional[BitSet]:
+        self._outbox.put(best)
+
+        migrant = None
+        while True:
+            try:
+                received = self._inbox.get_nowait()
+            except Empty:
+                return migrant
+            if migrant is None or len(received) < len(migrant):
+                migrant = received
+
+
+def _run_island(
+    setup: SetupFunction,
+    config: Dict,
+    instance: str,
+    k: int,
+    island: int,
+    seed: np.random.SeedSequence,
+    migration_interval: int,
+    inbox,
+    outbox,
+    results,
+) -> None:
+    from algorithms.solution_state import SolutionState
+
+    # a finished island stops reading, what is still buffered for it can be dropped
+    outbox.cancel_join_thread()
+
+    alns = setup(config, np.random.default_rng(seed))
+    alns.set_migration(migration_interval, RingExchange(inbox, outbox))
+    solution = alns.execute(
+        SolutionState(instance, k, config.get("preprocess", False))
+    )
+    original_solution = solution.original_solution()
+
+    results.put(
+        IslandResult(
+            island,
+            original_solution,
+            {
+                "objective_value": solution.original_objective,
+                "runtime": alns.stats.get_runtime_duration(),
+                "time_to_best": alns.stats.get_last_time_to_best()[2],
+                "iteration_to_best": alns.stats.get_last_time_to_best()[1],
+            },
+        )
+    )
+
+
+def run_islands(
+    setup: SetupFunction,
+    config: Dict,
+    instance: str,
+    k: int,
+    islands: Optional[int] = None,
+    migration_interval: int = 100,
+    seed: Optional[int] = None,
+) -> List[IslandResult]:
+    """
+    Runs the islands (one per core by default) until their stop condition and returns
+    their results in island order, every island gets a child of the same SeedSequence
+    """
+    islands = islands or os.cpu_count()
+    context = get_context()
+    inboxes = [context.Queue() for _ in range(islands)]
+    results = context.Queue()
+
+    processes = [
+        context.Process(
+            target=_run_island,
+            args=(
+                setup,
+                config,
+                instance,
+                k,
+                island,
+                island_seed,
+                migration_interval,
+                inboxes[island],
+                inboxes[(island + 1) % islands],
+                results,
+            ),
+        )
+        for island, island_seed in enumerate(np.random.SeedSequence(seed).spawn(islands))
+    ]
+    for process in processes:
+        process.start()
+
+    try:
+        island_results = []
+        while len(island_results) < islands:
+            try:
+                island_results.append(results.get(timeout=1))
+            except Empty:
+                failed = [p for p in processes if p.exitcode not in (None, 0)]
+                if failed:
+                    raise RuntimeError(
+                        f"Island process exited with code {failed[0].exitcode}"
+                    )
+    finally:
+        for process in processes:
+            process.join(timeout=5)
+            if process.is_alive():
+                process.terminate()
+
+    return sorted(island_results, key=lambda island_result: island_result.island)
+
+
+def best_island(island_results: List[IslandResult]) -> IslandResult:
+    return min(
+        island_results,
+        key=lambda island_result: island_result.results["objective_value"],
+    )
+
+
+if __name__ == "__main__":
+    from algorithms.runner.alns.alns_exe import get_parser
+    from algorithms.runner.alns.alns_commom import setup_alns, get_config_from_args
+
+    parser = get_parser()
+    parser.add_argument("--islands", type=int, default=None)
+    parser.add_argument("--migration_interval", type=int, default=100)
+    parser.add_argument("--seed", type=int, default=None)
+    args = parser.parse_args()
+
+    island_results = run_islands(
+        setup_alns,
+        get_config_from_args(args),
+        args.f,
+        args.k,
+        args.islands,
+        args.migration_interval,
+        args.seed,
+    )
+    for island_result in island_results:
+        print(f"island {island_result.island} | result: {island_result.results}")
+    print(f"instance: {args.f} - {args.k} | result: {len(best_island(island_results).solution)}")
@@ -0,0 +1,131 @@
+import os
+from concurrent.futures import ProcessPoolExecutor
+from typing import Callable, Dict, List, Optional, Tuple
+
+import numpy as np
+
+from algorithms.solution_state import SolutionState
+from algorithms.utils.graph_reader import INSTANCE_EXTENSIONS
+
+# builds a ready to execute ALNS/LNS from a config and the rng of the run
+SetupFunction = Callable[[Dict, np.random.Generator], object]
+
+
+class ExperimentJob:
+    """A single run of an instance with a given K, seeded by its own SeedSequence"""
+
+    def __init__(
+        self,
+        setup: SetupFunction,
+        config: Dict,
+        instance: str,
+        k: int,
+        run: int,
+        seed: np.random.SeedSequence,
+    ):
+        self.setup = setup
+        self.config = config
+        self.instance = instance
+        self.k = k
+        self.run = run
+        self.seed = seed
+
+
+class RunResult:
+    def __init__(self, instance: str, k: int, run: int, results: Dict, metrics: Dict):
+        self.instance = instance
+        self.k = k
+        self.run = run
+        self.results = results
+        self.metrics = metrics
+
+
+# initial states already loaded by this process, so a worker reads each graph only once
+_initial_states: Dict[Tuple[str, int, bool], SolutionState] = {}
+
+
+def _get_initial_state(instance: str, k: int, preprocess: bool = False) -> SolutionState:
+    key = (instance, k, preprocess)
+    if key not in _initial_states:
+        _initial_states[key] = SolutionState(instance, k, preprocess)
+    return _initial_states[key]
+
+
+def run_job(job: ExperimentJob) -> RunResult:
+    algorithm = job.setup(job.config, np.random.default_rng(job.seed))
+    initial_S = _get_initial_state(
+        job.instance, job.k, job.config.get("preprocess", False)
+    )
+    solution = algorithm.execute(initial_S.copy())
+
+    results = {
+        "objective_value": solution.original_objective,
+        "runtime": algorithm.stats.get_runtime_duration(),
+        "time_to_best": algorithm.stats.get_last_time_to_best()[2],
+        "iteration_to_best": algorithm.stats.get_last_time_to_best()[1],
+    }
+    return RunResult(
+        job.instance, job.k, job.run, results, algorithm.stats.get_metrics()
+    )
+
+
+def list_instances(folder: str) -> List[str]:
+    """
+    Instance files of the folder in a fixed order, so seeds map to the same jobs.
+    Anything else, such as the graph cache folder, is skipped
+    """
+    paths = [os.path.join(folder, filename) for filename in sorted(os.listdir(folder))]
+    return [
+        path
+        for path in paths
+        if os.path.isfile(path) and os.path.splitext(path)[1] in INSTANCE_EXTENSIONS
+    ]
+
+
+def create_jobs(
+    setup: SetupFunction,
+    config: Dict,
+    instances: List[str],
+    K_values: List[int],
+    runs: int,
+    seed: Optional[int] = None,
+) -> List[ExperimentJob]:
+    """
+    One job per (K, instance, run), every job gets a child of the same SeedSequence,
+    the seeds depend only on the job position and not on which worker runs it
+    """
+    keys = [(k, instance) for k in K_values for instance in instances]
+    seeds = np.random.SeedSequence(seed).spawn(len(keys) * runs)
+
+    jobs = []
+    for (k, instance), job_seeds in zip(
+        keys, (seeds[i : i + runs] for i in range(0, len(seeds), runs))
+    ):
+        for run, job_seed in enumerate(job_seeds):
+            jobs.append(ExperimentJob(setup, config, instance, k, run, job_seed))
+    return jobs
+
+
+def run_jobs(
+    jobs: List[ExperimentJob], workers: Optional[int] = None
+) -> Dict[Tuple[str, int], List[RunResult]]:
+    """
+    Runs the jobs over a process pool (all the cores by default, in this process with
+    workers=1) and groups the results by (instance, k) in run order
+    """
+    workers = workers or os.cpu_count()
+    if workers == 1:
+        run_results = [run_job(job) for job in jobs]
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            run_results = list(executor.map(run_job, jobs))
+
+    grouped: Dict[Tuple[str, int], List[RunResult]] = {}
+    for run_result in run_results:
+        grouped.setdefault((run_result.instance, run_result.k), []).append(run_result)
+    return grouped
+
+
+def best_run(run_results: List[RunResult]) -> RunResult:
+    """First run with the smallest solution, as picked by the serial runners"""
+    return min(run_results, key=lambda run_result: run_result.results["objective_value"])
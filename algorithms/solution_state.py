@@ -1,7 +1,11 @@
-from networkx import Graph
-from typing import Set, List
+from typing import Iterable, Iterator, List, Set
+from collections.abc import MutableSet
 from algorithms.utils.graph_reader import read_graph
+from algorithms.utils.csr_graph import CSRGraph
+from algorithms.utils.reduction import Reduction, reduce_graph
+from algorithms.utils.bitset import BitSet
 from enum import IntEnum
+import numpy as np
 import copy
 
 
@@ -11,37 +15,260 @@ class Index(IntEnum):
     WEIGHT = 2
 
 
+INFO_DTYPES = {
+    Index.K: np.int32,
+    Index.DEGREE: np.int32,
+    Index.WEIGHT: np.float32,
+}
+
+
+class NodeSet(MutableSet):
+    """
+    Set of graph nodes backed by a boolean mask with one entry per node.
+    Behaves like a python set, while the mask can be used directly for vectorized updates
+    """
+
+    def __init__(self, n_nodes: int, nodes: Iterable[int] = ()):
+        self._mask = np.zeros(n_nodes, dtype=np.bool_)
+        self._size = 0
+        for node in nodes:
+            self.add(node)
+
+    @classmethod
+    def from_mask(cls, mask: np.ndarray) -> "NodeSet":
+        new = cls.__new__(cls)
+        new._mask = mask
+        new._size = int(np.count_nonzero(mask))
+        return new
+
+    @classmethod
+    def from_bitset(cls, bitset: BitSet) -> "NodeSet":
+        return cls.from_mask(bitset.to_mask())
+
+    @classmethod
+    def _from_iterable(cls, iterable: Iterable[int]) -> Set[int]:
+        # set algebra with anything but a NodeSet results in a plain python set
+        return set(iterable)
+
+    def to_bitset(self) -> BitSet:
+        """Packed copy of the set, 1/8 of the mask size"""
+        return BitSet.from_mask(self._mask)
+
+    def __or__(self, other):
+        if isinstance(other, NodeSet):
+            return NodeSet.from_mask(self._mask | other._mask)
+        return super().__or__(other)
+
+    def __and__(self, other):
+        if isinstance(other, NodeSet):
+            return NodeSet.from_mask(self._mask & other._mask)
+        return super().__and__(other)
+
+    def __sub__(self, other):
+        if isinstance(other, NodeSet):
+            return NodeSet.from_mask(self._mask & ~other._mask)
+        return super().__sub__(other)
+
+    def __xor__(self, other):
+        if isinstance(other, NodeSet):
+            return NodeSet.from_mask(self._mask ^ other._mask)
+        return super().__xor__(other)
+
+    def isdisjoint(self, other) -> bool:
+        if isinstance(other, NodeSet):
+            return not np.any(self._mask & other._mask)
+        return super().isdisjoint(other)
+
+    @property
+    def mask(self) -> np.ndarray:
+        return self._mask
+
+    def __contains__(self, node) -> bool:
+        return bool(self._mask[node])
+
+    def __iter__(self) -> Iterator[int]:
+        return iter(np.flatnonzero(self._mask).tolist())
+
+    def __len__(self) -> int:
+        return self._size
+
+    def __eq__(self, other) -> bool:
+        if isinstance(other, NodeSet):
+            return self._size == other._size and np.array_equal(self._mask, other._mask)
+        return super().__eq__(other)
+
+    def __repr__(self) -> str:
+        return f"NodeSet({set(self)})"
+
+    def add(self, node: int) -> None:
+        if not self._mask[node]:
+            self._mask[node] = True
+            self._size += 1
+
+    def discard(self, node: int) -> None:
+        if self._mask[node]:
+            self._mask[node] = False
+            self._size -= 1
+
+    def add_many(self, nodes: np.ndarray) -> None:
+        """Adds an array of distinct nodes"""
+        new_nodes = nodes[~self._mask[nodes]]
+        self._mask[new_nodes] = True
+        self._size += len(new_nodes)
+
+    def discard_many(self, nodes: np.ndarray) -> None:
+        """Discards an array of distinct nodes"""
+        old_nodes = nodes[self._mask[nodes]]
+        self._mask[old_nodes] = False
+        self._size -= len(old_nodes)
+
+    def clear(self) -> None:
+        self._mask.fill(False)
+        self._size = 0
+
+    def to_array(self) -> np.ndarray:
+        return np.flatnonzero(self._mask)
+
+    def sync_size(self) -> None:
+        """Recounts the set size after the mask was written directly"""
+        self._size = int(np.count_nonzero(self._mask))
+
+    def copy_from(self, other: "NodeSet") -> None:
+        """Overwrites this set with the content of other, reusing the mask"""
+        np.copyto(self._mask, other._mask)
+        self._size = other._size
+
+    def copy(self) -> "NodeSet":
+        new = NodeSet.__new__(NodeSet)
+        new._mask = self._mask.copy()
+        new._size = self._size
+        return new
+
+
+class NodeInfoRow:
+    """
+    View over the info of a single node, G_info[node][Index.K] reads and writes the K column
+    """
+
+    __slots__ = ("_columns", "_node")
+
+    def __init__(self, columns: List[np.ndarray], node: int):
+        self._columns = columns
+        self._node = node
+
+    def __getitem__(self, index: Index):
+        return self._columns[index][self._node]
+
+    def __setitem__(self, index: Index, value) -> None:
+        self._columns[index][self._node] = value
+
+    def __len__(self) -> int:
+        return len(self._columns)
+
+    def __iter__(self):
+        return (column[self._node].item() for column in self._columns)
+
+    def __eq__(self, other) -> bool:
+        return list(self) == list(other)
+
+    def __repr__(self) -> str:
+        return repr(list(self))
+
+
+class NodeInfo:
+    """
+    Per node info (K, DEGREE, WEIGHT) stored column wise, one contiguous array per Index
+    """
+
+    def __init__(self, n_nodes: int):
+        self._columns: List[np.ndarray] = [
+            np.zeros(n_nodes, dtype=INFO_DTYPES[index]) for index in Index
+        ]
+
+    def column(self, index: Index) -> np.ndarray:
+        return self._columns[index]
+
+    def __len__(self) -> int:
+        return len(self._columns[Index.K])
+
+    def __getitem__(self, node: int) -> NodeInfoRow:
+        return NodeInfoRow(self._columns, node)
+
+    def __iter__(self) -> Iterator[NodeInfoRow]:
+        return (NodeInfoRow(self._columns, node) for node in range(len(self)))
+
+    def copy_from(self, other: "NodeInfo") -> None:
+        """Overwrites every column with the ones of other, reusing the arrays"""
+        for column, other_column in zip(self._columns, other._columns):
+            np.copyto(column, other_column)
+
+    def copy(self) -> "NodeInfo":
+        new = NodeInfo.__new__(NodeInfo)
+        new._columns = [column.copy() for column in self._columns]
+        return new
+
+
 class SolutionState:
 
-    def __init__(self, instance_path: str, K: int):
+    def __init__(self, instance_path: str, K: int, preprocess: bool = False):
+        """
+        With preprocess the search runs on the kernel of the instance (see reduce_graph),
+        where a node may need less than K solution neighbors, original_solution maps back
+        """
         self._K = K
-        self._G: Graph = read_graph(instance_path)
-        self._G_info: List[List[int | float]] = []
-        self._S: Set[int] = set()
-        self._dominated: Set[int] = set()
-        self._non_dominated: Set[int] = set(self._G.nodes())
+        self._graph: CSRGraph = read_graph(instance_path)
+        self._reduction: Reduction = None
+        self._demand = np.full(self._graph.n_nodes, K, dtype=np.int32)
+        if preprocess:
+            self._reduction = reduce_graph(self._graph, K)
+            self._graph = self._reduction.kernel
+            self._demand = self._reduction.demand
+        n_nodes = self._graph.n_nodes
+
+        self._G_info: NodeInfo = None
+        self._S = NodeSet(n_nodes)
+        self._dominated = NodeSet.from_mask(self._demand <= 0)
+        self._non_dominated = NodeSet.from_mask(self._demand > 0)
 
         self.__info_indexes: Set[int] = set()
-        self.__initial_G_info = []
+        self.__initial_G_info: NodeInfo = None
+
+    @property
+    def graph(self) -> CSRGraph:
+        return self._graph
 
     @property
-    def G(self) -> Graph:
-        return self._G
+    def G(self):
+        """networkx view of the graph, the operators work on the CSR graph instead"""
+        return self._graph.to_networkx()
 
     @property
     def K(self) -> int:
         return self._K
 
     @property
-    def S(self) -> Set[int]:
+    def demand(self) -> np.ndarray:
+        """Solution neighbors each node needs, K everywhere unless preprocessed"""
+        return self._demand
+
+    @property
+    def reduction(self) -> Reduction:
+        return self._reduction
+
+    @property
+    def n_nodes(self) -> int:
+        return len(self._S.mask)
+
+    @property
+    def S(self) -> NodeSet:
         return self._S
 
     @property
-    def non_dominated(self) -> Set[int]:
+    def non_dominated(self) -> NodeSet:
         return self._non_dominated
 
     @property
-    def dominated(self) -> Set[int]:
+    def dominated(self) -> NodeSet:
         return self._dominated
 
     @property
@@ -49,20 +276,53 @@ class SolutionState:
         return self.__info_indexes
 
     @property
-    def G_info(self) -> List[List[int | float]]:
+    def G_info(self) -> NodeInfo:
         return self._G_info
 
     @G_info.setter
-    def G_info(self, updated_info: List[List[int | float]]) -> None:
+    def G_info(self, updated_info: NodeInfo) -> None:
         self._G_info = updated_info
 
     @non_dominated.setter
-    def non_dominated(self, non_dominated: Set[int]) -> None:
-        self._non_dominated = non_dominated
+    def non_dominated(self, non_dominated: Iterable[int]) -> None:
+        self._non_dominated = self.__as_node_set(non_dominated)
 
     @dominated.setter
-    def dominated(self, dominated: Set[int]) -> None:
-        self._dominated = dominated
+    def dominated(self, dominated: Iterable[int]) -> None:
+        self._dominated = self.__as_node_set(dominated)
+
+    def __as_node_set(self, nodes: Iterable[int]) -> NodeSet:
+        if isinstance(nodes, NodeSet):
+            return nodes
+        return NodeSet(self.n_nodes, nodes)
+
+    @property
+    def objective(self) -> int:
+        """Size of the solution, the NodeSet keeps it so reading it costs nothing"""
+        return len(self._S)
+
+    @property
+    def original_objective(self) -> int:
+        """
+        Size of the solution in the original instance, forced nodes included,
+        the objective every runner and log reports
+        """
+        if self._reduction is None:
+            return len(self._S)
+        return len(self._S) + len(self._reduction.forced)
+
+    def original_solution(self) -> np.ndarray:
+        """Solution nodes in the original instance, forced nodes included"""
+        if self._reduction is None:
+            return self._S.to_array()
+        return self._reduction.lift(self._S.to_array())
+
+    def is_feasible(self) -> bool:
+        """
+        Every node is in the solution or K-dominated. The non dominated set holds the nodes
+        outside the solution with K > 0 and every operator keeps its size in sync
+        """
+        return len(self._non_dominated) == 0
 
     def add_info_index(self, indexes: List[Index]) -> None:
         self.__info_indexes.update(indexes)
@@ -71,44 +331,66 @@ class SolutionState:
         return not self._S
 
     def is_state_clear(self) -> bool:
-        return not self._S and not self._G_info
+        return not self._S and self._G_info is None
 
     def reset_G_info(self):
-        self.G_info = copy.deepcopy(self.__initial_G_info)
+        self.G_info = self.__initial_G_info.copy()
 
     def init_G_info(self) -> None:
-        if self._G_info:
-            self.reset_G_info
+        if self._G_info is not None:
+            self.reset_G_info()
             return
 
-        for node in self.G.nodes():
-            node_info = [0] * len(self.__info_indexes)
-            if Index.K in self.__info_indexes:
-                node_info[Index.K] = self.K
-            if Index.DEGREE in self.__info_indexes:
-                node_info[Index.DEGREE] = self.G.degree[node]
-            if Index.WEIGHT in self.__info_indexes:
-                node_info[Index.WEIGHT] = 0.0
-
-            self.G_info.append(node_info)
+        G_info = NodeInfo(self.n_nodes)
+        if Index.K in self.__info_indexes:
+            G_info.column(Index.K)[:] = self._demand
+        if Index.DEGREE in self.__info_indexes:
+            G_info.column(Index.DEGREE)[:] = self._graph.degrees
 
-        self.__initial_G_info = copy.deepcopy(self.G_info)
+        self.G_info = G_info
+        self.__initial_G_info = G_info.copy()
 
     def copy(self) -> "SolutionState":
         new = SolutionState.__new__(SolutionState)
 
         new._K = self._K
-        new._G = self._G
+        new._graph = self._graph
+        new._reduction = self._reduction
+        new._demand = self._demand
         new.__info_indexes = self.__info_indexes
         new.__initial_G_info = self.__initial_G_info
 
-        new._G_info = [row[:] for row in self._G_info]
+        new._G_info = None if self._G_info is None else self._G_info.copy()
         new._S = self._S.copy()
         new._dominated = self._dominated.copy()
         new._non_dominated = self._non_dominated.copy()
 
         return new
 
+    def copy_from(self, other: "SolutionState") -> "SolutionState":
+        """
+        Overwrites this state with other, a state of the same graph, reusing the buffers
+        instead of allocating new ones. Returns the state itself
+        """
+        self._K = other._K
+        self._demand = other._demand
+        self._reduction = other._reduction
+        self.__info_indexes = other.__info_indexes
+        self.__initial_G_info = other.__initial_G_info
+
+        if other._G_info is None:
+            self._G_info = None
+        elif self._G_info is None:
+            self._G_info = other._G_info.copy()
+        else:
+            self._G_info.copy_from(other._G_info)
+
+        self._S.copy_from(other._S)
+        self._dominated.copy_from(other._dominated)
+        self._non_dominated.copy_from(other._non_dominated)
+
+        return self
+
 
 if __name__ == "__main__":
     import timeit
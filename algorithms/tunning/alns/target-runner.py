@@ -18,8 +18,24 @@ instance = (
 )
 
 
-command = f"python algorithms/runner/alns/alns_exe.py -f {instance} -k {k_value} {conf_params}"
+def run_on_server():
+    """
+    Evaluates on a running alns_server, None when there is no server to answer.
+    A server that refuses the authkey, or a key file that cannot be read, is an error
+    """
+    from algorithms.runner.alns.alns_server import request_solution
 
-content = str(subprocess.check_output(command, shell=True))
-result = content.split("|")[-1].split(": ")[-1].split("\\")[0]
+    try:
+        return request_solution(instance, int(k_value), sys.argv[6:], int(seed))
+    except ConnectionRefusedError:
+        return None
+
+
+result = run_on_server()
+
+if result is None:
+    command = f"python algorithms/runner/alns/alns_exe.py -f {instance} -k {k_value} {conf_params}"
+
+    content = str(subprocess.check_output(command, shell=True))
+    result = content.split("|")[-1].split(": ")[-1].split("\\")[0]
 print(result)
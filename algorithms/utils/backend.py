@@ -0,0 +1,27 @@
+from importlib.util import find_spec
+import warnings
+
+# backends of the repair/destroy loops, the numba kernels are bit for bit the python path
+PYTHON = "python"
+NUMBA = "numba"
+AUTO = "auto"
+BACKENDS = (PYTHON, NUMBA, AUTO)
+
+NUMBA_AVAILABLE = find_spec("numba") is not None
+
+
+def resolve_backend(backend: str = AUTO) -> str:
+    """
+    Backend that will actually run, AUTO picks numba when it is installed.
+    Asking for numba without it installed falls back to python with a warning
+    """
+    if backend not in BACKENDS:
+        raise ValueError(f"Backend must be one of {BACKENDS}, got {backend!r}")
+
+    if backend == PYTHON:
+        return PYTHON
+    if NUMBA_AVAILABLE:
+        return NUMBA
+    if backend == NUMBA:
+        warnings.warn("numba is not installed, using the python backend")
+    return PYTHON
@@ -0,0 +1,104 @@
+from typing import Iterable, Iterator
+import numpy as np
+
+WORD_BITS = 64
+# little endian words, bit i of word w is node 64 * w + i on every platform
+WORD_DTYPE = np.dtype("<u8")
+
+
+class BitSet:
+    """
+    Set of the nodes 0..n_nodes-1 packed 64 per uint64 word, 1/8 of a boolean mask.
+    Meant for compact snapshots and whole set algebra (|, &, -, ^, popcount) rather than
+    per node updates, where NodeSet and its mask are faster
+    """
+
+    def __init__(self, n_nodes: int, words: np.ndarray = None):
+        self._n_nodes = n_nodes
+        if words is None:
+            words = np.zeros(-(-n_nodes // WORD_BITS), dtype=WORD_DTYPE)
+        self._words = words
+
+    @classmethod
+    def from_mask(cls, mask: np.ndarray) -> "BitSet":
+        packed = np.packbits(mask, bitorder="little")
+        padded = np.zeros(-(-len(packed) // 8) * 8, dtype=np.uint8)
+        padded[: len(packed)] = packed
+        return cls(len(mask), padded.view(WORD_DTYPE))
+
+    @classmethod
+    def from_nodes(cls, n_nodes: int, nodes: Iterable[int]) -> "BitSet":
+        mask = np.zeros(n_nodes, dtype=np.bool_)
+        mask[np.fromiter(nodes, dtype=np.int64)] = True
+        return cls.from_mask(mask)
+
+    @property
+    def n_nodes(self) -> int:
+        return self._n_nodes
+
+    @property
+    def words(self) -> np.ndarray:
+        return self._words
+
+    @property
+    def nbytes(self) -> int:
+        return self._words.nbytes
+
+    def to_mask(self) -> np.ndarray:
+        return np.unpackbits(
+            self._words.view(np.uint8), count=self._n_nodes, bitorder="little"
+        ).view(np.bool_)
+
+    def to_array(self) -> np.ndarray:
+        """Set nodes in increasing order, only the non empty words are unpacked"""
+        nonzero = np.flatnonzero(self._words)
+        bits = np.unpackbits(
+            self._words[nonzero].view(np.uint8), bitorder="little"
+        ).reshape(-1, WORD_BITS)
+        rows, columns = np.nonzero(bits)
+        return nonzero[rows] * WORD_BITS + columns
+
+    def __len__(self) -> int:
+        return int(np.bitwise_count(self._words).sum())
+
+    def __contains__(self, node) -> bool:
+        return bool((int(self._words[node // WORD_BITS]) >> (node % WORD_BITS)) & 1)
+
+    def __iter__(self) -> Iterator[int]:
+        return iter(self.to_array().tolist())
+
+    def __eq__(self, other) -> bool:
+        if not isinstance(other, BitSet):
+            return NotImplemented
+        return self._n_nodes == other._n_nodes and np.array_equal(
+            self._words, other._words
+        )
+
+    def __hash__(self) -> int:
+        return hash((self._n_nodes, self._words.tobytes()))
+
+    def __repr__(self) -> str:
+        return f"BitSet({self.to_array().tolist()})"
+
+    def _combine(self, other: "BitSet", words: np.ndarray) -> "BitSet":
+        if self._n_nodes != other._n_nodes:
+            raise ValueError("Bitsets over a different number of nodes")
+        return BitSet(self._n_nodes, words)
+
+    def __or__(self, other: "BitSet") -> "BitSet":
+        return self._combine(other, self._words | other._words)
+
+    def __and__(self, other: "BitSet") -> "BitSet":
+        return self._combine(other, self._words & other._words)
+
+    def __sub__(self, other: "BitSet") -> "BitSet":
+        return self._combine(other, self._words & ~other._words)
+
+    def __xor__(self, other: "BitSet") -> "BitSet":
+        return self._combine(other, self._words ^ other._words)
+
+    def isdisjoint(self, other: "BitSet") -> bool:
+        return not np.any(self._words & other._words)
+
+    def copy(self) -> "BitSet":
+        return BitSet(self._n_nodes, self._words.copy())
@@ -0,0 +1,244 @@
+from typing import Dict, Iterator, List, Tuple
+import math
+import numpy as np
+import numpy.random as random
+
+# frontier size from which the bucket queues beat rescanning the candidates with numpy,
+# a queue pays python overhead per touched node while a scan is a single vectorized pass
+BUCKET_QUEUE_MIN_FRONTIER = 20_000
+
+
+class BucketQueue:
+    """
+    Priority structure for nodes with small integer keys (degrees, K values).
+    Every key has a bucket holding its nodes, inserting, removing and changing the key of a
+    node are O(1), while the max/min keys are found by moving a pointer over the buckets
+    """
+
+    def __init__(self, n_nodes: int, max_key: int):
+        self._buckets: List[List[int]] = [[] for _ in range(max_key + 1)]
+        self._key = np.full(n_nodes, -1, dtype=np.int64)
+        self._position: List[int] = [-1] * n_nodes
+        self._size = 0
+        self._max = -1
+        self._min = max_key + 1
+
+    @classmethod
+    def from_nodes(
+        cls, n_nodes: int, nodes: np.ndarray, keys: np.ndarray
+    ) -> "BucketQueue":
+        nodes = np.asarray(nodes, dtype=np.int64)
+        keys = np.maximum(np.asarray(keys, dtype=np.int64), 0)
+        max_key = int(keys.max()) if len(keys) > 0 else 0
+        queue = cls(n_nodes, max_key)
+        if len(nodes) == 0:
+            return queue
+
+        # group the nodes by key at once instead of inserting them one by one
+        order = np.argsort(keys, kind="stable")
+        sorted_nodes = nodes[order]
+        bounds = np.searchsorted(keys[order], np.arange(max_key + 2))
+        for key in range(max_key + 1):
+            queue._buckets[key] = sorted_nodes[bounds[key] : bounds[key + 1]].tolist()
+
+        positions = np.empty(len(nodes), dtype=np.int64)
+        positions[order] = np.arange(len(nodes)) - bounds[keys[order]]
+        position = np.asarray(queue._position)
+        position[nodes] = positions
+        queue._position = position.tolist()
+        queue._key[nodes] = keys
+        queue._size = len(nodes)
+        queue._max = max_key
+        queue._min = int(keys.min())
+        return queue
+
+    def __len__(self) -> int:
+        return self._size
+
+    def __contains__(self, node: int) -> bool:
+        return bool(self._key[node] >= 0)
+
+    def key(self, node: int) -> int:
+        return int(self._key[node])
+
+    @property
+    def keys(self) -> np.ndarray:
+        """Key of every node, -1 for the nodes outside the queue"""
+        return self._key
+
+    def insert(self, node: int, key: int) -> None:
+        key = max(key, 0)
+        if key >= len(self._buckets):
+            self._buckets.extend([] for _ in range(key - len(self._buckets) + 1))
+
+        bucket = self._buckets[key]
+        self._key[node] = key
+        self._position[node] = len(bucket)
+        bucket.append(node)
+        self._size += 1
+
+        if key > self._max:
+            self._max = key
+        if key < self._min:
+            self._min = key
+
+    def remove(self, node: int) -> None:
+        key = int(self._key[node])
+        if key < 0:
+            return
+
+        # swap with the last node of the bucket and pop it
+        bucket = self._buckets[key]
+        position = self._position[node]
+        last = bucket.pop()
+        if last != node:
+            bucket[position] = last
+            self._position[last] = position
+
+        self._key[node] = -1
+        self._position[node] = -1
+        self._size -= 1
+
+    def bucket(self, key: int) -> List[int]:
+        """Nodes with exactly this key, must not be modified"""
+        if 0 <= key < len(self._buckets):
+            return self._buckets[key]
+        return []
+
+    def update(self, node: int, key: int) -> None:
+        if self._key[node] == max(key, 0):
+            return
+        self.remove(node)
+        self.insert(node, key)
+
+    def update_many(self, nodes: np.ndarray, keys: np.ndarray) -> None:
+        """
+        Moves the queued nodes among `nodes` to their new keys,
+        nodes outside the queue or whose key did not change are skipped
+        """
+        keys = np.maximum(keys, 0)
+        current = self._key[nodes]
+        moved = (current >= 0) & (current != keys)
+        for node, key in zip(nodes[moved].tolist(), keys[moved].tolist()):
+            self.remove(node)
+            self.insert(node, key)
+
+    def max_key(self) -> int:
+        while self._max >= 0 and not self._buckets[self._max]:
+            self._max -= 1
+        return self._max
+
+    def min_key(self) -> int:
+        while self._min < len(self._buckets) and not self._buckets[self._min]:
+            self._min += 1
+        return self._min
+
+    def count_at_least(self, threshold: float) -> int:
+        return sum(
+            len(self._buckets[key])
+            for key in range(max(math.ceil(threshold), 0), self.max_key() + 1)
+        )
+
+    def nodes_at_least(self, threshold: float) -> List[int]:
+        nodes = []
+        for key in range(max(math.ceil(threshold), 0), self.max_key() + 1):
+            nodes.extend(self._buckets[key])
+        return nodes
+
+    def choice_at_least(self, threshold: float, rng: random.Generator) -> int:
+        """
+        Draws uniformly one of the nodes with key >= threshold,
+        without building the list of candidates
+        """
+        first_key = max(math.ceil(threshold), 0)
+        r = int(rng.integers(self.count_at_least(threshold)))
+        for key in range(first_key, self.max_key() + 1):
+            bucket = self._buckets[key]
+            if r < len(bucket):
+                return bucket[r]
+            r -= len(bucket)
+
+        raise IndexError("No node with key at least the threshold")
+
+
+class GroupedBucketQueue:
+    """
+    Nodes split in groups by a first key (e.g. K), each group being a BucketQueue on a second key
+    (e.g. DEGREE). A score built from both keys that is monotone on the second one inside a group
+    only has to be evaluated at the extremes of every group to find its overall max and min
+    """
+
+    def __init__(self, n_nodes: int):
+        self._n_nodes = n_nodes
+        self._queues: Dict[int, BucketQueue] = {}
+        self._group = np.zeros(n_nodes, dtype=np.int64)
+        self._queued = np.zeros(n_nodes, dtype=np.bool_)
+        self._size = 0
+
+    @classmethod
+    def from_nodes(
+        cls, n_nodes: int, nodes: np.ndarray, groups: np.ndarray, keys: np.ndarray
+    ) -> "GroupedBucketQueue":
+        nodes = np.asarray(nodes, dtype=np.int64)
+        groups = np.asarray(groups, dtype=np.int64)
+        queue = cls(n_nodes)
+        for group in np.unique(groups).tolist():
+            in_group = groups == group
+            queue._queues[group] = BucketQueue.from_nodes(
+                n_nodes, nodes[in_group], keys[in_group]
+            )
+        queue._group[nodes] = groups
+        queue._queued[nodes] = True
+        queue._size = len(nodes)
+        return queue
+
+    def __len__(self) -> int:
+        return self._size
+
+    def __contains__(self, node: int) -> bool:
+        return bool(self._queued[node])
+
+    def groups(self) -> Iterator[Tuple[int, BucketQueue]]:
+        """Non empty groups with their queues"""
+        for group, queue in self._queues.items():
+            if len(queue) > 0:
+                yield group, queue
+
+    def insert(self, node: int, group: int, key: int) -> None:
+        queue = self._queues.get(group)
+        if queue is None:
+            queue = self._queues[group] = BucketQueue(self._n_nodes, max(key, 0))
+        queue.insert(node, key)
+        self._group[node] = group
+        self._queued[node] = True
+        self._size += 1
+
+    def remove(self, node: int) -> None:
+        if not self._queued[node]:
+            return
+        self._queues[int(self._group[node])].remove(node)
+        self._queued[node] = False
+        self._size -= 1
+
+    def update_many(
+        self, nodes: np.ndarray, groups: np.ndarray, keys: np.ndarray
+    ) -> None:
+        """
+        Moves the queued nodes among `nodes` to their new group and key,
+        nodes outside the queue are skipped
+        """
+        queued = self._queued[nodes]
+        nodes, groups, keys = nodes[queued], groups[queued], keys[queued]
+        current = self._group[nodes]
+
+        same_group = current == groups
+        for group in np.unique(groups[same_group]).tolist():
+            in_group = same_group & (groups == group)
+            self._queues[group].update_many(nodes[in_group], keys[in_group])
+
+        moved = ~same_group
+        for node, group, key in zip(
+            nodes[moved].tolist(), groups[moved].tolist(), keys[moved].tolist()
+        ):
+            self.remove(node)
+            self.insert(node, group, key)
@@ -0,0 +1,158 @@
+from typing import Callable, Iterator, Optional
+import numpy as np
+
+
+class CSRGraph:
+    """
+    Undirected graph in compressed sparse row form, the neighbors of v are
+    indices[indptr[v]:indptr[v + 1]]. Nodes are the integers 0..n_nodes-1.
+
+    The graph is immutable, copies of a SolutionState share the same instance
+    """
+
+    def __init__(self, indptr: np.ndarray, indices: np.ndarray):
+        self._indptr = indptr
+        self._indices = indices
+        self._degrees = np.diff(indptr).astype(np.int32)
+        self._nx_graph = None
+        self._two_hop: Optional["CSRGraph"] = None
+        self._two_hop_source: Optional[Callable[[], "CSRGraph"]] = None
+
+    @classmethod
+    def from_edges(cls, n_nodes: int, edges: np.ndarray) -> "CSRGraph":
+        """
+        Builds the graph from an (m, 2) array of edges, each edge may appear in one or both
+        directions, duplicated edges and self loops are dropped
+        """
+        edges = np.asarray(edges, dtype=np.int64).reshape(-1, 2)
+        src = np.concatenate((edges[:, 0], edges[:, 1]))
+        dst = np.concatenate((edges[:, 1], edges[:, 0]))
+
+        keep = src != dst
+        keys = np.unique(src[keep] * n_nodes + dst[keep])
+        src, dst = keys // n_nodes, keys % n_nodes
+
+        indptr = np.zeros(n_nodes + 1, dtype=np.int32)
+        np.cumsum(np.bincount(src, minlength=n_nodes), out=indptr[1:])
+        return cls(indptr, dst.astype(np.int32))
+
+    @property
+    def indptr(self) -> np.ndarray:
+        return self._indptr
+
+    @property
+    def indices(self) -> np.ndarray:
+        return self._indices
+
+    @property
+    def degrees(self) -> np.ndarray:
+        return self._degrees
+
+    @property
+    def n_nodes(self) -> int:
+        return len(self._indptr) - 1
+
+    @property
+    def n_edges(self) -> int:
+        return len(self._indices) // 2
+
+    def __len__(self) -> int:
+        return self.n_nodes
+
+    def nodes(self) -> range:
+        return range(self.n_nodes)
+
+    def neighbors(self, node: int) -> np.ndarray:
+        return self._indices[self._indptr[node] : self._indptr[node + 1]]
+
+    def __getitem__(self, node: int) -> np.ndarray:
+        return self.neighbors(node)
+
+    def neighbors_of(self, nodes: np.ndarray) -> np.ndarray:
+        """
+        Concatenation of the neighbor slices of every node in nodes, a node adjacent to
+        several of them appears once per adjacency
+        """
+        starts = self._indptr[nodes]
+        lengths = self._indptr[np.asarray(nodes) + 1] - starts
+        total = int(lengths.sum())
+        if total == 0:
+            return self._indices[:0]
+
+        offsets = np.cumsum(lengths) - lengths
+        positions = np.arange(total) - np.repeat(offsets - starts, lengths)
+        return self._indices[positions]
+
+    def two_hop(self) -> "CSRGraph":
+        """
+        Index of the nodes at distance 1 or 2 of every node, as a graph, built on first use and
+        kept with the graph, so every state and operator sharing the graph shares it.
+        A graph read from an instance loads it from the instance cache (see graph_reader)
+        """
+        if self._two_hop is None:
+            if self._two_hop_source is not None:
+                self._two_hop = self._two_hop_source()
+            else:
+                self._two_hop = self.build_two_hop()
+        return self._two_hop
+
+    def set_two_hop_source(self, source: Callable[[], "CSRGraph"]) -> None:
+        """source provides the two hop index in place of build_two_hop"""
+        self._two_hop_source = source
+
+    def build_two_hop(self, max_pairs: int = 1 << 24) -> "CSRGraph":
+        """
+        Pairs (v, x) for x in N(w), w in N(v), plus the edges, deduplicated by sorting.
+        Nodes are processed in chunks of about max_pairs pairs (sum of deg(w) over the
+        neighbors w of the chunk) to bound the memory of the intermediate arrays
+        """
+        n_nodes = self.n_nodes
+        src = np.repeat(np.arange(n_nodes, dtype=np.int64), self._degrees)
+        keys = [src * n_nodes + self._indices]
+
+        pairs = np.bincount(src, weights=self._degrees[self._indices], minlength=n_nodes)
+        chunk_of = (np.cumsum(pairs) // max_pairs).astype(np.int64)
+        bounds = np.searchsorted(chunk_of, np.arange(chunk_of[-1] + 2)) if n_nodes else []
+        for start, end in zip(bounds[:-1], bounds[1:]):
+            nodes = np.arange(start, end)
+            neighbors = self.neighbors_of(nodes)
+            owners = np.repeat(np.repeat(nodes, self._degrees[nodes]), self._degrees[neighbors])
+            keys.append(_sorted_unique(owners * n_nodes + self.neighbors_of(neighbors)))
+
+        keys = _sorted_unique(np.concatenate(keys))
+        src, dst = keys // n_nodes, keys % n_nodes
+        keep = src != dst
+        indptr = np.zeros(n_nodes + 1, dtype=np.int32)
+        np.cumsum(np.bincount(src[keep], minlength=n_nodes), out=indptr[1:])
+        return CSRGraph(indptr, dst[keep].astype(np.int32))
+
+    def iter_neighbors(self, node: int) -> Iterator[int]:
+        return iter(self.neighbors(node).tolist())
+
+    def to_networkx(self):
+        """networkx view of the graph, built once on first use"""
+        if self._nx_graph is None:
+            from networkx import Graph
+
+            graph = Graph()
+            graph.add_nodes_from(range(self.n_nodes))
+            src = np.repeat(np.arange(self.n_nodes), self._degrees)
+            upper = src < self._indices
+            graph.add_edges_from(
+                zip(src[upper].tolist(), self._indices[upper].tolist())
+            )
+            self._nx_graph = graph
+
+        return self._nx_graph
+
+    def __deepcopy__(self, memo) -> "CSRGraph":
+        # immutable, shared between deep copies of a state as well
+        return self
+
+
+def _sorted_unique(keys: np.ndarray) -> np.ndarray:
+    """np.unique through a plain sort, much faster than its hash path on large int arrays"""
+    keys = np.sort(keys)
+    if len(keys) == 0:
+        return keys
+    return keys[np.concatenate(([True], keys[1:] != keys[:-1]))]
@@ -1,11 +1,29 @@
-from networkx import Graph
+from algorithms.utils.csr_graph import CSRGraph
+from functools import partial
+import numpy as np
+import glob
 import os
 import pickle
-from corcoran2021.street_network_env import street_network_env
 
 
-def read_graph(file_name: str) -> Graph:
-    g = Graph()
+CACHE_FOLDER = "__graphcache__"
+INSTANCE_EXTENSIONS = (".graph", ".txt")
+
+
+def read_graph(file_name: str, use_cache: bool = True) -> CSRGraph:
+    """
+    Reads an instance as a CSRGraph. The parsed graph is cached in binary form next to
+    the instance and memory mapped on the next reads, so processes loading the same
+    instance share its pages. The cache is tied to the size and mtime of the instance.
+    The two hop index of the graph (CSRGraph.two_hop) is cached the same way, when first used
+    """
+    if use_cache:
+        g = _load_cached_graph(file_name)
+        if g is not None:
+            g.set_two_hop_source(partial(_cached_two_hop, file_name, g))
+            return g
+
+    g = None
     with open(file_name, "r") as file:
         if os.path.splitext(file_name)[1] == ".graph":
             g = _read_test_instance(file)
@@ -13,11 +31,69 @@ def read_graph(file_name: str) -> Graph:
         if os.path.splitext(file_name)[1] == ".txt":
             g = _read_city_instance(file)
 
+    if use_cache and g is not None:
+        _write_cached_graph(file_name, g)
+        g.set_two_hop_source(partial(_cached_two_hop, file_name, g))
+
     return g
 
 
-def _read_test_instance(file) -> Graph:
-    graph = Graph()
+def _cache_path(file_name: str, kind: str = "csr") -> str:
+    stat = os.stat(file_name)
+    folder, name = os.path.split(os.path.abspath(file_name))
+    return os.path.join(
+        folder, CACHE_FOLDER, f"{name}.{stat.st_size}.{stat.st_mtime_ns}.{kind}.npy"
+    )
+
+
+def _cached_two_hop(file_name: str, g: CSRGraph) -> CSRGraph:
+    two_hop = _load_cached_graph(file_name, "2hop")
+    if two_hop is None:
+        two_hop = g.build_two_hop()
+        _write_cached_graph(file_name, two_hop, "2hop")
+    return two_hop
+
+
+def _load_cached_graph(file_name: str, kind: str = "csr"):
+    try:
+        data = np.load(_cache_path(file_name, kind), mmap_mode="r")
+    except (OSError, ValueError):
+        return None
+
+    # layout: [n_nodes, indptr (n_nodes + 1), indices]
+    n_nodes = int(data[0])
+    indptr = np.asarray(data[1 : n_nodes + 2])
+    indices = np.asarray(data[n_nodes + 2 :])
+    return CSRGraph(indptr, indices)
+
+
+def _write_cached_graph(file_name: str, g: CSRGraph, kind: str = "csr") -> None:
+    """Best effort, a read only instance folder just means no cache"""
+    path = _cache_path(file_name, kind)
+    data = np.concatenate(
+        ([g.n_nodes], g.indptr, g.indices), dtype=np.int32, casting="unsafe"
+    )
+
+    try:
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+
+        # written under a unique name and renamed, readers never see a partial file
+        tmp_path = f"{path}.{os.getpid()}.tmp"
+        with open(tmp_path, "wb") as file:
+            np.save(file, data)
+        os.replace(tmp_path, path)
+
+        # caches of previous versions of the instance
+        stale_pattern = glob.escape(os.path.basename(file_name)) + f".*.{kind}.npy"
+        for stale in glob.glob(os.path.join(os.path.dirname(path), stale_pattern)):
+            if stale != path:
+                os.remove(stale)
+    except OSError:
+        pass
+
+
+def _read_test_instance(file) -> CSRGraph:
+    n_nodes = 0
 
     edges = []
     for line in file.readlines():
@@ -27,33 +103,38 @@ def _read_test_instance(file) -> Graph:
             continue
 
         if currentLine[0] == "p":
-            graph.add_nodes_from(range(int(currentLine[-2])))
+            n_nodes = int(currentLine[-2])
             continue
 
         if currentLine[0] == "e":
             u, v = currentLine[-2:]
             edges.append((int(u), int(v)))
 
-    graph.add_edges_from(edges)
-
-    return graph
+    edges = np.array(edges, dtype=np.int64).reshape(-1, 2)
+    return _graph_from_edges(file, n_nodes, edges)
 
 
-def _read_city_instance(file) -> Graph:
-    graph = Graph()
+def _read_city_instance(file) -> CSRGraph:
     first_line = file.readline().strip().split(" ")
     n_nodes, n_edges = [int(_) for _ in first_line]
 
-    graph.add_nodes_from(range(n_nodes))
+    edges = np.array(file.read().split(), dtype=np.int64)
+
+    return _graph_from_edges(file, n_nodes, edges.reshape(-1, 2))
 
-    edges = []
-    for line in file.readlines():
-        u, v = [int(_) for _ in line.strip().split(" ")]
-        edges.append((u, v))
 
-    graph.add_edges_from(edges)
+def _graph_from_edges(file, n_nodes: int, edges: np.ndarray) -> CSRGraph:
+    """
+    The node ids index the CSR arrays, so they are checked first. Ids past the declared node
+    count (e.g. a 1-indexed file) grow the graph to max(id) + 1 nodes, as the networkx
+    reader did, leaving the missing ids as isolated nodes
+    """
+    if len(edges) == 0:
+        return CSRGraph.from_edges(n_nodes, edges)
 
-    return graph
+    if edges.min() < 0:
+        raise ValueError(f"{file.name}: negative node id {edges.min()}")
+    return CSRGraph.from_edges(max(n_nodes, int(edges.max()) + 1), edges)
 
 
 def convert_pickle_to_txt(input_folder, output_folder):
@@ -62,6 +143,9 @@ def convert_pickle_to_txt(input_folder, output_folder):
     O grafo que é transformado é o reachability network (rn)
     No fim reordena os indexes OSM para números contínuos 0..n-1
     """
+    # o pickle precisa da classe, importada aqui por puxar osmnx e matplotlib
+    from corcoran2021.street_network_env import street_network_env
+
     os.makedirs(output_folder, exist_ok=True)
 
     for filename in os.listdir(input_folder):
@@ -5,7 +5,6 @@ from datetime import datetime
 import csv
 import json
 import os
-import pandas as pd
 
 
 def eval_instance_results(instance, results):
@@ -18,7 +17,7 @@ def eval_instance_results(instance, results):
     print(f"\n--- Results for each Run of {instance} ---\n")
     for i, instance_results in enumerate(results, 1):
         pprint.pprint(
-            f"Run {i}: Solution Value: {instance_results["objective_value"]} | TtB: (Time: {instance_results["time_to_best"]:.2f} Iteration: {instance_results["iteration_to_best"]:.0f} | RunTime: {instance_results["runtime"]:.2f}"
+            f"Run {i}: Solution Value: {instance_results['objective_value']} | TtB: (Time: {instance_results['time_to_best']:.2f} Iteration: {instance_results['iteration_to_best']:.0f} | RunTime: {instance_results['runtime']:.2f}"
         )
         solution_values.append(instance_results["objective_value"])
         runtime.append(instance_results["runtime"])
@@ -103,6 +102,8 @@ def add_config_file(config: dict, folder: str):
 
 
 def _add_operators_progression(metrics, metaheuristic_name):
+    import pandas as pd
+
     if metaheuristic_name.lower() == "lns":
         return None
 
@@ -135,6 +136,8 @@ def _add_operators_progression(metrics, metaheuristic_name):
 def add_progression_log(
     base_folder: str, instance_name: str, metrics: dict, metaheuristic_name: str
 ):
+    import pandas as pd
+
     progression_folder = os.path.join(base_folder, "progression")
     os.makedirs(progression_folder, exist_ok=True)
 
@@ -168,6 +171,8 @@ def add_metrics(folder, data):
 
 
 def create_excel_from_results(root_folder):
+    import pandas as pd
+
     output_file = os.path.join(root_folder, "Resultados_Experimentais.xlsx")
 
     writer = pd.ExcelWriter(output_file, engine="openpyxl")
@@ -0,0 +1,151 @@
+from algorithms.utils.csr_graph import CSRGraph
+import numpy as np
+
+
+class Reduction:
+    """
+    Kernel of a k-domination instance, see reduce_graph.
+    kernel node i is the node original_nodes[i] of the original graph and still needs demand[i]
+    solution neighbors (<= 0 when it is already dominated by the forced nodes)
+    """
+
+    def __init__(
+        self,
+        n_original: int,
+        kernel: CSRGraph,
+        original_nodes: np.ndarray,
+        demand: np.ndarray,
+        forced: np.ndarray,
+        twin_class: np.ndarray,
+        dominated_neighborhood: np.ndarray,
+    ):
+        self.n_original = n_original
+        self.kernel = kernel
+        self.original_nodes = original_nodes
+        self.demand = demand
+        self.forced = forced
+        self.twin_class = twin_class
+        self.dominated_neighborhood = dominated_neighborhood
+
+    @property
+    def n_twins(self) -> int:
+        """Kernel nodes with a true twin (same closed neighborhood) of a lower index"""
+        return len(self.twin_class) - len(np.unique(self.twin_class))
+
+    def lift(self, kernel_solution: np.ndarray) -> np.ndarray:
+        """Original nodes of a kernel solution, the forced nodes included"""
+        return np.sort(
+            np.concatenate((self.forced, self.original_nodes[kernel_solution]))
+        )
+
+    def __repr__(self) -> str:
+        return (
+            f"Reduction({self.n_original} -> {self.kernel.n_nodes} nodes, "
+            f"{len(self.forced)} forced, {self.n_twins} twins, "
+            f"{int(self.dominated_neighborhood.sum())} dominated neighborhoods)"
+        )
+
+
+def reduce_graph(graph: CSRGraph, K: int) -> Reduction:
+    """
+    Safe reductions, applied until none changes the instance:
+    - a node that cannot get enough solution neighbors (degree < demand) is forced into
+      every k-dominating set, starting with the nodes of degree < K
+    - a node needing a single dominator with a single candidate neighbor forces that
+      neighbor, as the neighbor dominates everything the node would
+    - forced nodes leave the graph, lowering the demand of their neighbors, and edges
+      between two satisfied nodes (demand <= 0) are dropped, as are satisfied nodes left
+      without neighbors to dominate
+    The kernel also flags true twins and nodes whose closed neighborhood is contained in the
+    one of a neighbor, which are not removed as that is only safe for K = 1
+    """
+    n_nodes = graph.n_nodes
+    src = np.repeat(np.arange(n_nodes), graph.degrees)
+    dst = graph.indices.astype(np.int64)
+
+    demand = np.full(n_nodes, K, dtype=np.int64)
+    forced = np.zeros(n_nodes, dtype=np.bool_)
+    alive = np.ones(n_nodes, dtype=np.bool_)
+
+    while True:
+        # edges that can still change the domination of one of their nodes
+        useful = alive[src] & alive[dst] & ((demand[src] > 0) | (demand[dst] > 0))
+        useful_degree = np.bincount(src[useful], minlength=n_nodes)
+        needs = alive & (demand > 0)
+
+        new_forced = needs & (useful_degree < demand)
+
+        # the single candidate of a leaf, for a pair of leaves only the higher one is taken
+        leaves = needs & ~new_forced & (demand == 1) & (useful_degree == 1)
+        leaf_edges = useful & leaves[src]
+        leaf, target = src[leaf_edges], dst[leaf_edges]
+        keep = ~(leaves[target] & (target < leaf))
+        new_forced[target[keep]] = True
+
+        useless = alive & ~needs & (useful_degree == 0)
+        if not new_forced.any() and not useless.any():
+            break
+
+        forced |= new_forced
+        alive &= ~new_forced & ~useless
+        demand -= np.bincount(dst[new_forced[src]], minlength=n_nodes)
+
+    useful = alive[src] & alive[dst] & ((demand[src] > 0) | (demand[dst] > 0))
+    original_nodes = np.flatnonzero(alive)
+    to_kernel = np.full(n_nodes, -1, dtype=np.int64)
+    to_kernel[original_nodes] = np.arange(len(original_nodes))
+    kernel = CSRGraph.from_edges(
+        len(original_nodes),
+        np.column_stack((to_kernel[src[useful]], to_kernel[dst[useful]])),
+    )
+
+    twin_class, dominated_neighborhood = _closed_neighborhood_flags(kernel)
+    return Reduction(
+        n_nodes,
+        kernel,
+        original_nodes,
+        demand[original_nodes].astype(np.int32),
+        np.flatnonzero(forced),
+        twin_class,
+        dominated_neighborhood,
+    )
+
+
+def _closed_neighborhood_flags(graph: CSRGraph):
+    """
+    twin_class[v] is the lowest node with the same closed neighborhood as v.
+    dominated_neighborhood[v] is set when N[v] is contained in N[w] for a neighbor w,
+    unless w is a twin of v with a higher index, so one node per twin class stays unflagged
+    """
+    n_nodes = graph.n_nodes
+    degrees = graph.degrees
+    twin_class = np.arange(n_nodes)
+    dominated_neighborhood = np.zeros(n_nodes, dtype=np.bool_)
+    in_closed = np.zeros(n_nodes, dtype=np.bool_)
+
+    for v in range(n_nodes):
+        neighbors = graph.neighbors(v)
+        # only a neighbor with at least the same degree can contain N[v]
+        candidates = neighbors[degrees[neighbors] >= degrees[v]]
+        if len(candidates) == 0:
+            continue
+
+        in_closed[neighbors] = True
+        in_closed[v] = True
+        lengths = degrees[candidates]
+        shared = np.add.reduceat(
+            in_closed[graph.neighbors_of(candidates)],
+            np.cumsum(lengths) - lengths,
+            dtype=np.int64,
+        )
+        # N[v] is in N[w] when w sees v and the deg(v) - 1 other neighbors of v
+        contains = shared == degrees[v]
+        twins = contains & (lengths == degrees[v])
+        in_closed[neighbors] = False
+        in_closed[v] = False
+
+        if twins.any():
+            twin_class[v] = min(v, int(candidates[twins].min()))
+        dominated_neighborhood[v] = bool(np.any(contains & ~(twins & (candidates > v))))
+
+    return twin_class, dominated_neighborhood
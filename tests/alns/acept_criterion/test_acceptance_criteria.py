@@ -0,0 +1,132 @@
+import pytest
+
+import numpy.random as random
+from algorithms.alns.enum.alns_enum import Outcome
+from algorithms.alns.acept_criterion.late_acceptance import LateAcceptance
+from algorithms.alns.acept_criterion.record_to_record import RecordToRecordTravel
+from algorithms.alns.acept_criterion.threshold_accepting import ThresholdAccepting
+from algorithms.alns.acept_criterion.great_deluge import GreatDeluge
+from algorithms.runner.alns.alns_commom import (
+    ACCEPT_STRATEGIES,
+    get_accept_strategy,
+    get_config,
+    setup_alns,
+)
+from algorithms.solution_state import SolutionState
+from tests.utils.valid_solution_assertions import assert_valid_state
+
+INSTANCE_PATH = "instances/cities_small_instances/york.txt"
+SEED = 1234
+
+
+class Objective:
+    """The part of a SolutionState read by the acceptance decision"""
+
+    def __init__(self, objective: int):
+        self.objective = objective
+
+    def is_feasible(self) -> bool:
+        return True
+
+    def copy(self) -> "Objective":
+        return Objective(self.objective)
+
+
+def evaluate(accept, best: int, curr: int, new: int) -> Outcome:
+    return accept.evaluate_solution(Objective(best), Objective(curr), Objective(new))[2]
+
+
+@pytest.mark.parametrize(
+    "accept",
+    [
+        LateAcceptance(5),
+        RecordToRecordTravel(0.0),
+        ThresholdAccepting(0.0),
+        GreatDeluge(0.0, 1.0),
+    ],
+)
+def test_accepts_equal_and_better(accept):
+    assert evaluate(accept, 10, 10, 10) == Outcome.ACCEPTED
+    assert evaluate(accept, 5, 10, 8) == Outcome.BETTER
+    assert evaluate(accept, 5, 10, 4) == Outcome.BEST
+
+
+def test_late_acceptance_compares_with_the_history():
+    accept = LateAcceptance(3)
+    # the history starts full of the first current objective
+    assert evaluate(accept, 10, 10, 12) == Outcome.REJECTED
+    for curr in (15, 14):
+        assert evaluate(accept, 10, curr, 16) == Outcome.REJECTED
+
+    # the ring is back at the 10 recorded first, then at 15
+    assert evaluate(accept, 10, 14, 15) == Outcome.REJECTED
+    assert evaluate(accept, 10, 14, 15) == Outcome.ACCEPTED
+    assert accept.history == [14, 15, 14]
+
+    accept.reset()
+    assert evaluate(accept, 20, 20, 21) == Outcome.REJECTED
+
+
+def test_record_to_record_deviation_from_the_best():
+    accept = RecordToRecordTravel(0.1)
+    assert evaluate(accept, 20, 21, 22) == Outcome.ACCEPTED
+    assert evaluate(accept, 20, 21, 23) == Outcome.REJECTED
+    assert accept.record == 20
+
+
+def test_threshold_decays_to_the_final_one():
+    accept = ThresholdAccepting(2.0, 0.5, 0.5)
+    assert accept._accept(10, 12)
+    accept.update_values()
+    assert not accept._accept(10, 12) and accept._accept(10, 11)
+    for _ in range(10):
+        accept.update_values()
+    assert accept.current_threshold == 0.5
+
+    accept.reset()
+    assert accept.current_threshold == 2.0
+
+
+def test_great_deluge_level_drops_to_the_best():
+    accept = GreatDeluge(0.2, 1.0)
+    assert evaluate(accept, 10, 10, 12) == Outcome.ACCEPTED
+    assert accept.level == 12
+    for _ in range(5):
+        accept.update_values()
+    assert accept.level == 10
+    assert evaluate(accept, 10, 12, 11) == Outcome.BETTER
+    assert evaluate(accept, 10, 11, 11) == Outcome.REJECTED
+
+
+@pytest.mark.parametrize(
+    "accept_class, arguments",
+    [
+        (LateAcceptance, (0,)),
+        (RecordToRecordTravel, (-0.1,)),
+        (ThresholdAccepting, (1.0, 2.0)),
+        (ThresholdAccepting, (1.0, 0.0, 1.5)),
+        (GreatDeluge, (0.1, -1.0)),
+    ],
+)
+def test_invalid_parameters(accept_class, arguments):
+    with pytest.raises(ValueError):
+        accept_class(*arguments)
+
+
+@pytest.mark.parametrize("accept", ACCEPT_STRATEGIES)
+def test_alns_runs_with_every_accept_strategy(accept):
+    config = get_config()
+    config["limit"] = 100
+    config["accept"] = accept
+    alns = setup_alns(config, random.default_rng(SEED))
+
+    solution = alns.execute(SolutionState(INSTANCE_PATH, 2))
+
+    assert_valid_state(solution)
+
+
+def test_unknown_accept_strategy():
+    config = get_config()
+    config["accept"] = "tabu"
+    with pytest.raises(ValueError):
+        get_accept_strategy(config, random.default_rng(SEED))
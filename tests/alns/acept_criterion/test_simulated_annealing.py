@@ -1,5 +1,11 @@
+import math
+
 import numpy.random as random
 from algorithms.alns.acept_criterion.simulated_annealing import SimulatedAnnealing
+from algorithms.alns.stop.stop_condition import StopCondition, Interrupt
+from algorithms.runner.alns.alns_commom import setup_alns, get_config
+from algorithms.solution_state import SolutionState
+from tests.utils.valid_solution_assertions import assert_valid_state
 
 
 # Test if new solution is always accepted if it's better than the current solution
@@ -98,3 +104,63 @@ def test_sa_reset_acceptance_behavior_after_reset():
     # Upon reseting the same behavior is expected beucase the temperature is back to its initial value
     sa.reset(rng)
     assert sa._accept(10, 11)
+
+
+def warm_up(sa, deltas):
+    for delta in deltas:
+        sa._accept(10, 10 + delta)
+        sa.update_values()
+
+
+def test_sa_calibrates_on_the_warmup_deltas():
+    stop = StopCondition(Interrupt.BY_ITERATION_LIMIT, 1000)
+    sa = SimulatedAnnealing(
+        62, 0.1, 0.9, random.default_rng(0), warmup=4, target_acceptance=0.5, stop=stop
+    )
+
+    warm_up(sa, [1, 3, -2, 0])
+
+    assert sa.is_calibrated
+    assert math.isclose(sa.initial_temperature, 2 / math.log(2))
+    assert math.isclose(sa.final_temperature, -1 / math.log(0.001))
+    assert math.isclose(sa.current_temperature, sa.initial_temperature)
+    # the final temperature is reached with the iteration budget
+    for _ in range(995):
+        sa.update_values()
+    assert sa.current_temperature > sa.final_temperature
+    sa.update_values()
+    assert math.isclose(sa.current_temperature, sa.final_temperature)
+
+    sa.reset(random.default_rng(0))
+    assert not sa.is_calibrated
+    assert sa.initial_temperature == sa.current_temperature == 62
+
+
+def test_sa_keeps_its_schedule_without_deltas_or_budget():
+    sa = SimulatedAnnealing(62, 0.1, 0.9, random.default_rng(0), warmup=3)
+    warm_up(sa, [-1, 0, -3])
+    assert not sa.is_calibrated and sa.current_temperature == 62
+
+    sa = SimulatedAnnealing(62, 0.1, 0.9, random.default_rng(0), warmup=3)
+    warm_up(sa, [2, 2, 2])
+    assert sa.is_calibrated and sa.cooling_rate == 0.9
+
+
+def test_sa_time_budget_follows_the_warmup_pace():
+    stop = StopCondition(Interrupt.BY_TIMEOUT, 10)
+    stop.init_time()
+    sa = SimulatedAnnealing(62, 0.1, 0.9, random.default_rng(0), warmup=2, stop=stop)
+    warm_up(sa, [1, 2])
+    assert sa.is_calibrated and 0.9 < sa.cooling_rate < 1
+
+
+def test_alns_runs_with_the_calibrated_schedule():
+    config = get_config()
+    config["limit"] = 300
+    config["auto_temperature"] = True
+    alns = setup_alns(config, random.default_rng(1234))
+
+    solution = alns.execute(SolutionState("instances/cities_small_instances/york.txt", 2))
+
+    assert alns.accept.is_calibrated
+    assert_valid_state(solution)
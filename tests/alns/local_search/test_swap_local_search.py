@@ -0,0 +1,89 @@
+import pytest
+
+import numpy as np
+import numpy.random as random
+from algorithms.solution_state import SolutionState
+from algorithms.heuristics.redundancy import prune_redundant
+from algorithms.heuristics.swap_search import CoverageTables, swap_search
+from algorithms.alns.event_handler import Event
+from algorithms.alns.operators.repair_operators import RandomRepair
+from algorithms.runner.alns.alns_commom import setup_alns, get_config
+from algorithms.utils.backend import PYTHON
+from tests.utils.valid_solution_assertions import assert_valid_state
+
+INSTANCE_PATH = "instances/cities_small_instances/york.txt"
+SEED = 1234
+
+
+def repaired_state(K: int) -> SolutionState:
+    S = SolutionState(INSTANCE_PATH, K)
+    operator = RandomRepair(random.default_rng(SEED), PYTHON)
+    operator.init_state_info(S)
+    return prune_redundant(operator.operate(S), random.default_rng(SEED))
+
+
+def assert_tables_match_state(tables: CoverageTables, solution: SolutionState):
+    rebuilt = CoverageTables(solution)
+    in_S = solution.S.mask
+    assert np.array_equal(tables.loss[in_S], rebuilt.loss[in_S])
+
+
+@pytest.mark.parametrize("K", [1, 3])
+def test_tables_follow_the_moves(K):
+    rng = random.default_rng(SEED)
+    S = repaired_state(K)
+    tables = CoverageTables(S)
+
+    for _ in range(30):
+        u = int(rng.choice(np.flatnonzero(~S.S.mask)))
+        tables.add(u)
+        for v in tables.removable().tolist():
+            if v != u and tables.loss[v] == 0:
+                tables.remove(v)
+        assert_tables_match_state(tables, S)
+        assert_valid_state(S)
+
+
+@pytest.mark.parametrize("K", [2])
+def test_freed_nodes_are_the_removable_ones_after_adding(K):
+    S = repaired_state(K)
+    tables = CoverageTables(S)
+    assert len(tables.removable()) == 0
+
+    for u in random.default_rng(SEED).choice(np.flatnonzero(~S.S.mask), 50).tolist():
+        freed = tables.freed_by(u)
+
+        moved = S.copy()
+        moved_tables = CoverageTables(moved)
+        moved_tables.add(u)
+        assert freed.tolist() == [v for v in moved_tables.removable().tolist() if v != u]
+
+
+@pytest.mark.parametrize("K", [1, 2, 4])
+def test_swap_search_improves_a_minimal_solution(K):
+    S = repaired_state(K)
+    size = len(S.S)
+
+    S = swap_search(S, random.default_rng(SEED))
+
+    assert_valid_state(S)
+    assert len(S.S) < size
+    assert len(CoverageTables(S).removable()) == 0
+
+
+def test_intensification_improves_the_best_solution():
+    solutions = {}
+    for swap in (False, True):
+        config = get_config()
+        config["limit"] = 200
+        config["swap_search"] = swap
+        alns = setup_alns(config, random.default_rng(SEED))
+
+        bests = []
+        alns.events.register(Event.ON_BEST, lambda solution, _: bests.append(solution))
+        solutions[swap] = alns.execute(SolutionState(INSTANCE_PATH, 2))
+        assert bests
+
+    # the best copy is refreshed with the improved solution
+    assert len(solutions[True].S) < len(solutions[False].S)
+    assert_valid_state(solutions[True])
@@ -0,0 +1,94 @@
+import pytest
+
+import networkx as nx
+import numpy as np
+import numpy.random as random
+from algorithms.solution_state import SolutionState, Index
+from algorithms.alns.operators.repair_operators import GreedyDegreeOperator, RandomRepair
+from algorithms.alns.operators.destroy_operators import (
+    BallDestroy,
+    WorstRegionDestroy,
+    RedundantCoverageDestroy,
+)
+from algorithms.heuristics.domination import neighborhood_excess
+from algorithms.alns.operators.destroy_operators import redundant_coverage_destroy
+from algorithms.heuristics.neighborhood import BallSearch
+from tests.utils.state_info_assertions import assert_state_equal, init_state_k_only
+
+INSTANCE_PATH = "instances/cities_small_instances/york.txt"
+K = 2
+SEED = 1234
+
+
+def repaired_state() -> SolutionState:
+    S = SolutionState(INSTANCE_PATH, K)
+    repair_op = GreedyDegreeOperator(0.3, random.default_rng(SEED))
+    repair_op.init_state_info(S)
+    return repair_op.operate(S)
+
+
+@pytest.mark.parametrize(
+    "operator_class", [BallDestroy, WorstRegionDestroy, RedundantCoverageDestroy]
+)
+@pytest.mark.parametrize("destroy_factor", [0.1, 0.5])
+def test_destroy_state_consistency(operator_class, destroy_factor):
+    rng = random.default_rng(SEED)
+    S = repaired_state()
+    random_repair_op = RandomRepair(rng)
+    destroy_op = operator_class(destroy_factor, rng)
+
+    for i in range(20):
+        size_before = len(S.S)
+        S_destroyed = destroy_op.operate(S)
+
+        assert len(S_destroyed.S) == size_before - int(destroy_factor * size_before)
+        S_expected = init_state_k_only(S_destroyed)
+        assert_state_equal(S_destroyed, S_expected, i, SEED, [Index.K])
+
+        S = random_repair_op.operate(S_destroyed)
+        assert len(S.non_dominated) == 0
+
+
+@pytest.mark.parametrize("size", [1, 10, 40])
+def test_ball_holds_the_closest_solution_nodes(size):
+    S = repaired_state()
+    seed = int(S.S.to_array()[0])
+    ball = BallSearch(S.graph).solution_ball(
+        S.S.mask, seed, size, random.default_rng(SEED)
+    )
+
+    distance = nx.single_source_shortest_path_length(S.graph.to_networkx(), seed)
+    in_ball = [distance[v] for v in ball.tolist()]
+    outside = [distance[v] for v in S.S if v not in set(ball.tolist()) and v in distance]
+    assert len(set(ball.tolist())) == size
+    assert max(in_ball) <= min(outside)
+
+
+def test_redundant_coverage_removes_the_highest_excess():
+    S = repaired_state()
+    solution = S.S.to_array()
+    excess = dict(zip(solution.tolist(), neighborhood_excess(S, solution).tolist()))
+
+    # a sample large enough to hold the whole solution
+    S = RedundantCoverageDestroy(0.3, random.default_rng(SEED), sample_factor=4).operate(S)
+
+    removed = [excess[v] for v in solution.tolist() if v not in S.S]
+    kept = [excess[v] for v in S.S]
+    assert min(removed) >= max(kept)
+
+
+def test_redundant_coverage_scores_a_sample(monkeypatch):
+    S = repaired_state()
+    solution_size = len(S.S)
+    scored = []
+
+    def recording_excess(current_S, nodes, adjacency=None):
+        scored.append(len(nodes))
+        return neighborhood_excess(current_S, nodes, adjacency)
+
+    monkeypatch.setattr(redundant_coverage_destroy, "neighborhood_excess", recording_excess)
+    S = RedundantCoverageDestroy(0.1, random.default_rng(SEED)).operate(S)
+
+    remove_size = int(0.1 * solution_size)
+    assert len(S.S) == solution_size - remove_size
+    assert scored == [2 * remove_size]
@@ -0,0 +1,39 @@
+import pytest
+
+import numpy.random as random
+from algorithms.solution_state import SolutionState, Index
+from algorithms.alns.operators.repair_operators.greedy_degree import (
+    GreedyDegreeOperator,
+)
+from algorithms.alns.operators.repair_operators.random_repair import RandomRepair
+from algorithms.alns.operators.destroy_operators.random_destroy import RandomDestroy
+from tests.utils.state_info_assertions import assert_state_equal, init_state_k_only
+
+
+@pytest.mark.parametrize("destroy_factor", [0.1, 0.5, 0.9])
+@pytest.mark.parametrize("iterations", [30])
+def test_destroy_state_consistency(destroy_factor, iterations):
+    K = 2
+    INSTANCE_PATH = "instances/cities_small_instances/york.txt"
+    SEED = 1234
+    S = SolutionState(INSTANCE_PATH, K)
+    rng = random.default_rng(SEED)
+
+    repair_op = GreedyDegreeOperator(0.3, rng)
+    random_repair_op = RandomRepair(rng)
+    destroy_op = RandomDestroy(destroy_factor, rng)
+
+    repair_op.init_state_info(S)
+    S = repair_op.operate(S)
+
+    for i in range(iterations):
+        size_before = len(S.S)
+        S_destroyed = destroy_op.operate(S)
+
+        # destroying in a batch must match rebuilding K from the remaining solution
+        assert len(S_destroyed.S) == size_before - int(destroy_factor * size_before)
+        S_expected = init_state_k_only(S_destroyed)
+        assert_state_equal(S_destroyed, S_expected, i, SEED, [Index.K])
+
+        S = random_repair_op.operate(S_destroyed)
+        assert len(S.non_dominated) == 0
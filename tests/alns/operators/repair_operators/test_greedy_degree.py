@@ -6,6 +6,7 @@ from algorithms.alns.operators.repair_operators.greedy_degree import (
     GreedyDegreeOperator,
 )
 from algorithms.alns.operators.repair_operators.random_repair import RandomRepair
+from algorithms.heuristics.greedy_degree import pseudo_greedy_repair
 from algorithms.alns.operators.destroy_operators.random_destroy import RandomDestroy
 from tests.utils.state_info_assertions import assert_state_equal, init_state_k_degree
 from tests.utils.valid_solution_assertions import (
@@ -91,3 +92,30 @@ def test_update_state_consistency(iterations):
             S_updated = random_repair_op.operate(S_destroyed)
 
         S = S_updated
+
+
+@pytest.mark.parametrize("iterations", [30])
+def test_bucket_queue_repair_consistency(iterations):
+    K = 2
+    INSTANCE_PATH = "instances/cities_small_instances/york.txt"
+    DESTROY_FACTOR = 0.5
+    SEED = 1234
+    GREEDY_ALPHA = 0.3
+    S = SolutionState(INSTANCE_PATH, K)
+    rng = random.default_rng(SEED)
+
+    main_operator = GreedyDegreeOperator(GREEDY_ALPHA, rng)
+    destroy_op = RandomDestroy(DESTROY_FACTOR, rng)
+
+    main_operator.init_state_info(S)
+    S = pseudo_greedy_repair(S, GREEDY_ALPHA, rng, use_bucket_queue=True)
+
+    for i in range(iterations):
+        S_updated = main_operator._update_state_info(destroy_op.operate(S))
+
+        # the bucket queue must leave the same state info as a rebuild from scratch
+        S = pseudo_greedy_repair(S_updated, GREEDY_ALPHA, rng, use_bucket_queue=True)
+        S_expected = init_state_k_degree(S)
+
+        assert len(S.non_dominated) == 0
+        assert_state_equal(S, S_expected, i, SEED, [Index.K, Index.DEGREE])
@@ -8,6 +8,7 @@ from algorithms.alns.operators.repair_operators.greedy_hybrid_dom import (
 from tests.utils.valid_solution_assertions import (
     validate_operator_solution_dominates_graph,
     validate_operator_generate_valid_solution,
+    validate_bucket_rcl_matches_scan,
 )
 
 import numpy.random as random
@@ -18,7 +19,11 @@ from tests.utils.state_info_assertions import (
     init_state_k_degree_weight,
 )
 
-from algorithms.heuristics.greedy_hybrid_v1 import calc_weight
+from algorithms.heuristics.greedy_hybrid_v1 import (
+    calc_weight,
+    calc_weights,
+    pseudo_greedy_repair,
+)
 
 
 # Test instances
@@ -98,3 +103,37 @@ def test_update_state_consistency(iterations):
             S_updated = random_repair_op.operate(S_destroyed)
 
         S = S_updated
+
+
+@pytest.mark.parametrize("greedy_alpha", [0, 0.05])
+@pytest.mark.parametrize("instance_path,K", instances[:1])
+def test_bucket_queue_rcl_matches_scan(instance_path, K, greedy_alpha):
+    validate_bucket_rcl_matches_scan(
+        GreedyHybridDominatedOperator, calc_weight, calc_weights, instance_path, K, greedy_alpha
+    )
+
+
+@pytest.mark.parametrize("iterations", [30])
+def test_bucket_queue_repair_consistency(iterations):
+    K = 2
+    INSTANCE_PATH = "instances/cities_small_instances/york.txt"
+    DESTROY_FACTOR = 0.5
+    SEED = 1234
+    GREEDY_ALPHA = 0.3
+    S = SolutionState(INSTANCE_PATH, K)
+    rng = random.default_rng(SEED)
+
+    main_operator = GreedyHybridDominatedOperator(GREEDY_ALPHA, rng)
+    destroy_op = RandomDestroy(DESTROY_FACTOR, rng)
+
+    main_operator.init_state_info(S)
+    S = pseudo_greedy_repair(S, GREEDY_ALPHA, rng, use_bucket_queue=True)
+
+    for i in range(iterations):
+        S_updated = main_operator._update_state_info(destroy_op.operate(S))
+
+        S = pseudo_greedy_repair(S_updated, GREEDY_ALPHA, rng, use_bucket_queue=True)
+        S_expected = init_state_k_degree_weight(S, calc_weight)
+
+        assert len(S.non_dominated) == 0
+        assert_state_equal(S, S_expected, i, SEED, [Index.K, Index.DEGREE])
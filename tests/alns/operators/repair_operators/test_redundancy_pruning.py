@@ -0,0 +1,78 @@
+import pytest
+
+import numpy as np
+import numpy.random as random
+from algorithms.solution_state import SolutionState, Index
+from algorithms.heuristics.redundancy import prune_redundant
+from algorithms.utils.backend import NUMBA_AVAILABLE, PYTHON, NUMBA
+from algorithms.alns.operators.repair_operators import (
+    GreedyDegreeOperator,
+    RandomRepair,
+    RedundancyPruning,
+)
+from algorithms.alns.operators.operator_registry import OPERATOR_REGISTRY
+from tests.utils.valid_solution_assertions import assert_valid_state
+
+INSTANCE_PATH = "instances/cities_small_instances/york.txt"
+SEED = 1234
+
+
+def removable_nodes(solution: SolutionState):
+    K_info = solution.G_info.column(Index.K)
+    in_S = solution.S.mask
+    return [
+        v
+        for v in solution.S
+        if K_info[v] <= 0
+        and np.all(K_info[[u for u in solution.graph.neighbors(v) if not in_S[u]]] <= -1)
+    ]
+
+
+def repaired_state(K: int) -> SolutionState:
+    S = SolutionState(INSTANCE_PATH, K)
+    operator = RandomRepair(random.default_rng(SEED), PYTHON)
+    operator.init_state_info(S)
+    return operator.operate(S)
+
+
+@pytest.mark.parametrize("K", [2, 4])
+@pytest.mark.parametrize("rng", [None, random.default_rng(SEED)])
+def test_pruned_solution_has_no_redundant_node(K, rng):
+    S = repaired_state(K)
+    size = len(S.S)
+    assert removable_nodes(S)
+
+    S = prune_redundant(S, rng)
+
+    assert_valid_state(S)
+    assert len(S.S) < size
+    assert removable_nodes(S) == []
+
+
+@pytest.mark.skipif(not NUMBA_AVAILABLE, reason="numba is not installed")
+@pytest.mark.parametrize("K", [1, 3])
+def test_numba_pruning_matches_python(K):
+    S_python = prune_redundant(repaired_state(K), random.default_rng(SEED), PYTHON)
+    S_numba = prune_redundant(repaired_state(K), random.default_rng(SEED), NUMBA)
+
+    assert S_python.S == S_numba.S
+    assert S_python.dominated == S_numba.dominated
+    assert np.array_equal(
+        S_python.G_info.column(Index.K), S_numba.G_info.column(Index.K)
+    )
+
+
+def test_pruning_as_a_post_step_of_a_repair():
+    rng = random.default_rng(SEED)
+    greedy = GreedyDegreeOperator(0.3, rng, PYTHON)
+    operator = RedundancyPruning(rng, PYTHON, repair=greedy)
+    assert operator.name == f"{greedy.name}_pruned"
+    assert operator.info_indexes == greedy.info_indexes
+    assert OPERATOR_REGISTRY[RedundancyPruning.name] is RedundancyPruning
+
+    S = SolutionState(INSTANCE_PATH, 2)
+    operator.init_state_info(S)
+    S = operator.operate(S)
+
+    assert_valid_state(S)
+    assert removable_nodes(S) == []
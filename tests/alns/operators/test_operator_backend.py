@@ -0,0 +1,98 @@
+import pytest
+import warnings
+
+import numpy as np
+import numpy.random as random
+from algorithms.solution_state import SolutionState, Index
+from algorithms.alns.operators.operator_strategy import OperatorContext
+from algorithms.alns.operators.repair_operators import (
+    GreedyDegreeOperator,
+    GreedyLeastDominatedOperator,
+    GreedyHybridDominatedOperator,
+    GreedyHybridDegreeOperator,
+    RandomRepair,
+)
+from algorithms.alns.operators.destroy_operators.random_destroy import RandomDestroy
+from algorithms.utils import backend as backend_module
+from algorithms.utils.backend import PYTHON, NUMBA, AUTO, resolve_backend
+
+
+def test_resolve_backend():
+    assert resolve_backend(PYTHON) == PYTHON
+    assert resolve_backend(AUTO) == (
+        NUMBA if backend_module.NUMBA_AVAILABLE else PYTHON
+    )
+    with pytest.raises(ValueError):
+        resolve_backend("cuda")
+
+
+def test_numba_falls_back_to_python_when_missing(monkeypatch):
+    monkeypatch.setattr(backend_module, "NUMBA_AVAILABLE", False)
+
+    with pytest.warns(UserWarning):
+        assert resolve_backend(NUMBA) == PYTHON
+    with warnings.catch_warnings():
+        warnings.simplefilter("error")
+        assert resolve_backend(AUTO) == PYTHON
+
+
+@pytest.mark.parametrize(
+    "operator_class",
+    [
+        RandomRepair,
+        GreedyDegreeOperator,
+        GreedyLeastDominatedOperator,
+        GreedyHybridDominatedOperator,
+        GreedyHybridDegreeOperator,
+    ],
+)
+@pytest.mark.parametrize("iterations", [20])
+def test_numba_backend_matches_python(operator_class, iterations):
+    pytest.importorskip("numba")
+
+    K = 2
+    INSTANCE_PATH = "instances/cities_small_instances/york.txt"
+    SEED = 1234
+    initial_S = SolutionState(INSTANCE_PATH, K)
+
+    # the same seed must give the same states, draw by draw
+    states = {}
+    for backend in (PYTHON, NUMBA):
+        context = OperatorContext(
+            rng=random.default_rng(SEED),
+            greedy_alpha=0.3,
+            destroy_factor=0.3,
+            backend=backend,
+        )
+        repair_op = operator_class.get_instance_from_context(context)
+        destroy_op = RandomDestroy.get_instance_from_context(context)
+
+        S = initial_S.copy()
+        repair_op.init_state_info(S)
+        S = repair_op.operate(S)
+        history = []
+        for _ in range(iterations):
+            S = repair_op.operate(destroy_op.operate(S))
+            history.append(S.copy())
+        states[backend] = history
+
+    for i, (S_python, S_numba) in enumerate(zip(states[PYTHON], states[NUMBA])):
+        assert S_numba.S == S_python.S, f"[FAIL] Solution sets differ at iteration {i}"
+        assert S_numba.dominated == S_python.dominated
+        assert S_numba.non_dominated == S_python.non_dominated
+        for index in Index:
+            assert np.array_equal(
+                S_numba.G_info.column(index), S_python.G_info.column(index)
+            ), f"[FAIL] {index.name} differs at iteration {i}"
+
+
+@pytest.mark.parametrize(
+    "arguments, expected",
+    [([], PYTHON), (["--backend", NUMBA], NUMBA), (["--backend", AUTO], AUTO)],
+)
+def test_command_line_backend(arguments, expected):
+    from algorithms.runner.alns.alns_exe import get_parser
+    from algorithms.runner.alns.alns_commom import get_config_from_args
+
+    args = get_parser().parse_args(["-f", "instance.txt"] + arguments)
+    assert get_config_from_args(args)["backend"] == expected
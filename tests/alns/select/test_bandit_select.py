@@ -0,0 +1,96 @@
+import pytest
+
+import numpy as np
+from algorithms.alns.enum.alns_enum import Outcome
+from algorithms.alns.select.ucb_select import UCB1Select
+from algorithms.alns.select.thompson_select import ThompsonSelect
+from algorithms.alns.select.epsilon_greedy import EpsilonGreedySelect
+from algorithms.runner.alns.alns_commom import (
+    setup_alns,
+    get_config,
+    SELECT_STRATEGIES,
+)
+from algorithms.solution_state import SolutionState
+
+OUTCOME_REWARDS = [72, 0, 12, 0, 32, 0]
+SEED = 1234
+
+
+def play(select, good_repair, iterations):
+    """Only the good repair operator finds new best solutions, returns the repair choices"""
+    choices = []
+    for _ in range(iterations):
+        d_idx, r_idx = select.select()
+        choices.append(r_idx)
+        outcome = Outcome.BEST if r_idx == good_repair else Outcome.REJECTED
+        select.update(d_idx, r_idx, outcome)
+    return np.array(choices)
+
+
+def bandits(rng):
+    return [
+        UCB1Select(2, 4, OUTCOME_REWARDS, rng=rng),
+        ThompsonSelect(2, 4, OUTCOME_REWARDS, rng=rng),
+        EpsilonGreedySelect(2, 4, OUTCOME_REWARDS, rng=rng),
+    ]
+
+
+@pytest.mark.parametrize("bandit_idx", [0, 1, 2])
+def test_bandit_finds_the_best_operator(bandit_idx):
+    select = bandits(np.random.default_rng(SEED))[bandit_idx]
+    choices = play(select, 2, 400)
+
+    assert np.mean(choices[-100:] == 2) > 0.8
+    assert np.argmax(select.repair_op_weights) == 2
+
+
+@pytest.mark.parametrize("bandit_idx", [1, 2])
+def test_bandit_follows_a_change_of_the_best_operator(bandit_idx):
+    select = bandits(np.random.default_rng(SEED))[bandit_idx]
+    play(select, 2, 300)
+    choices = play(select, 0, 300)
+
+    assert np.mean(choices[-100:] == 0) > 0.8
+
+
+def test_ucb_plays_every_operator_first():
+    select = UCB1Select(3, 4, OUTCOME_REWARDS)
+    choices = play(select, 0, 4)
+    assert sorted(choices.tolist()) == [0, 1, 2, 3]
+
+
+def test_epsilon_greedy_window_holds_the_last_rewards():
+    select = EpsilonGreedySelect(1, 1, OUTCOME_REWARDS, window=3)
+    for outcome in [Outcome.BEST, Outcome.BEST, Outcome.REJECTED, Outcome.ACCEPTED]:
+        select.update(0, 0, outcome)
+
+    assert select.repair_op_weights[0] == pytest.approx((72 + 0 + 32) / 72 / 3)
+
+
+@pytest.mark.parametrize(
+    "rewards", [[0, 0, 0, 0, 0, 0], [1, 0, -1, 0, 0, 0], [1, 0, 1]]
+)
+def test_bandit_rewards_are_validated(rewards):
+    with pytest.raises(ValueError):
+        UCB1Select(1, 1, rewards)
+
+
+def test_reset_forgets_the_arms():
+    select = ThompsonSelect(2, 4, OUTCOME_REWARDS, rng=np.random.default_rng(SEED))
+    play(select, 2, 50)
+    select.reset(np.random.default_rng(SEED))
+    assert np.all(select.repair_op_weights == 0.5)
+
+
+@pytest.mark.parametrize("select", SELECT_STRATEGIES)
+def test_select_strategy_from_config(select):
+    config = get_config()
+    config["limit"] = 20
+    config["select"] = select
+    alns = setup_alns(config, np.random.default_rng(SEED))
+    solution = alns.execute(SolutionState("instances/cities_small_instances/york.txt", 2))
+    assert solution.is_feasible()
+
+    config["select"] = "unknown"
+    with pytest.raises(ValueError):
+        setup_alns(config)
@@ -0,0 +1,67 @@
+import pytest
+
+import numpy.random as random
+from algorithms.solution_state import SolutionState, Index
+from algorithms.alns.ALNS import ALNS
+from algorithms.runner.alns.alns_commom import setup_alns, get_config
+from tests.utils.state_info_assertions import assert_state_equal, init_state_k_only
+
+INSTANCE_PATH = "instances/cities_small_instances/york.txt"
+K = 2
+SEED = 1234
+
+
+def batched_config(batch_size, limit=20):
+    config = get_config()
+    config["limit"] = limit
+    config["batch_size"] = batch_size
+    return config
+
+
+def test_batch_size_must_be_positive():
+    alns = setup_alns(batched_config(1))
+    with pytest.raises(ValueError):
+        ALNS(alns.stop, alns.accept, alns.select, batch_size=0)
+    with pytest.raises(ValueError):
+        ALNS(alns.stop, alns.accept, alns.select, batch_size=2, workers=0)
+
+
+def test_batch_flags_reach_alns():
+    from algorithms.runner.alns.alns_exe import get_parser
+    from algorithms.runner.alns.alns_commom import get_config_from_args
+
+    parser = get_parser()
+    args = parser.parse_args(["-f", INSTANCE_PATH, "--batch_size", "4", "--workers", "2"])
+    alns = setup_alns(get_config_from_args(args))
+    assert (alns.batch_size, alns.workers) == (4, 2)
+
+    alns = setup_alns(get_config_from_args(parser.parse_args(["-f", INSTANCE_PATH])))
+    assert (alns.batch_size, alns.workers) == (1, None)
+
+
+@pytest.mark.parametrize("batch_size", [3])
+def test_batched_execute_is_reproducible(batch_size):
+    solutions = []
+    for _ in range(2):
+        alns = setup_alns(batched_config(batch_size), random.default_rng(SEED))
+        solutions.append(alns.execute(SolutionState(INSTANCE_PATH, K)))
+
+    # every slot draws from its own rng, the thread timing does not matter
+    assert solutions[0].S == solutions[1].S
+
+    solution = solutions[0]
+    assert len(solution.non_dominated) == 0
+    assert_state_equal(solution, init_state_k_only(solution), 0, SEED, [Index.K])
+
+
+@pytest.mark.parametrize("batch_size", [4])
+def test_every_neighbor_of_the_batch_updates_select(batch_size):
+    alns = setup_alns(batched_config(batch_size), random.default_rng(SEED))
+
+    updates = []
+    update = alns.select.update
+    alns.select.update = lambda *args: (updates.append(args), update(*args))
+
+    alns.execute(SolutionState(INSTANCE_PATH, K))
+
+    assert len(updates) == alns.stop.limit * batch_size
@@ -0,0 +1,138 @@
+import os
+import socket
+import stat
+import threading
+import time
+from concurrent.futures.process import BrokenProcessPool
+from multiprocessing import AuthenticationError
+from multiprocessing.connection import Client
+
+import pytest
+
+from algorithms.runner.alns.alns_server import (
+    AUTHKEY_ENV,
+    WorkerPool,
+    get_authkey,
+    serve,
+    request_solution,
+    shutdown,
+)
+
+INSTANCE = "instances/cities_small_instances/york.txt"
+PARAMS = ["--limit", "20"]
+
+
+def free_address():
+    with socket.socket() as sock:
+        sock.bind(("localhost", 0))
+        return ("localhost", sock.getsockname()[1])
+
+
+@pytest.fixture
+def server_address(tmp_path, monkeypatch):
+    # a fresh per-user key file for every server
+    monkeypatch.delenv(AUTHKEY_ENV, raising=False)
+    monkeypatch.setenv("HOME", str(tmp_path))
+    address = free_address()
+    server = threading.Thread(target=serve, args=(address, 2), daemon=True)
+    server.start()
+
+    # wait for the listener to be up
+    for _ in range(100):
+        try:
+            socket.create_connection(address).close()
+            break
+        except OSError:
+            time.sleep(0.05)
+
+    yield address
+
+    shutdown(address)
+    server.join(timeout=30)
+    assert not server.is_alive()
+
+
+def test_server_solves_seeded_requests(server_address):
+    first = request_solution(INSTANCE, 2, PARAMS, seed=7, address=server_address)
+    second = request_solution(INSTANCE, 2, PARAMS, seed=7, address=server_address)
+
+    assert first > 0
+    assert first == second
+
+
+def test_server_reports_bad_requests(server_address):
+    with pytest.raises(RuntimeError):
+        request_solution(INSTANCE, 2, ["--limit", "0"], seed=7, address=server_address)
+
+    # the server keeps answering after a failed evaluation
+    assert request_solution(INSTANCE, 2, PARAMS, seed=7, address=server_address) > 0
+    with pytest.raises(RuntimeError):
+        request_solution(INSTANCE, 2, ["--unknown"], seed=7, address=server_address)
+
+
+def test_key_file_is_private(server_address):
+    path = os.path.join(os.environ["HOME"], ".mkdsp_alns_authkey")
+    assert stat.S_IMODE(os.stat(path).st_mode) == 0o600
+    assert len(get_authkey()) == 64
+
+    os.chmod(path, 0o644)
+    with pytest.raises(PermissionError):
+        get_authkey()
+    # a running server with an unusable key is an error, not a missing server
+    with pytest.raises(PermissionError):
+        request_solution(INSTANCE, 2, PARAMS, seed=7, address=server_address)
+    os.chmod(path, 0o600)
+
+
+def test_no_server_is_refused_before_reading_the_key(tmp_path, monkeypatch):
+    monkeypatch.delenv(AUTHKEY_ENV, raising=False)
+    monkeypatch.setenv("HOME", str(tmp_path))
+    with pytest.raises(ConnectionRefusedError):
+        request_solution(INSTANCE, 2, PARAMS, seed=7, address=free_address())
+
+
+def test_pool_is_rebuilt_when_a_worker_dies():
+    pool = WorkerPool(1)
+    try:
+        with pytest.raises(BrokenProcessPool):
+            pool.submit(os._exit, 1).result(timeout=30)
+        assert pool.submit(pow, 2, 10).result(timeout=30) == 1024
+    finally:
+        pool.shutdown()
+
+
+def test_server_rejects_clients_without_the_key(server_address):
+    with pytest.raises(AuthenticationError):
+        Client(server_address, authkey=b"mkdsp_alns")
+
+    assert request_solution(INSTANCE, 2, PARAMS, seed=7, address=server_address) > 0
+
+
+def send_raw(address, payload):
+    with Client(address, authkey=get_authkey()) as connection:
+        connection.send(payload)
+        return connection.recv()
+
+
+@pytest.mark.parametrize(
+    "payload",
+    [
+        "not a dict",
+        {"k": 2},
+        {"instance": INSTANCE, "k": "two"},
+        {"instance": INSTANCE, "k": 2, "seed": "seven"},
+    ],
+)
+def test_server_answers_malformed_requests(server_address, payload):
+    assert "error" in send_raw(server_address, payload)
+    assert request_solution(INSTANCE, 2, PARAMS, seed=7, address=server_address) > 0
+
+
+def test_silent_clients_do_not_block_the_server(server_address):
+    # one client stuck before the handshake, one that never sends its request
+    raw = socket.create_connection(server_address)
+    silent = Client(server_address, authkey=get_authkey())
+
+    assert request_solution(INSTANCE, 2, PARAMS, seed=7, address=server_address) > 0
+    raw.close()
+    silent.close()
@@ -0,0 +1,17 @@
+import pytest
+
+from algorithms.runner.import_benchmark import (
+    measure_import,
+    ENTRY_POINT,
+    HEAVY_MODULES,
+)
+
+
+@pytest.mark.parametrize(
+    "module", [ENTRY_POINT, "algorithms.runner.alns.alns_server"]
+)
+def test_solve_path_does_not_import_reporting_modules(module):
+    _, imported = measure_import(module)
+
+    heavy = {name.split(".")[0] for name in imported} & set(HEAVY_MODULES)
+    assert not heavy, f"[FAIL] {module} imports {sorted(heavy)} at import time"
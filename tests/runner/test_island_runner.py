@@ -0,0 +1,97 @@
+from queue import Queue
+import pickle
+
+import numpy as np
+import numpy.random as random
+
+from algorithms.solution_state import SolutionState, Index
+from algorithms.runner.alns.alns_commom import setup_alns, get_config
+from algorithms.runner.island_runner import RingExchange, run_islands, best_island
+from algorithms.utils.bitset import BitSet
+from tests.utils.state_info_assertions import assert_state_equal, init_state_k_only
+
+INSTANCE_PATH = "instances/cities_small_instances/york.txt"
+K = 2
+SEED = 1234
+
+
+def short_config(limit):
+    config = get_config()
+    config["limit"] = limit
+    return config
+
+
+def assert_dominates_graph(graph, solution, K):
+    in_S = np.zeros(graph.n_nodes, dtype=np.bool_)
+    in_S[solution] = True
+    counts = np.bincount(graph.neighbors_of(solution), minlength=graph.n_nodes)
+    assert np.all(counts[~in_S] >= K), "[FAIL] Solution does not K-dominate the graph"
+
+
+def test_migrant_replaces_best_solution():
+    migrant = setup_alns(short_config(300), random.default_rng(SEED)).execute(
+        SolutionState(INSTANCE_PATH, K)
+    )
+    received = []
+
+    def exchange(best):
+        received.append(len(best))
+        return migrant.S.to_bitset() if len(received) == 1 else None
+
+    alns = setup_alns(short_config(30), random.default_rng(SEED + 1))
+    alns.set_migration(10, exchange)
+    solution = alns.execute(SolutionState(INSTANCE_PATH, K))
+
+    assert len(received) == 3
+    assert len(solution.S) <= len(migrant.S)
+    assert_dominates_graph(solution.graph, solution.S.to_array(), K)
+    assert_state_equal(solution, init_state_k_only(solution), 0, SEED, [Index.K])
+
+
+def test_ring_exchange_keeps_the_smallest_packed_solution():
+    inbox, outbox = Queue(), Queue()
+    graph = SolutionState(INSTANCE_PATH, K).graph
+    solutions = [BitSet.from_nodes(graph.n_nodes, range(size)) for size in (120, 80, 100)]
+    for solution in solutions:
+        inbox.put(solution)
+
+    best = BitSet.from_nodes(graph.n_nodes, range(90))
+    assert RingExchange(inbox, outbox)(best) == solutions[1]
+    assert outbox.get_nowait() == best
+    assert len(pickle.dumps(best)) < len(pickle.dumps(best.to_array()))
+
+
+def test_migrant_best_is_tracked():
+    migrant = setup_alns(short_config(300), random.default_rng(SEED)).execute(
+        SolutionState(INSTANCE_PATH, K)
+    )
+
+    alns = setup_alns(short_config(20), random.default_rng(SEED + 1))
+    alns.set_migration(10, lambda best: migrant.S.to_bitset())
+    solution = alns.execute(SolutionState(INSTANCE_PATH, K))
+
+    tracking = alns.stats.best_solution_tracking
+    assert "migration" in [operator_name for *_, operator_name in tracking]
+    assert alns.stats.get_last_time_to_best()[0] == solution.original_objective
+
+
+def test_islands_return_valid_solutions():
+    island_results = run_islands(
+        setup_alns,
+        short_config(40),
+        INSTANCE_PATH,
+        K,
+        islands=2,
+        migration_interval=10,
+        seed=SEED,
+    )
+
+    graph = SolutionState(INSTANCE_PATH, K).graph
+    assert [island_result.island for island_result in island_results] == [0, 1]
+    for island_result in island_results:
+        assert island_result.results["objective_value"] == len(island_result.solution)
+        assert_dominates_graph(graph, island_result.solution, K)
+
+    assert best_island(island_results).results["objective_value"] == min(
+        island_result.results["objective_value"] for island_result in island_results
+    )
@@ -0,0 +1,73 @@
+import pytest
+
+import os
+import shutil
+from algorithms.runner.alns.alns_commom import setup_alns, get_config
+from algorithms.runner.alns.run_experiments import run_alns_sweep
+from algorithms.runner.parallel_runner import (
+    create_jobs,
+    run_jobs,
+    best_run,
+    list_instances,
+)
+from algorithms.utils.graph_reader import read_graph, CACHE_FOLDER
+
+INSTANCES = ["instances/cities_small_instances/york.txt"]
+K_VALUES = [1, 2]
+RUNS = 2
+SEED = 1234
+
+
+def short_config():
+    config = get_config()
+    config["limit"] = 20
+    return config
+
+
+def test_jobs_get_distinct_reproducible_seeds():
+    jobs = create_jobs(setup_alns, short_config(), INSTANCES, K_VALUES, RUNS, SEED)
+    same_jobs = create_jobs(setup_alns, short_config(), INSTANCES, K_VALUES, RUNS, SEED)
+
+    assert len(jobs) == len(INSTANCES) * len(K_VALUES) * RUNS
+    states = [tuple(job.seed.generate_state(4)) for job in jobs]
+    assert len(set(states)) == len(jobs)
+    assert states == [tuple(job.seed.generate_state(4)) for job in same_jobs]
+
+
+@pytest.mark.parametrize("workers", [2])
+def test_process_pool_matches_serial_runs(workers):
+    jobs = create_jobs(setup_alns, short_config(), INSTANCES, K_VALUES, RUNS, SEED)
+
+    serial = run_jobs(jobs, workers=1)
+    parallel = run_jobs(jobs, workers=workers)
+
+    assert serial.keys() == parallel.keys() == {(INSTANCES[0], k) for k in K_VALUES}
+    for key, run_results in serial.items():
+        assert [run_result.run for run_result in parallel[key]] == list(range(RUNS))
+        assert [r.results["objective_value"] for r in run_results] == [
+            r.results["objective_value"] for r in parallel[key]
+        ]
+        assert best_run(run_results).results["objective_value"] == min(
+            r.results["objective_value"] for r in run_results
+        )
+
+
+def test_sweep_skips_the_graph_cache(tmp_path, monkeypatch):
+    folder = tmp_path / "instances"
+    folder.mkdir()
+    instance = str(folder / "york.txt")
+    shutil.copy(INSTANCES[0], instance)
+    (folder / "notes.md").write_text("not an instance")
+    read_graph(instance)
+    assert os.path.isdir(folder / CACHE_FOLDER)
+
+    instances = list_instances(str(folder))
+    assert instances == [instance]
+    results = run_jobs(create_jobs(setup_alns, short_config(), instances, [1], 1, SEED), 1)
+    assert list(results) == [(instance, 1)]
+
+    # the metrics are written relative to the working directory, in the logger's layout
+    pytest.importorskip("openpyxl")
+    monkeypatch.chdir(tmp_path)
+    (tmp_path / "algorithms\\runner\\alns\\metrics").mkdir()
+    run_alns_sweep(short_config(), [1], str(folder), runs=1, workers=1, seed=SEED)
@@ -0,0 +1,58 @@
+import pytest
+
+import numpy as np
+import numpy.random as random
+from algorithms.solution_state import NodeSet
+from algorithms.utils.bitset import BitSet
+
+
+def random_mask(rng, n_nodes, density):
+    return rng.random(n_nodes) < density
+
+
+@pytest.mark.parametrize("n_nodes", [1, 63, 64, 65, 1044])
+@pytest.mark.parametrize("density", [0.0, 0.05, 0.5])
+def test_bitset_round_trip(n_nodes, density):
+    mask = random_mask(random.default_rng(n_nodes), n_nodes, density)
+    bitset = BitSet.from_mask(mask)
+
+    assert bitset.nbytes == 8 * -(-n_nodes // 64)
+    assert np.array_equal(bitset.to_mask(), mask)
+    assert bitset.to_array().tolist() == np.flatnonzero(mask).tolist() == list(bitset)
+    assert len(bitset) == np.count_nonzero(mask)
+    assert all((node in bitset) == mask[node] for node in range(n_nodes))
+    assert BitSet.from_nodes(n_nodes, np.flatnonzero(mask)) == bitset
+
+
+@pytest.mark.parametrize("n_nodes", [130, 1044])
+def test_bitset_algebra_matches_python_sets(n_nodes):
+    rng = random.default_rng(1234)
+    a, b = random_mask(rng, n_nodes, 0.3), random_mask(rng, n_nodes, 0.3)
+    A, B = set(np.flatnonzero(a).tolist()), set(np.flatnonzero(b).tolist())
+    bits_a, bits_b = BitSet.from_mask(a), BitSet.from_mask(b)
+
+    assert set(bits_a | bits_b) == A | B
+    assert set(bits_a & bits_b) == A & B
+    assert set(bits_a - bits_b) == A - B
+    assert set(bits_a ^ bits_b) == A ^ B
+    assert bits_a.isdisjoint(bits_a - bits_b - bits_a) and not bits_a.isdisjoint(bits_a)
+    assert hash(bits_a) == hash(bits_a.copy()) and bits_a.copy() == bits_a
+
+    with pytest.raises(ValueError):
+        bits_a | BitSet(n_nodes + 1)
+
+
+def test_node_set_algebra_stays_vectorized():
+    rng = random.default_rng(1234)
+    a = NodeSet.from_mask(random_mask(rng, 500, 0.3))
+    b = NodeSet.from_mask(random_mask(rng, 500, 0.3))
+    A, B = set(a), set(b)
+
+    pairs = [(a | b, A | B), (a & b, A & B), (a - b, A - B), (a ^ b, A ^ B)]
+    for result, expected in pairs:
+        assert isinstance(result, NodeSet)
+        assert result == expected and len(result) == len(expected)
+    assert (a - {0, 1}) == A - {0, 1}
+    assert (a - b).isdisjoint(b)
+
+    assert NodeSet.from_bitset(a.to_bitset()) == a
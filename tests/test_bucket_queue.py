@@ -0,0 +1,75 @@
+import pytest
+import numpy as np
+import numpy.random as random
+from algorithms.utils.bucket_queue import BucketQueue, GroupedBucketQueue
+
+
+def build_queue():
+    nodes = np.array([0, 2, 3, 5, 6])
+    keys = np.array([4, 1, 4, 0, 2])
+    return BucketQueue.from_nodes(8, nodes, keys)
+
+
+def test_from_nodes_buckets_by_key():
+    queue = build_queue()
+
+    assert len(queue) == 5
+    assert queue.max_key() == 4
+    assert queue.min_key() == 0
+    assert 1 not in queue and 3 in queue
+    assert sorted(queue.nodes_at_least(2)) == [0, 3, 6]
+    assert queue.count_at_least(1.5) == 3
+
+
+def test_remove_and_update_move_pointers():
+    queue = build_queue()
+
+    queue.remove(0)
+    queue.remove(3)
+    assert queue.max_key() == 2
+    assert 0 not in queue
+
+    queue.update_many(np.array([5, 6, 1]), np.array([3, 2, 7]))
+    assert queue.key(5) == 3
+    assert queue.key(6) == 2
+    assert 1 not in queue
+    assert queue.max_key() == 3
+    assert queue.min_key() == 1
+
+
+def test_negative_keys_are_clamped_to_zero():
+    queue = build_queue()
+    queue.update(2, -3)
+
+    assert queue.key(2) == 0
+    assert queue.min_key() == 0
+
+
+@pytest.mark.parametrize("threshold", [0, 1.2, 4])
+def test_choice_at_least_only_draws_from_rcl(threshold):
+    queue = build_queue()
+    rng = random.default_rng(1234)
+    expected = set(queue.nodes_at_least(threshold))
+
+    drawn = {queue.choice_at_least(threshold, rng) for _ in range(200)}
+
+    assert drawn == expected
+
+
+def test_grouped_queue_moves_nodes_between_groups():
+    nodes = np.array([1, 2, 3, 4])
+    groups = np.array([2, 2, 1, 1])
+    keys = np.array([5, 3, 4, 4])
+    queue = GroupedBucketQueue.from_nodes(6, nodes, groups, keys)
+
+    queue.remove(1)
+    queue.update_many(np.array([2, 3, 0]), np.array([1, 1, 2]), np.array([2, 6, 1]))
+
+    assert len(queue) == 3
+    assert 0 not in queue and 1 not in queue
+    assert [group for group, _ in queue.groups()] == [1]
+
+    group_queue = dict(queue.groups())[1]
+    assert group_queue.max_key() == 6
+    assert sorted(group_queue.bucket(4)) == [4]
+    assert group_queue.bucket(2) == [2]
@@ -0,0 +1,90 @@
+import pytest
+import os
+import networkx as nx
+import numpy as np
+from algorithms.utils.graph_reader import read_graph, CACHE_FOLDER
+
+
+def write_instance(path, edges, n_nodes):
+    with open(path, "w") as file:
+        file.write(f"{n_nodes} {len(edges)}\n")
+        for u, v in edges:
+            file.write(f"{u} {v}\n")
+
+
+def test_cached_graph_matches_parsed_graph(tmp_path):
+    instance = os.path.join(tmp_path, "city.txt")
+    write_instance(instance, [(0, 1), (1, 2), (2, 3), (3, 0), (0, 2)], 5)
+
+    parsed = read_graph(instance, use_cache=False)
+    assert not os.path.exists(os.path.join(tmp_path, CACHE_FOLDER))
+
+    read_graph(instance)  # first read writes the cache
+    cached = read_graph(instance)
+
+    assert len(os.listdir(os.path.join(tmp_path, CACHE_FOLDER))) == 1
+    assert not cached.indices.flags.writeable, "cached graph should be memory mapped"
+    assert np.array_equal(parsed.indptr, cached.indptr)
+    assert np.array_equal(parsed.indices, cached.indices)
+    assert cached.n_nodes == 5 and cached.n_edges == 5
+
+
+def test_cache_is_invalidated_when_instance_changes(tmp_path):
+    instance = os.path.join(tmp_path, "city.txt")
+    write_instance(instance, [(0, 1), (1, 2)], 3)
+    read_graph(instance)
+
+    write_instance(instance, [(0, 1), (1, 2), (2, 3), (3, 4)], 5)
+    graph = read_graph(instance)
+
+    assert graph.n_nodes == 5 and graph.n_edges == 4
+    assert len(os.listdir(os.path.join(tmp_path, CACHE_FOLDER))) == 1
+    assert read_graph(instance).n_edges == 4
+
+
+def test_two_hop_index_matches_distances():
+    graph = read_graph("instances/cities_small_instances/york.txt", use_cache=False)
+    nx_graph = graph.to_networkx()
+    two_hop = graph.build_two_hop(max_pairs=1000)  # several chunks
+
+    for node in range(0, graph.n_nodes, 11):
+        distances = nx.single_source_shortest_path_length(nx_graph, node, cutoff=2)
+        del distances[node]
+        assert two_hop.neighbors(node).tolist() == sorted(distances)
+
+
+def test_two_hop_index_is_cached_on_first_use(tmp_path):
+    instance = os.path.join(tmp_path, "city.txt")
+    write_instance(instance, [(0, 1), (1, 2), (2, 3), (3, 0), (3, 4)], 5)
+    cache_folder = os.path.join(tmp_path, CACHE_FOLDER)
+
+    graph = read_graph(instance)
+    assert len(os.listdir(cache_folder)) == 1
+    assert graph.two_hop() is graph.two_hop()
+    assert len(os.listdir(cache_folder)) == 2
+
+    cached = read_graph(instance).two_hop()
+    assert not cached.indices.flags.writeable, "cached index should be memory mapped"
+    assert cached.neighbors(4).tolist() == [0, 2, 3]
+    assert np.array_equal(cached.indices, graph.two_hop().indices)
+
+
+def test_one_indexed_instances_grow_the_graph(tmp_path):
+    instance = os.path.join(tmp_path, "dimacs.graph")
+    with open(instance, "w") as file:
+        file.write("c 1-indexed\np edge 3 3\ne 1 2\ne 2 3\ne 3 1\n")
+
+    g = read_graph(instance, use_cache=False)
+
+    # as networkx read it, ids 1..3 plus the isolated node 0
+    assert g.n_nodes == 4 and g.n_edges == 3
+    assert g.neighbors(0).tolist() == []
+    assert sorted(g.neighbors(3).tolist()) == [1, 2]
+
+
+def test_negative_node_ids_are_rejected(tmp_path):
+    instance = os.path.join(tmp_path, "broken.txt")
+    write_instance(instance, [(0, 1), (-1, 2)], 3)
+
+    with pytest.raises(ValueError, match="broken.txt"):
+        read_graph(instance, use_cache=False)
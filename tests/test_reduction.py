@@ -0,0 +1,96 @@
+import itertools
+import pytest
+
+import numpy as np
+import numpy.random as random
+from algorithms.solution_state import SolutionState
+from algorithms.utils.csr_graph import CSRGraph
+from algorithms.utils.reduction import reduce_graph
+from algorithms.alns.operators.repair_operators import GreedyDegreeOperator
+from algorithms.runner.alns.alns_commom import setup_alns, get_config
+from tests.utils.valid_solution_assertions import assert_valid_state
+
+
+def is_k_dominating(graph: CSRGraph, demand: np.ndarray, solution) -> bool:
+    in_S = np.zeros(graph.n_nodes, dtype=np.bool_)
+    in_S[list(solution)] = True
+    counts = np.bincount(
+        graph.neighbors_of(np.flatnonzero(in_S)), minlength=graph.n_nodes
+    )
+    return bool(np.all(counts[~in_S] >= demand[~in_S]))
+
+
+def minimum_k_dominating_size(graph: CSRGraph, demand: np.ndarray) -> int:
+    for size in range(graph.n_nodes + 1):
+        for solution in itertools.combinations(range(graph.n_nodes), size):
+            if is_k_dominating(graph, demand, solution):
+                return size
+
+
+def test_low_degree_nodes_are_forced():
+    # star of 4 leaves plus an edge between two leaves, leaves of degree 1 are forced for K = 2
+    graph = CSRGraph.from_edges(5, np.array([[0, 1], [0, 2], [0, 3], [0, 4], [3, 4]]))
+    reduction = reduce_graph(graph, K=2)
+
+    assert reduction.forced.tolist() == [1, 2]
+    # the center keeps 2 candidate neighbors and needs no more dominators
+    assert reduction.original_nodes.tolist() == [0, 3, 4]
+    assert reduction.demand.tolist() == [0, 2, 2]
+    assert reduction.lift(np.array([1, 2])).tolist() == [1, 2, 3, 4]
+
+
+def test_twins_and_dominated_neighborhoods_are_flagged():
+    # two triangles sharing node 2: 0, 1 and 3, 4 are twins, every N[v] is in N[2]
+    graph = CSRGraph.from_edges(
+        5, np.array([[0, 1], [0, 2], [1, 2], [2, 3], [2, 4], [3, 4]])
+    )
+    reduction = reduce_graph(graph, K=1)
+
+    assert reduction.kernel.n_nodes == 5 and len(reduction.forced) == 0
+    assert reduction.twin_class.tolist() == [0, 0, 2, 3, 3]
+    assert reduction.dominated_neighborhood.tolist() == [True, True, False, True, True]
+    assert reduction.n_twins == 2
+
+
+@pytest.mark.parametrize("K", [1, 2, 3])
+@pytest.mark.parametrize("seed", range(8))
+def test_reduction_keeps_the_optimum(K, seed):
+    rng = random.default_rng(seed)
+    n_nodes = 10
+    edges = np.array(
+        [edge for edge in itertools.combinations(range(n_nodes), 2) if rng.random() < 0.3]
+    )
+    graph = CSRGraph.from_edges(n_nodes, edges)
+    reduction = reduce_graph(graph, K)
+
+    optimum = minimum_k_dominating_size(graph, np.full(n_nodes, K))
+    kernel_optimum = minimum_k_dominating_size(reduction.kernel, reduction.demand)
+    assert len(reduction.forced) + kernel_optimum == optimum
+
+
+@pytest.mark.parametrize("K", [2, 4])
+def test_preprocessed_state_maps_back_to_the_instance(K):
+    INSTANCE_PATH = "instances/cities_small_instances/bath.txt"
+    S = SolutionState(INSTANCE_PATH, K, preprocess=True)
+    original = SolutionState(INSTANCE_PATH, K)
+    assert S.n_nodes == S.reduction.kernel.n_nodes < original.n_nodes
+
+    operator = GreedyDegreeOperator(0.3, random.default_rng(1234))
+    operator.init_state_info(S)
+    S = operator.operate(S)
+    assert_valid_state(S)
+
+    solution = S.original_solution()
+    assert len(solution) == len(S.S) + len(S.reduction.forced) == S.original_objective
+    assert is_k_dominating(original.graph, original.demand, solution)
+
+
+def test_best_tracking_reports_the_original_objective():
+    config = get_config()
+    config["limit"] = 50
+    alns = setup_alns(config, random.default_rng(1234))
+    S = alns.execute(SolutionState("instances/cities_small_instances/bath.txt", 2, True))
+
+    assert len(S.reduction.forced) > 0
+    assert alns.stats.get_last_time_to_best()[0] == S.original_objective
+    assert S.original_objective == len(S.original_solution())
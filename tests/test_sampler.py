@@ -0,0 +1,146 @@
+import pytest
+
+import numpy as np
+import numpy.random as random
+from algorithms.solution_state import SolutionState
+from algorithms.alns.select.roulette_wheel import RouletteWheelSelect
+from algorithms.runner.alns.alns_commom import setup_alns, get_config
+from algorithms.utils.sampler import (
+    AliasTable,
+    RngStream,
+    UniformBuffer,
+    pick,
+)
+from algorithms.utils.backend import PYTHON, NUMBA, NUMBA_AVAILABLE
+from tests.utils.valid_solution_assertions import assert_valid_state
+
+INSTANCE_PATH = "instances/cities_small_instances/york.txt"
+SEED = 1234
+DRAWS = 40000
+
+
+@pytest.mark.parametrize("size", [1, 3, 1024])
+def test_buffer_hands_out_the_rng_stream(size):
+    buffer = UniformBuffer(random.default_rng(SEED), size)
+    expected = random.default_rng(SEED).random(10)
+
+    assert [buffer.random() for _ in range(10)] == expected.tolist()
+    assert all(0 <= buffer.integer(7) < 7 for _ in range(100))
+
+
+@pytest.mark.parametrize(
+    "weights",
+    [[1.0, 1.0, 1.0], [2.0, 3.0, 5.0], [0.0, 1.0, 2.0, 1.0], [0.01, 10.0], [4.0]],
+)
+def test_alias_table_follows_the_weights(weights):
+    table = AliasTable(np.array(weights))
+    rng = random.default_rng(SEED)
+
+    counts = np.bincount(
+        [table.sample(u) for u in rng.random(DRAWS).tolist()], minlength=len(weights)
+    )
+
+    expected = np.array(weights) / np.sum(weights)
+    assert np.all(counts[expected == 0] == 0)
+    assert np.allclose(counts / DRAWS, expected, atol=0.01)
+
+
+def test_alias_table_with_equal_weights_is_the_cdf_pick():
+    table = AliasTable(np.ones(4))
+    cdf = np.cumsum(np.full(4, 0.25))
+    for u in random.default_rng(SEED).random(1000).tolist():
+        assert table.sample(u) == np.searchsorted(cdf, u, side="right")
+
+
+@pytest.mark.parametrize("weights", [[], [0.0, 0.0], [1.0, -1.0, 2.0]])
+def test_alias_table_rejects_invalid_weights(weights):
+    with pytest.raises(ValueError):
+        AliasTable(np.array(weights))
+
+
+def test_pick_is_the_choice_draw():
+    items = np.arange(5, 105)
+    rng, expected_rng = random.default_rng(SEED), random.default_rng(SEED)
+    for _ in range(100):
+        assert pick(rng, items) == expected_rng.choice(items)
+
+
+def test_roulette_rebuilds_the_table_when_weights_change():
+    rws = RouletteWheelSelect(3, 2, 10**9, 0.5, [0] * 6, random.default_rng(SEED))
+    rws._destroy_op_weights = np.array([1.0, 0.0, 0.0])
+    assert all(rws.select()[0] == 0 for _ in range(100))
+
+    rws._destroy_op_weights[:] = [0.0, 0.0, 1.0]
+    assert all(rws.select()[0] == 2 for _ in range(100))
+
+
+def test_stream_serves_scalars_and_delegates_the_rest():
+    stream = RngStream(random.default_rng(SEED), 4)
+    uniforms = random.default_rng(SEED).random(4).tolist()
+
+    assert stream.random() == uniforms[0]
+    assert stream.uniform(2, 4) == 2 + 2 * uniforms[1]
+    assert stream.integers(10) == int(10 * uniforms[2])
+    assert stream.integers(5, 15) == 5 + int(10 * uniforms[3])
+    assert stream.integers(0, 3, size=20).shape == (20,)
+    assert sorted(stream.permutation(6).tolist()) == list(range(6))
+    assert len(stream.choice(np.arange(10), 4, replace=False)) == 4
+    with pytest.raises(AttributeError):
+        stream._missing
+
+
+@pytest.mark.parametrize("count", [0, 3, 10])
+def test_peeked_uniforms_are_the_next_draws(count):
+    stream = RngStream(random.default_rng(SEED), 4)
+    expected = random.default_rng(SEED).random(20).tolist()
+
+    assert stream.random() == expected[0]
+    assert stream.peek(count).tolist() == expected[1 : 1 + count]
+    stream.advance(2)
+    assert [stream.random() for _ in range(5)] == expected[3:8]
+
+
+def test_advance_leaves_the_generator_where_random_calls_do():
+    peeked, drawn = (RngStream(random.default_rng(SEED), 4) for _ in range(2))
+    peeked.random(), drawn.random()
+
+    # reading past the buffer moves the Generator until the advance
+    peeked.peek(10)
+    peeked.advance(6)
+    [drawn.random() for _ in range(6)]
+
+    assert peeked.random() == drawn.random()
+    assert peeked.permutation(20).tolist() == drawn.permutation(20).tolist()
+
+
+def test_stream_draws_are_uniform():
+    stream = RngStream(random.default_rng(SEED))
+    counts = np.bincount([stream.integers(7) for _ in range(DRAWS)], minlength=7)
+    assert np.allclose(counts / DRAWS, 1 / 7, atol=0.01)
+    assert all(isinstance(child, RngStream) for child in stream.spawn(3))
+
+
+def test_alns_runs_are_reproducible_with_the_stream():
+    config = get_config()
+    config["limit"] = 100
+    values = []
+    for _ in range(2):
+        alns = setup_alns(config, random.default_rng(SEED))
+        assert isinstance(alns.rng, RngStream)
+        solution = alns.execute(SolutionState(INSTANCE_PATH, 2))
+        assert_valid_state(solution)
+        values.append(sorted(solution.S))
+    assert values[0] == values[1]
+
+
+@pytest.mark.skipif(not NUMBA_AVAILABLE, reason="numba is not installed")
+def test_backends_match_with_the_stream():
+    solutions = {}
+    for backend in (PYTHON, NUMBA):
+        config = get_config()
+        config["limit"] = 200
+        config["backend"] = backend
+        alns = setup_alns(config, random.default_rng(7))
+        assert isinstance(alns.rng, RngStream)
+        solutions[backend] = sorted(alns.execute(SolutionState(INSTANCE_PATH, 2)).S)
+    assert solutions[PYTHON] == solutions[NUMBA]
@@ -3,6 +3,7 @@ import numpy.random as random
 from algorithms.solution_state import SolutionState, Index
 from algorithms.alns.operators.repair_operators.random_repair import RandomRepair
 from algorithms.alns.operators.destroy_operators.random_destroy import RandomDestroy
+from algorithms.heuristics.domination import state_violations
 
 
 def are_solution_states_equal(sol1: SolutionState, sol2: SolutionState) -> bool:
@@ -100,3 +101,67 @@ def test_solution_copy_after_change():
     ), "Initial_S should be different from new_S"
 
     print("All assertions passed successfully.")
+
+
+def test_solution_copy_from_reuses_buffers():
+    K = 2
+    INSTANCE_PATH = "instances/cities_small_instances/york.txt"
+    DESTROY_FACTOR = 0.5
+    SEED = 1234
+
+    S = SolutionState(INSTANCE_PATH, K)
+    rng = random.default_rng(SEED)
+
+    random_repair_op = RandomRepair(rng)
+    random_destroy_op = RandomDestroy(DESTROY_FACTOR, rng)
+
+    random_repair_op.init_state_info(S)
+    initial_S = random_repair_op.operate(S)
+    work_S = random_repair_op.operate(random_destroy_op.operate(initial_S.copy()))
+    K_column, S_mask = work_S.G_info.column(Index.K), work_S.S.mask
+
+    # Overwriting a used state must give back the source values in the same buffers
+    work_S.copy_from(initial_S)
+    assert are_solution_states_equal(
+        initial_S, work_S
+    ), "work_S should be equal in values to initial_S"
+    assert are_copied_objects_address_different(
+        initial_S, work_S
+    ), "work_S should keep its own memory space"
+    assert work_S.G_info.column(Index.K) is K_column and work_S.S.mask is S_mask
+
+    # Changing the overwritten state must not leak into the source
+    random_destroy_op.operate(work_S)
+    assert are_solution_states_different(
+        initial_S, work_S
+    ), "Destroying work_S should not change initial_S"
+
+
+def test_state_invariants_hold_through_operators():
+    K = 2
+    INSTANCE_PATH = "instances/cities_small_instances/york.txt"
+    SEED = 1234
+
+    S = SolutionState(INSTANCE_PATH, K)
+    rng = random.default_rng(SEED)
+
+    random_repair_op = RandomRepair(rng)
+    random_destroy_op = RandomDestroy(0.5, rng)
+
+    random_repair_op.init_state_info(S)
+    assert state_violations(S) == []
+    S = random_repair_op.operate(S)
+    assert S.is_feasible() and state_violations(S) == []
+
+    S = random_destroy_op.operate(S)
+    assert not S.is_feasible() and state_violations(S) == []
+    assert S.objective == len(S.S)
+
+    # a K entry out of sync with the solution and a set out of sync with its mask are caught
+    node = int(S.non_dominated.to_array()[0])
+    S.G_info.column(Index.K)[node] -= 1
+    S.dominated.mask[node] = True
+    violations = state_violations(S)
+    assert any("K info" in violation for violation in violations)
+    assert any("dominated size" in violation for violation in violations)
+    assert any("both dominated" in violation for violation in violations)
@@ -1,4 +1,5 @@
 from algorithms.solution_state import SolutionState, Index
+from algorithms.heuristics.domination import state_violations
 
 
 def validate_operator_solution_dominates_graph(
@@ -9,8 +10,8 @@ def validate_operator_solution_dominates_graph(
     op.init_state_info(S)
     S = op.operate(S)
 
-    assert len(S.non_dominated) == 0
-    __assert_dominated_solution(S)
+    assert S.is_feasible(), f"[FAIL] Non-dominated set is not empty: {S.non_dominated}"
+    assert_valid_state(S)
 
 
 def validate_operator_generate_valid_solution(
@@ -21,33 +22,54 @@ def validate_operator_generate_valid_solution(
     operator.init_state_info(S)
     S = operator.operate(S)
 
-    # Only nodes in the solution can have K > 0
-    for node in S.G.nodes():
-        k_val = S.G_info[node][Index.K]
-        if node not in S.S:
-            assert (
-                k_val <= 0
-            ), f"[FAIL] Node {node} is not in the solution set but has G_info[K] = {k_val}, expected ≤ 0"
-
-    # Dominated set + Solution set must cover all nodes
-    total_nodes = len(S.G.nodes())
-    covered_nodes = len(S.dominated) + len(S.S)
-    assert covered_nodes == total_nodes, (
-        f"[FAIL] Dominated ({len(S.dominated)}) + Solution ({len(S.S)}) = {covered_nodes}, "
-        f"but expected {total_nodes} (total nodes)"
+    # K info rebuilt from the graph, sets partitioning the nodes, nothing left non dominated
+    assert_valid_state(S)
+    assert len(S.dominated) + len(S.S) == S.n_nodes, (
+        f"[FAIL] Dominated ({len(S.dominated)}) + Solution ({len(S.S)}) "
+        f"but expected {S.n_nodes} (total nodes)"
     )
+    assert S.is_feasible(), f"[FAIL] Non-dominated set is not empty: {S.non_dominated}"
 
-    # Non-dominated set must be empty
-    assert (
-        not S.non_dominated
-    ), f"[FAIL] Non-dominated set is not empty: {S.non_dominated}"
 
+def assert_valid_state(solution: SolutionState):
+    violations = state_violations(solution)
+    assert not violations, "[FAIL] " + "; ".join(violations)
 
-def __assert_dominated_solution(solution: SolutionState):
-    for v in solution.G.nodes():
-        if v in solution.S:
-            continue
-        count = sum(1 for u in solution.G[v] if u in solution.S)
-        assert (
-            count >= solution.K
-        ), f"[FAIL] Node {v} has only {count} neighbors in solution (expected at least {solution.K})"
+
+def validate_bucket_rcl_matches_scan(
+    operator_class, calc_weight, calc_weights, instance_path, K, greedy_alpha
+):
+    import numpy as np
+    import numpy.random as random
+    from algorithms.alns.operators.destroy_operators.random_destroy import (
+        RandomDestroy,
+    )
+    from algorithms.heuristics.weighted_rcl import _choose_from_rcl
+    from algorithms.utils.bucket_queue import GroupedBucketQueue
+
+    rng = random.default_rng(1234)
+    S = SolutionState(instance_path, K)
+    operator = operator_class(greedy_alpha, rng)
+    operator.init_state_info(S)
+    S = operator._update_state_info(RandomDestroy(0.3, rng).operate(operator.operate(S)))
+
+    K_info = S.G_info.column(Index.K)
+    degree = S.G_info.column(Index.DEGREE)
+    candidates = S.non_dominated.to_array()
+
+    # RCL as the scan builds it
+    weights = calc_weights(K_info[candidates], degree[candidates], len(candidates))
+    threshold = weights.max() - greedy_alpha * (weights.max() - weights.min())
+    expected_RCL = set(candidates[weights >= threshold].tolist())
+
+    queue = GroupedBucketQueue.from_nodes(
+        S.n_nodes, candidates, K_info[candidates], degree[candidates]
+    )
+    drawn = set()
+    for _ in range(20 * len(expected_RCL)):
+        v, weight = _choose_from_rcl(queue, greedy_alpha, rng, calc_weight)
+        assert v in expected_RCL, f"[FAIL] Node {v} drawn outside the RCL"
+        assert np.isclose(weight, calc_weight(int(K_info[v]), int(degree[v]), len(candidates)))
+        drawn.add(v)
+
+    assert drawn == expected_RCL